@@ -0,0 +1,156 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import logging
+import os
+import pickle
+import tempfile
+import time
+from typing import Any
+
+from amazonorders import workers
+from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.exception import AmazonOrdersError
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """
+    A crash-safe record of a long crawl's progress, so that if the crawl fails (or the process dies) part way through,
+    calling the same method again with the same checkpoint path resumes where it left off rather than starting over.
+
+    The checkpoint file is a log. It is created atomically, and each save appends only what was recorded since the
+    last save, along with the current (small) ``state``, so the cost of a save doesn't grow with the length of the
+    crawl. A save that was cut short (ex. because the process died while writing it) is ignored when the checkpoint
+    is loaded. The checkpoint is deleted once the crawl completes successfully.
+
+    Checkpoints are pickled, so only resume from checkpoint files written by this library. The ``config`` of the
+    recorded entities (and so the credentials in it) is left out of the file, and the given ``config`` is reattached
+    to them when the checkpoint is resumed.
+    """
+
+    #: The minimum number of seconds between saves while a crawl is making progress. A checkpoint is always saved
+    #: when a crawl stops early.
+    SAVE_INTERVAL = 1.0
+
+    def __init__(self, path: str, key: dict[str, Any], config: AmazonOrdersConfig) -> None:
+        #: The path of the checkpoint file.
+        self.path: str = path
+        #: The config of the recorded entities.
+        self.config: AmazonOrdersConfig = config
+        #: The parameters of the crawl, which must match those of an existing checkpoint for it to be resumed.
+        self.key: dict[str, Any] = key
+        #: The crawl's progress, the contents of which are up to the crawl. This is written in full on each save, so
+        #: it should stay small, with the crawl's results passed to :func:`record` instead.
+        self.state: dict[str, Any] = {}
+        #: The values passed to :func:`record` by previous runs of the crawl, by ``name`` and then ``key``. Values
+        #: recorded by this run are written to the checkpoint file, but not kept here.
+        self.records: dict[str, dict[Any, Any]] = {}
+        #: ``True`` if progress was loaded from an existing checkpoint file.
+        self.resumed: bool = False
+
+        self._pending_records: list[tuple[str, Any, Any]] = []
+        # The size of the checkpoint file's complete saves, or None if the file hasn't been written yet
+        self._log_size: int | None = None
+        self._last_saved: float = 0
+
+        if os.path.exists(self.path):
+            self._load()
+
+    def _load(self) -> None:
+        with open(self.path, "rb") as f:
+            try:
+                data = pickle.load(f)
+            except (EOFError, pickle.UnpicklingError):
+                data = {}
+
+            if data.get("key") != self.key:
+                raise AmazonOrdersError(
+                    f"The checkpoint {self.path} is for a different crawl ({data.get('key')}). Delete it, or pass a "
+                    f"different path, to start over."
+                )
+
+            logger.debug(f"Resuming from checkpoint {self.path} ...")
+            while True:
+                self._log_size = f.tell()
+                try:
+                    records, state = workers.load(f, self.config)
+                except EOFError:
+                    break
+                except Exception:
+                    logger.debug(f"Ignoring the last save to {self.path}, which was cut short")
+                    break
+
+                for name, key, value in records:
+                    self.records.setdefault(name, {})[key] = value
+                self.state = state
+
+            self.resumed = True
+
+    def record(self, name: str, key: Any, value: Any) -> None:
+        """
+        Record a result of the crawl (ex. a built Order) to be written with the next save, after which it is no longer
+        held in memory. When resumed, it's found in :attr:`records`.
+
+        :param name: The kind of result.
+        :param key: The key of the result, which replaces a result with the same ``name`` and ``key``.
+        :param value: The result.
+        """
+        self._pending_records.append((name, key, value))
+
+    def save(self, force: bool = True) -> None:
+        """
+        Persist what was recorded since the last save, and the current state, to the checkpoint file.
+
+        :param force: ``False`` if the save should be skipped when the last save was less than
+            :attr:`SAVE_INTERVAL` seconds ago.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_saved < self.SAVE_INTERVAL:
+            return
+
+        entry = workers.dumps((self._pending_records, self.state), self.config)
+
+        if self._log_size is None:
+            self._create(entry)
+        else:
+            with open(self.path, "r+b") as f:
+                # Anything after the last complete save was cut short, so it's overwritten
+                f.truncate(self._log_size)
+                f.seek(self._log_size)
+                f.write(entry)
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_size += len(entry)
+
+        self._pending_records = []
+        self._last_saved = now
+
+    def _create(self, entry: bytes) -> None:
+        checkpoint_dir = os.path.dirname(os.path.abspath(self.path))
+        if not os.path.exists(checkpoint_dir):
+            os.makedirs(checkpoint_dir)
+
+        header = pickle.dumps({"key": self.key}, protocol=pickle.HIGHEST_PROTOCOL)
+        fd, temp_path = tempfile.mkstemp(dir=checkpoint_dir, prefix=".checkpoint-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(entry)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        self._log_size = len(header) + len(entry)
+
+    def delete(self) -> None:
+        """
+        Delete the checkpoint file, if it exists.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._log_size = None
@@ -50,7 +50,8 @@ class IOClick(IODefault):
     help="The max auth loop attempts to make (successes and failures), passing this overrides config value.",
 )
 @click.option(
-    "--output-dir", help="The directory where any output files should be produced, passing this overrides config value."
+    "--output-dir",
+    help="The directory where any output files should be produced, passing this overrides config value.",
 )
 @click.pass_context
 def amazon_orders_cli(ctx: Context, **kwargs: Any) -> None:
@@ -99,6 +100,12 @@ def amazon_orders_cli(ctx: Context, **kwargs: Any) -> None:
     default=datetime.date.today().year,
     help="The year for which to get Order history, defaults to the current year.",
 )
+@click.option(
+    "--years",
+    help="A range of years (ex. 2012-2025) for which to get Order history, which are fetched concurrently. "
+    "Passing this overrides --year, and it can't be combined with --start-index, --single-page, or --since-order.",
+    callback=lambda ctx, param, value: _parse_years(value) if value else None,
+)
 @click.option("--start-index", help="The index of the Order from which to start fetching in the history.")
 @click.option("--single-page", is_flag=True, default=False, help="Only one page should be fetched.")
 @click.option(
@@ -107,21 +114,44 @@ def amazon_orders_cli(ctx: Context, **kwargs: Any) -> None:
     default=False,
     help="Get the full details for each Order in the history. This will execute an additional request per Order.",
 )
+@click.option(
+    "--since-order",
+    help="The number of the newest Order already known (ex. from a previous sync). Paging stops once it is reached, "
+    "and it and older Orders are omitted.",
+)
 def history(ctx: Context, **kwargs: Any) -> None:
     """
     Get the Amazon Order history for a given year.
     """
+    if kwargs["years"]:
+        conflicting_options = [
+            option
+            for option, key in (
+                ("--start-index", "start_index"),
+                ("--single-page", "single_page"),
+                ("--since-order", "since_order"),
+            )
+            if kwargs[key]
+        ]
+        if conflicting_options:
+            ctx.fail(f"--years can't be combined with {', '.join(conflicting_options)}.")
+
     amazon_session = ctx.obj["amazon_session"]
 
     try:
         _authenticate(amazon_session)
 
         year = kwargs["year"]
+        years = kwargs["years"]
         start_index = kwargs["start_index"]
         single_page = kwargs["single_page"]
         full_details = kwargs["full_details"]
 
-        optional_start_index = f", startIndex={start_index}, one page" if single_page else ", all pages"
+        if years:
+            year = f"{years[0]}-{years[1]}"
+            optional_start_index = ", all pages"
+        else:
+            optional_start_index = f", startIndex={start_index}, one page" if single_page else ", all pages"
         optional_full_details = ", with full details" if full_details else ""
         click.echo(f"""-----------------------------------------------------------------------
 Order History for {year}{optional_start_index}{optional_full_details}
@@ -133,12 +163,17 @@ Order History for {year}{optional_start_index}{optional_full_details}
 
         start_time = time.time()
         total = 0
-        for o in amazon_orders.get_order_history(
-            year=kwargs["year"],
-            start_index=kwargs["start_index"],
-            full_details=kwargs["full_details"],
-            keep_paging=not kwargs["single_page"],
-        ):
+        if years:
+            orders = amazon_orders.iter_order_history_range(years[0], years[1], full_details=full_details)
+        else:
+            orders = amazon_orders.iter_order_history(
+                year=kwargs["year"],
+                start_index=kwargs["start_index"],
+                full_details=kwargs["full_details"],
+                keep_paging=not kwargs["single_page"],
+                since_order=kwargs["since_order"],
+            )
+        for o in orders:
             click.echo(f"{_order_output(o, config)}\n")
             total += 1
         end_time = time.time()
@@ -153,22 +188,42 @@ Order History for {year}{optional_start_index}{optional_full_details}
 
 @amazon_orders_cli.command()
 @click.pass_context
-@click.argument("order_id")
-def order(ctx: Context, order_id: str) -> None:
+@click.argument("order_ids", nargs=-1)
+@click.option(
+    "--from-file",
+    type=click.File("r"),
+    help="A file of Amazon Order IDs to get, one per line, in addition to any given as arguments.",
+)
+@click.option("--max-concurrency", type=int, help="The maximum number of Orders to fetch at once.")
+def order(ctx: Context, order_ids: tuple[str, ...], **kwargs: Any) -> None:
     """
-    Get the full details for a given Amazon Order ID.
+    Get the full details for the given Amazon Order IDs.
     """
     amazon_session = ctx.obj["amazon_session"]
 
+    all_order_ids = list(order_ids)
+    if kwargs["from_file"]:
+        all_order_ids += [line.strip() for line in kwargs["from_file"] if line.strip()]
+    if not all_order_ids:
+        raise click.UsageError("Pass at least one Order ID, or --from-file.")
+
     try:
         _authenticate(amazon_session)
 
         config = ctx.obj["conf"]
         amazon_orders = AmazonOrders(amazon_session, config=config)
 
-        o = amazon_orders.get_order(order_id)
+        results = amazon_orders.get_orders(all_order_ids, max_concurrency=kwargs["max_concurrency"])
 
-        click.echo(f"{_order_output(o, config)}\n")
+        errors = []
+        for order_id, o in results.items():
+            if isinstance(o, AmazonOrdersError):
+                errors.append(f"Order {order_id}: {o}" if len(results) > 1 else str(o))
+            else:
+                click.echo(f"{_order_output(o, config)}\n")
+
+        if errors:
+            ctx.fail("\n".join(errors))
     except AmazonOrdersAuthRedirectError:
         _prompt_to_reauth_flow()
     except AmazonOrdersError as e:
@@ -317,6 +372,19 @@ def _authenticate(amazon_session: AmazonSession, retries: int = 0) -> None:
             raise e
 
 
+def _parse_years(years: str) -> tuple[int, int]:
+    start_year, _, end_year = years.partition("-")
+    try:
+        parsed_years = int(start_year), int(end_year or start_year)
+    except ValueError:
+        raise click.BadParameter(f"'{years}' is not a valid range of years, ex. 2012-2025.")
+
+    if parsed_years[0] > parsed_years[1]:
+        raise click.BadParameter(f"'{years}' starts after it ends.")
+
+    return parsed_years
+
+
 def _prompt_to_reauth_flow() -> None:
     click.echo(
         "... Amazon redirected to login, which likely means the persisted session is stale. It was logged "
@@ -47,9 +47,41 @@ class AmazonOrdersConfig:
             "order_class": "amazonorders.entity.order.Order",
             "shipment_class": "amazonorders.entity.shipment.Shipment",
             "item_class": "amazonorders.entity.item.Item",
+            # The BeautifulSoup parser to use, or "auto" to use the fastest one installed (ex. lxml, if installed,
+            # which is faster than Python's built-in html.parser). Parsers recover differently from malformed HTML, so
+            # "auto" is opt-in
             "bs4_parser": "html.parser",
+            # When a selector has a list of alternatives, try the one that has matched most often on that type of page
+            # first, rather than always trying them in order (see selector_stats)
+            "adaptive_selectors": False,
+            # Only parse the parts of each page that are needed (see the *_PAGE_SELECTORs in Selectors), rather than
+            # the whole page
+            "partial_parse": True,
+            # Parse each history page's Order cards as the page downloads, starting their details requests before the
+            # rest of the page has arrived. Requires ORDER_HISTORY_ENTITY_SELECTOR's alternatives to be compound
+            # selectors (ex. div.order-card)
+            "stream_history_pages": False,
             "thread_pool_size": (os.cpu_count() or 1) * 4,
+            # The number of processes to build Orders in from history and details pages, so parsing isn't limited
+            # to one core. 0 builds them on the threads of thread_pool_size instead
+            "parse_workers": 0,
             "connection_pool_size": thread_pool_size * 2,
+            # The maximum number of Orders that may be in flight (or built, but waiting to be yielded in history
+            # order) at once when paging history, beyond which paging waits for in-flight Orders to complete
+            "max_pending_order_tasks": thread_pool_size * 2,
+            # The steady-state rate at which requests are sent to Amazon, and how many may be sent at once before that
+            # rate applies. The rate backs off automatically if Amazon starts throttling. 0 (the default) disables
+            # rate limiting, so that it is opt-in, and existing crawls aren't slowed down
+            "requests_per_second": 0,
+            "requests_burst": 20,
+            # The maximum number of times a request is attempted, if it fails with a retryable status or exception.
+            # Retries wait with jittered exponential backoff (starting from retry_backoff_base seconds, up to
+            # retry_backoff_max), or for as long as Amazon's Retry-After header asks (up to retry_backoff_max)
+            "max_request_attempts": 3,
+            "retry_backoff_base": 1,
+            "retry_backoff_max": 30,
+            "retry_statuses": [429, 500, 502, 503, 504],
+            "retry_exceptions": ["requests.exceptions.ConnectionError", "requests.exceptions.Timeout"],
             # The maximum number of failed attempts to allow before failing CLI authentication
             "max_auth_retries": 1,
         }
@@ -87,6 +119,9 @@ class AmazonOrdersConfig:
 
         self.constants = util.load_class(constants_class_split[:-1], constants_class_split[-1])()
         self.selectors = util.load_class(selectors_class_split[:-1], selectors_class_split[-1])()
+        #: Which alternative of each selector has matched, per type of page.
+        self.selector_stats: util.SelectorStats = util.SelectorStats()
+        util.compile_selectors(self.selectors, self.selector_stats, bool(self.adaptive_selectors))
         self.order_cls = util.load_class(order_class_split[:-1], order_class_split[-1])
         self.shipment_cls = util.load_class(shipment_class_split[:-1], shipment_class_split[-1])
         self.item_cls = util.load_class(item_class_split[:-1], item_class_split[-1])
@@ -110,6 +145,8 @@ class AmazonOrdersConfig:
 
         self.constants = util.load_class(constants_class_split[:-1], constants_class_split[-1])()
         self.selectors = util.load_class(selectors_class_split[:-1], selectors_class_split[-1])()
+        self.selector_stats = util.SelectorStats()
+        util.compile_selectors(self.selectors, self.selector_stats, bool(self.adaptive_selectors))
         self.order_cls = util.load_class(order_class_split[:-1], order_class_split[-1])
         self.shipment_cls = util.load_class(shipment_class_split[:-1], shipment_class_split[-1])
         self.item_cls = util.load_class(item_class_split[:-1], item_class_split[-1])
@@ -125,6 +162,13 @@ class AmazonOrdersConfig:
         """
         self._data[key] = value
 
+        if key == "adaptive_selectors":
+            # The selectors were compiled when the config was loaded, so the change is applied to them directly
+            for name in dir(self.selectors):
+                selector = getattr(self.selectors, name)
+                if isinstance(selector, util.SelectorList):
+                    selector.adaptive = bool(value)
+
         if save:
             self.save()
 
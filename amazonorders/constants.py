@@ -100,8 +100,17 @@ class Constants:
     ##########################################################################
 
     COOKIES_SET_WHEN_AUTHENTICATED = ["x-main"]
+    # No longer used by default, since ResponseClassifier scans for BOT_CHALLENGE_MARKERS instead
     JS_ROBOT_TEXT_REGEX = r"[.\s\S]*verify that you're not a robot[.\s\S]*Enable JavaScript[.\s\S]*"
 
+    # Byte strings that identify a response's body as a type of page (see ResponseClassifier), which are scanned for
+    # rather than parsing the page. Any one of a list's markers is a match, except for BOT_CHALLENGE_MARKERS, which
+    # must all be found, in order
+    SIGN_IN_FORM_MARKERS = [b'name="signIn"', b"name='signIn'"]
+    CAPTCHA_MARKERS = [b"cvf-widget-form-captcha", b"captchacharacters"]
+    MFA_MARKERS = [b"auth-select-device-form", b"auth-mfa-form", b"verification-code-form"]
+    BOT_CHALLENGE_MARKERS = [b"verify that you're not a robot", b"Enable JavaScript"]
+
     ##########################################################################
     # Currency
     ##########################################################################
@@ -2,13 +2,14 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import logging
+from collections.abc import Iterable
 from datetime import date
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
-from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.parsable import LazyField, Parsable, lazy_field
 from amazonorders.entity.seller import Seller
 
 logger = logging.getLogger(__name__)
@@ -24,39 +25,45 @@ class Item(Parsable):
     down querying).
     """
 
-    def __init__(self, parsed: Tag, config: AmazonOrdersConfig) -> None:
+    #: The fields that can be requested with ``fields``. ``title`` is always populated.
+    FIELDS = ("link", "price", "seller", "condition", "return_eligible_date", "image_link", "quantity")
+
+    EXTRACTED_SELECTORS = ("FIELD_ITEM_TITLE_SELECTOR", "FIELD_ITEM_LINK_SELECTOR")
+
+    #: The Item price.
+    price: float | None = lazy_field(parse="_parse_price", selectors=("FIELD_ITEM_PRICE_SELECTOR",))
+    #: The Item Seller.
+    seller: Seller | None = lazy_field("FIELD_ITEM_SELLER_SELECTOR", text_contains="Sold by:", wrap_tag=Seller)
+    #: The Item condition.
+    condition: str | None = lazy_field("FIELD_ITEM_TAG_ITERATOR_SELECTOR", prefix_split="Condition:")
+    #: The Item return eligible date.
+    return_eligible_date: date | None = lazy_field(
+        "FIELD_ITEM_RETURN_SELECTOR", text_contains="Return", parse_date=True
+    )
+    #: The Item image URL.
+    image_link: str | None = lazy_field("FIELD_ITEM_IMG_LINK_SELECTOR", attr_name="src")
+    #: The Item quantity.
+    quantity: int | None = lazy_field("FIELD_ITEM_QUANTITY_SELECTOR")
+
+    def __init__(self, parsed: Tag, config: AmazonOrdersConfig, fields: Iterable[str] | None = None) -> None:
         super().__init__(parsed, config)
 
+        #: The fields that were requested to be parsed (see :attr:`FIELDS`), or ``None`` if all fields were. Fields
+        #: that weren't requested are ``None``.
+        self.fields: frozenset[str] | None = frozenset(fields) if fields is not None else None
+
         #: The Item title.
         self.title: str = self.safe_simple_parse(
             selector=self.config.selectors.FIELD_ITEM_TITLE_SELECTOR, required=True
         )
         #: The Item link.
-        self.link: str = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_LINK_SELECTOR, attr_name="href", required=True
-        )
-        #: The Item price.
-        self.price: float | None = self.to_currency(
-            self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_PRICE_SELECTOR)
-        )
-        #: The Item Seller.
-        self.seller: Seller | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_SELLER_SELECTOR, text_contains="Sold by:", wrap_tag=Seller
-        )
-        #: The Item condition.
-        self.condition: str | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_TAG_ITERATOR_SELECTOR, prefix_split="Condition:"
+        self.link: str | None = (
+            self.safe_simple_parse(
+                selector=self.config.selectors.FIELD_ITEM_LINK_SELECTOR, attr_name="href", required=True
+            )
+            if self._wants("link")
+            else None
         )
-        #: The Item return eligible date.
-        self.return_eligible_date: date | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_RETURN_SELECTOR, text_contains="Return", parse_date=True
-        )
-        #: The Item image URL.
-        self.image_link: str | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_ITEM_IMG_LINK_SELECTOR, attr_name="src"
-        )
-        #: The Item quantity.
-        self.quantity: int | None = self.safe_simple_parse(selector=self.config.selectors.FIELD_ITEM_QUANTITY_SELECTOR)
 
     def __repr__(self) -> str:
         return f'<Item: "{self.title}">'
@@ -66,3 +73,15 @@ class Item(Parsable):
 
     def __lt__(self, other: ItemEntity) -> bool:
         return self.title < other.title
+
+    def _parse_lazy_field(self, field: LazyField) -> Any:
+        if not self._wants(field.name):
+            return None
+
+        return super()._parse_lazy_field(field)
+
+    def _parse_price(self) -> float | None:
+        return self.to_currency(self.simple_parse(self.config.selectors.FIELD_ITEM_PRICE_SELECTOR))
+
+    def _wants(self, field: str) -> bool:
+        return self.fields is None or field in self.fields
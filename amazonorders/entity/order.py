@@ -3,15 +3,17 @@ __license__ = "MIT"
 
 import json
 import logging
+import threading
+from collections.abc import Callable, Iterable
 from datetime import date
 from typing import Any, TypeVar
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.item import Item
-from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.parsable import LazyField, Parsable, lazy_field
 from amazonorders.entity.recipient import Recipient
 from amazonorders.entity.shipment import Shipment
 from amazonorders.exception import AmazonOrdersError
@@ -21,13 +23,107 @@ logger = logging.getLogger(__name__)
 OrderEntity = TypeVar("OrderEntity", bound="Order")
 
 
+def _currency_field(contains: str, combine_multiple: bool = False) -> Any:
+    return lazy_field(
+        parse="_parse_currency",
+        selectors=("FIELD_ORDER_SUBTOTALS_TAG_ITERATOR_SELECTOR",),
+        contains=contains,
+        combine_multiple=combine_multiple,
+    )
+
+
 class Order(Parsable):
     """
     An Amazon Order. If desired fields are populated as ``None``, ensure ``full_details`` is ``True`` when
     retrieving the Order (for instance, with :func:`~amazonorders.orders.AmazonOrders.get_order_history`), since
     by default it is ``False`` (enabling slows down querying).
+
+    Alternatively, an Order retrieved with ``lazy_details`` fetches its details page the first time one of its
+    :attr:`FULL_DETAILS_FIELDS` is accessed.
     """
 
+    #: The fields that are only populated when ``full_details`` is ``True``, and so trigger a lazy Order to fetch its
+    #: details page. Items are also re-parsed from the details page when it's fetched.
+    FULL_DETAILS_FIELDS = (
+        "payment_method",
+        "payment_method_last_4",
+        "subtotal",
+        "shipping_total",
+        "free_shipping",
+        "promotion_applied",
+        "coupon_savings",
+        "subscription_discount",
+        "total_before_tax",
+        "estimated_tax",
+        "refund_total",
+    )
+    #: The fields that can be requested with ``fields``. ``order_number`` and ``index`` are always populated. Item
+    #: fields can be requested with the ``items.`` prefix (ex. ``items.price``), which implies ``items``.
+    FIELDS = (
+        "shipments",
+        "items",
+        "order_details_link",
+        "grand_total",
+        "order_placed_date",
+        "recipient",
+    ) + FULL_DETAILS_FIELDS
+
+    EXTRACTED_SELECTORS = ("FIELD_ORDER_NUMBER_SELECTOR", "FIELD_ORDER_GRAND_TOTAL_SELECTOR")
+
+    #: The Order Shipments.
+    shipments: list[Shipment] = lazy_field(
+        parse="_parse_shipments", safe=False, selectors=("ORDER_SKIP_ITEMS", "SHIPMENT_ENTITY_SELECTOR")
+    )
+    #: The Order Items.
+    items: list[Item] = lazy_field(
+        parse="_parse_items", safe=False, selectors=("ORDER_SKIP_ITEMS", "ITEM_ENTITY_SELECTOR")
+    )
+    #: The Order details link.
+    order_details_link: str | None = lazy_field(
+        parse="_parse_order_details_link", selectors=("FIELD_ORDER_DETAILS_LINK_SELECTOR",)
+    )
+    #: The Order placed date.
+    order_placed_date: date = lazy_field(
+        "FIELD_ORDER_PLACED_DATE_SELECTOR", suffix_split="Order #", suffix_split_fuzzy=True, parse_date=True
+    )
+    #: The Order Recipients.
+    recipient: Recipient | None = lazy_field(
+        parse="_parse_recipient",
+        selectors=(
+            "FIELD_ORDER_GIFT_CARD_INSTANCE_SELECTOR",
+            "FIELD_ORDER_ADDRESS_SELECTOR",
+            "FIELD_ORDER_ADDRESS_FALLBACK_1_SELECTOR",
+            "FIELD_ORDER_ADDRESS_FALLBACK_2_SELECTOR",
+        ),
+    )
+
+    # Fields below this point are only populated if `full_details` is True
+
+    #: The Order payment method. Only populated when ``full_details`` is ``True``.
+    payment_method: str | None = lazy_field("FIELD_ORDER_PAYMENT_METHOD_SELECTOR", attr_name="alt")
+    #: The Order payment method's last 4 digits. Only populated when ``full_details`` is ``True``.
+    payment_method_last_4: int | None = lazy_field(
+        "FIELD_ORDER_PAYMENT_METHOD_LAST_4_SELECTOR", prefix_split="ending in"
+    )
+    #: The Order subtotal. Only populated when ``full_details`` is ``True``.
+    subtotal: float | None = _currency_field("subtotal")
+    #: The Order shipping total. Only populated when ``full_details`` is ``True``.
+    shipping_total: float | None = _currency_field("shipping")
+    #: The Order free shipping. Only populated when ``full_details`` is ``True``.
+    free_shipping: float | None = _currency_field("free shipping")
+    #: The Order promotion applied. Only populated when ``full_details`` is ``True``.
+    promotion_applied: float | None = _currency_field("promotion", combine_multiple=True)
+    #: The Order coupon savings. Only populated when ``full_details`` is ``True``.
+    coupon_savings: float | None = _currency_field("coupon", combine_multiple=True)
+    #: The Order Subscribe & Save discount. Only populated when ``full_details`` is ``True``.
+    subscription_discount: float | None = _currency_field("subscribe")
+    #: The Order total before tax. Only populated when ``full_details`` is ``True``.
+    total_before_tax: float | None = _currency_field("before tax")
+    #: The Order estimated tax. Only populated when ``full_details`` is ``True``.
+    estimated_tax: float | None = _currency_field("estimated tax")
+    #: The Order refund total. Only populated when ``full_details`` is ``True``.
+    refund_total: float | None = _currency_field("refund total")
+
     def __init__(
         self,
         parsed: Tag,
@@ -35,11 +131,17 @@ class Order(Parsable):
         full_details: bool = False,
         clone: OrderEntity | None = None,
         index: int | None = None,
+        fields: Iterable[str] | None = None,
     ) -> None:
         super().__init__(parsed, config)
 
         #: If the Orders full details were populated from its details page.
         self.full_details: bool = full_details
+        #: The fields that were requested to be parsed (see :attr:`FIELDS`), or ``None`` if all fields were. Fields
+        #: that weren't requested are ``None``.
+        self.fields: frozenset[str] | None = frozenset(fields) if fields is not None else None
+        if self.fields is not None and any(field.startswith("items.") for field in self.fields):
+            self.fields |= {"items"}
 
         #: Where the Order appeared in the history when it was queried. This will inevitably change (ex. when a new
         #: Order is placed, all indexes will then be off by one), but is still captured as it may be applicable in
@@ -48,10 +150,6 @@ class Order(Parsable):
         #: the ``clone`` has its ``index`` set.
         self.index: int | None = index if index is not None else (clone.index if clone else None)
 
-        #: The Order Shipments.
-        self.shipments: list[Shipment] = clone.shipments if clone else self._parse_shipments()
-        #: The Order Items.
-        self.items: list[Item] = clone.items if clone and not full_details else self._parse_items()
         #: The Order number.
         self.order_number: str = (
             clone.order_number
@@ -63,58 +161,27 @@ class Order(Parsable):
                 prefix_split_fuzzy=True,
             )
         )
-        #: The Order details link.
-        self.order_details_link: str | None = (
-            clone.order_details_link if clone else self.safe_parse(self._parse_order_details_link)
-        )
         #: The Order grand total.
-        self.grand_total: float = clone.grand_total if clone else self.safe_parse(self._parse_grand_total)
-        #: The Order placed date.
-        self.order_placed_date: date = (
-            clone.order_placed_date
+        self.grand_total: float = (
+            clone.grand_total
             if clone
-            else self.safe_simple_parse(
-                selector=self.config.selectors.FIELD_ORDER_PLACED_DATE_SELECTOR,
-                suffix_split="Order #",
-                suffix_split_fuzzy=True,
-                parse_date=True,
-            )
+            else self._parse_if_wanted("grand_total", lambda: self.safe_parse(self._parse_grand_total))
         )
-        #: The Order Recipients.
-        self.recipient: Recipient = clone.recipient if clone else self.safe_parse(self._parse_recipient)
 
-        # Fields below this point are only populated if `full_details` is True
-
-        #: The Order payment method. Only populated when ``full_details`` is ``True``.
-        self.payment_method: str | None = self._if_full_details(
-            self.safe_simple_parse(selector=self.config.selectors.FIELD_ORDER_PAYMENT_METHOD_SELECTOR, attr_name="alt")
-        )
-        #: The Order payment method's last 4 digits. Only populated when ``full_details`` is ``True``.
-        self.payment_method_last_4: int | None = self._if_full_details(
-            self.safe_simple_parse(
-                selector=self.config.selectors.FIELD_ORDER_PAYMENT_METHOD_LAST_4_SELECTOR, prefix_split="ending in"
-            )
-        )
-        #: The Order subtotal. Only populated when ``full_details`` is ``True``.
-        self.subtotal: float | None = self._if_full_details(self._parse_currency("subtotal"))
-        #: The Order shipping total. Only populated when ``full_details`` is ``True``.
-        self.shipping_total: float | None = self._if_full_details(self._parse_currency("shipping"))
-        #: The Order free shipping. Only populated when ``full_details`` is ``True``.
-        self.free_shipping: float | None = self._if_full_details(self._parse_currency("free shipping"))
-        #: The Order promotion applied. Only populated when ``full_details`` is ``True``.
-        self.promotion_applied: float | None = self._if_full_details(
-            self._parse_currency("promotion", combine_multiple=True)
-        )
-        #: The Order coupon savings. Only populated when ``full_details`` is ``True``.
-        self.coupon_savings: float | None = self._if_full_details(self._parse_currency("coupon", combine_multiple=True))
-        #: The Order Subscribe & Save discount. Only populated when ``full_details`` is ``True``.
-        self.subscription_discount: float | None = self._if_full_details(self._parse_currency("subscribe"))
-        #: The Order total before tax. Only populated when ``full_details`` is ``True``.
-        self.total_before_tax: float | None = self._if_full_details(self._parse_currency("before tax"))
-        #: The Order estimated tax. Only populated when ``full_details`` is ``True``.
-        self.estimated_tax: float | None = self._if_full_details(self._parse_currency("estimated tax"))
-        #: The Order refund total. Only populated when ``full_details`` is ``True``.
-        self.refund_total: float | None = self._if_full_details(self._parse_currency("refund total"))
+        # The rest of the fields are LazyFields, parsed on first access, unless they're being cloned
+        if clone:
+            self.shipments = clone.shipments
+            if not full_details:
+                self.items = clone.items
+            self.order_details_link = clone.order_details_link
+            self.order_placed_date = clone.order_placed_date
+            self.recipient = clone.recipient
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        state.pop("_details_loader", None)
+        state.pop("_details_lock", None)
+        return state
 
     def __repr__(self) -> str:
         return f'<Order #{self.order_number}: "{self.items}">'
@@ -122,28 +189,75 @@ class Order(Parsable):
     def __str__(self) -> str:  # pragma: no cover
         return f"Order #{self.order_number}: {self.items}"
 
+    @property
+    def details_pending(self) -> bool:
+        """
+        ``True`` if this is a lazy Order whose details page has not been fetched yet.
+        """
+        return self.__dict__.get("_details_loader") is not None
+
+    def load_details(self) -> None:
+        """
+        Fetch this lazy Order's details page (if it hasn't been already) and populate its full details fields. This
+        is called automatically on first access of any of :attr:`FULL_DETAILS_FIELDS`, and is thread-safe, so the
+        details page is only fetched once.
+        """
+        if not self.details_pending:
+            return
+
+        with self._details_lock:
+            details_loader = self.__dict__.get("_details_loader")
+            if details_loader:
+                self.apply_details(details_loader())
+
+    def apply_details(self, details: "Order") -> None:
+        """
+        Populate this Order's full details fields (and Items) from the given Order, built from its details page.
+
+        :param details: The same Order, built with ``full_details``.
+        """
+        for field in self.FULL_DETAILS_FIELDS:
+            setattr(self, field, getattr(details, field))
+        self.items = details.items
+        self.full_details = True
+        self.__dict__.pop("_details_loader", None)
+
+    def _set_details_loader(self, details_loader: Callable[[], "Order"]) -> None:
+        for field in self.FULL_DETAILS_FIELDS:
+            self.__dict__.pop(field, None)
+        self._details_lock: threading.Lock = threading.Lock()
+        self._details_loader: Callable[[], Order] | None = details_loader
+
     def _parse_shipments(self) -> list[Shipment]:
-        if not self.parsed or len(util.select(self.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
+        if not self.parsed or len(self.select(self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
             return []
 
         shipments: list[Shipment] = [
             self.config.shipment_cls(x, self.config)
-            for x in util.select(self.parsed, self.config.selectors.SHIPMENT_ENTITY_SELECTOR)
+            for x in self.select(self.config.selectors.SHIPMENT_ENTITY_SELECTOR)
         ]
         shipments.sort()
         return shipments
 
     def _parse_items(self) -> list[Item]:
-        if not self.parsed or len(util.select(self.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
+        if not self.parsed or len(self.select(self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
             return []
 
         items: list[Item] = [
-            self.config.item_cls(x, self.config)
-            for x in util.select(self.parsed, self.config.selectors.ITEM_ENTITY_SELECTOR)
+            self._build_item(x)
+            for x in self.select(self.config.selectors.ITEM_ENTITY_SELECTOR)
         ]
         items.sort()
         return items
 
+    def _build_item(self, item_tag: Tag) -> Item:
+        if self.fields is None:
+            return self.config.item_cls(item_tag, self.config)
+
+        item_fields = [field.split(".", 1)[1] for field in self.fields if field.startswith("items.")]
+        # Requesting "items" alone populates all Item fields
+        return self.config.item_cls(item_tag, self.config, fields=item_fields or None)
+
     def _parse_order_details_link(self) -> str | None:
         value = self.simple_parse(self.config.selectors.FIELD_ORDER_DETAILS_LINK_SELECTOR, attr_name="href")
 
@@ -173,35 +287,28 @@ class Order(Parsable):
 
     def _parse_recipient(self) -> Recipient | None:
         # At least for now, we don't populate Recipient data for digital orders
-        if util.select_one(self.parsed, self.config.selectors.FIELD_ORDER_GIFT_CARD_INSTANCE_SELECTOR):
+        if self.select_one(self.config.selectors.FIELD_ORDER_GIFT_CARD_INSTANCE_SELECTOR):
             return None
 
-        value = util.select_one(self.parsed, self.config.selectors.FIELD_ORDER_ADDRESS_SELECTOR)
+        value = self.select_one(self.config.selectors.FIELD_ORDER_ADDRESS_SELECTOR)
 
         if not value:
-            value = util.select_one(self.parsed, self.config.selectors.FIELD_ORDER_ADDRESS_FALLBACK_1_SELECTOR)
+            value = self.select_one(self.config.selectors.FIELD_ORDER_ADDRESS_FALLBACK_1_SELECTOR)
 
             if value:
                 data_popover = value.get("data-a-popover", {})  # type: ignore[var-annotated]
                 inline_content = data_popover.get("inlineContent")  # type: ignore[union-attr]
                 if inline_content:
-                    value = BeautifulSoup(json.loads(inline_content), self.config.bs4_parser)
+                    value = util.parse_html(json.loads(inline_content), self.config.bs4_parser)
 
         if not value:
-            # TODO: there are multiple shipToData tags, we should double check we're picking the right one
-            #  associated with the order; should also be able to eliminate the use of find_parent() here with
-            #  a better CSS selector, we just need to make sure we have good test coverage around this path first
-            parsed_parent = self.parsed.find_parent()
-
-            if parsed_parent is None:
-                raise AmazonOrdersError(
-                    "Recipient parent not found, but it's required. Check if Amazon changed the HTML."
-                )  # pragma: no cover
-
-            parent_tag = util.select_one(parsed_parent, self.config.selectors.FIELD_ORDER_ADDRESS_FALLBACK_2_SELECTOR)
+            # Only the shipToData within this Order, since there is one per Order on a history page, and searching the
+            # rest of the page (ex. with find_parent()) would pick another Order's, or depend on whether the card was
+            # streamed on its own
+            ship_to_data_tag = self.select_one(self.config.selectors.FIELD_ORDER_ADDRESS_FALLBACK_2_SELECTOR)
 
-            if parent_tag:
-                value = BeautifulSoup(str(parent_tag.contents[0]).strip(), self.config.bs4_parser)
+            if ship_to_data_tag:
+                value = util.parse_html(str(ship_to_data_tag.contents[0]).strip(), self.config.bs4_parser)
 
         if not value:
             return None
@@ -211,7 +318,7 @@ class Order(Parsable):
     def _parse_currency(self, contains: str, combine_multiple: bool = False) -> float | None:
         value = None
 
-        for tag in util.select(self.parsed, self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_ITERATOR_SELECTOR):
+        for tag in self.select(self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_ITERATOR_SELECTOR):
             if contains in tag.text.lower() and not util.select_one(
                 tag, self.config.selectors.FIELD_ORDER_SUBTOTALS_TAG_POPOVER_PRELOAD_SELECTOR
             ):
@@ -228,5 +335,30 @@ class Order(Parsable):
 
         return value
 
-    def _if_full_details(self, value: Any) -> Any | None:
-        return value if self.full_details else None
+    def _wants(self, field: str) -> bool:
+        return self.fields is None or field in self.fields
+
+    def _parse_if_wanted(self, field: str, parse_function: Callable[[], Any]) -> Any | None:
+        return parse_function() if self._wants(field) else None
+
+    def _lazy_field_names(self) -> tuple[str, ...]:
+        names = super()._lazy_field_names()
+        if self.details_pending or not self.full_details:
+            # These come from the details page, not this entity's HTML, so they're only fetched when accessed (or
+            # aren't populated at all)
+            names = tuple(name for name in names if name not in self.FULL_DETAILS_FIELDS)
+        return names
+
+    def _parse_lazy_field(self, field: LazyField) -> Any:
+        if field.name in self.FULL_DETAILS_FIELDS:
+            if self.details_pending:
+                self.load_details()
+                return self.__dict__[field.name]
+            if not self.full_details:
+                # The full details selectors would be wasted work on a history card
+                return None
+
+        if not self._wants(field.name):
+            return [] if field.name in ("shipments", "items") else None
+
+        return super()._parse_lazy_field(field)
@@ -1,9 +1,11 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import functools
+import inspect
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import date
 from typing import Any
 
@@ -13,16 +15,105 @@ from dateutil import parser
 from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.exception import AmazonOrdersEntityError, AmazonOrdersError
+from amazonorders.selectors import Selector
 
 logger = logging.getLogger(__name__)
 
 
+class LazyField:
+    """
+    A field of a :class:`Parsable` entity that isn't parsed until it is first accessed, after which the value is
+    cached on the entity. Declare it on the entity's class with :func:`lazy_field`.
+
+    As with any other attribute, assigning the field (ex. in a subclass's ``__init__``) replaces it.
+    """
+
+    def __init__(
+        self,
+        selector: str | None = None,
+        parse: str | None = None,
+        safe: bool = True,
+        selectors: tuple[str, ...] = (),
+        **kwargs: Any,
+    ) -> None:
+        if (selector is None) == (parse is None):
+            raise AmazonOrdersError("A LazyField must be given exactly one of `selector` or `parse`.")
+
+        #: The name of the field's selector in :class:`~amazonorders.selectors.Selectors`.
+        self.selector: str | None = selector
+        #: The name of the entity's method that parses the field.
+        self.parse: str | None = parse
+        #: ``False`` if exceptions from ``parse`` should be raised, rather than logged by :func:`Parsable.safe_parse`.
+        self.safe: bool = safe
+        #: The names of the selectors in :class:`~amazonorders.selectors.Selectors` that ``parse`` selects on the
+        #: entity with, so they can be matched in the entity's single pass (see :func:`Parsable.select`).
+        self.selectors: tuple[str, ...] = ((selector,) if selector else ()) + selectors
+        #: The ``kwargs`` to pass to :func:`Parsable.simple_parse`, or to ``parse``.
+        self.kwargs: dict[str, Any] = kwargs
+        #: The name of the field on the entity.
+        self.name: str = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: "Parsable | None", owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+
+        value = instance._parse_lazy_field(self)
+        # This is a non-data descriptor, so once the value is in the instance's __dict__, it's found there instead
+        instance.__dict__[self.name] = value
+        return value
+
+
+def lazy_field(
+    selector: str | None = None,
+    parse: str | None = None,
+    safe: bool = True,
+    selectors: tuple[str, ...] = (),
+    **kwargs: Any,
+) -> Any:
+    """
+    Declare a :class:`LazyField` on a :class:`Parsable` entity's class, with either the name of a selector in
+    :class:`~amazonorders.selectors.Selectors` (and any other ``kwargs`` for :func:`Parsable.simple_parse`), or the
+    name of one of the entity's ``_parse_`` methods (and any ``kwargs`` to pass it). For example:
+
+    .. code-block:: python
+
+        class Item(Parsable):
+            quantity: int | None = lazy_field("FIELD_ITEM_QUANTITY_SELECTOR")
+
+    :param selector: The name of the field's selector.
+    :param parse: The name of the entity's method that parses the field.
+    :param safe: ``False`` if exceptions from ``parse`` should be raised, rather than logged.
+    :param selectors: The names of the selectors that ``parse`` uses with :func:`Parsable.select` or
+        :func:`Parsable.select_one`.
+    :param kwargs: The ``kwargs`` to pass to :func:`Parsable.simple_parse`, or to ``parse``.
+    :return: The field, typed as ``Any`` so that it can be annotated with the type of its value.
+    """
+    return LazyField(selector, parse, safe, selectors, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_field_names(cls: type) -> tuple[str, ...]:
+    return tuple(name for name in dir(cls) if isinstance(inspect.getattr_static(cls, name), LazyField))
+
+
 class Parsable:
     """
     A base class that contains a parsed representation of the entity, which can be extended to build an entity that
     utilizes the common the helper methods.
+
+    Rather than searching ``parsed`` once per field, the entity's selectors are matched in single passes over
+    ``parsed`` (see :func:`~amazonorders.util.extract`): :attr:`EXTRACTED_SELECTORS` the first time the entity selects
+    on ``parsed`` (ex. in ``__init__``), and the selectors of all of its :class:`LazyField`'s that haven't been parsed
+    yet the first time one of them is read.
     """
 
+    #: The names of the selectors in :class:`~amazonorders.selectors.Selectors` that the entity selects on ``parsed``
+    #: with outside of its :class:`LazyField`'s (ex. in ``__init__``).
+    EXTRACTED_SELECTORS: tuple[str, ...] = ()
+
     def __init__(self, parsed: Tag, config: AmazonOrdersConfig) -> None:
         #: Parsed HTML data that can be used to populate the fields of the entity.
         self.parsed: Tag = parsed
@@ -30,10 +121,106 @@ class Parsable:
         self.config: AmazonOrdersConfig = config
 
     def __getstate__(self) -> dict:
+        # Lazy fields can't be parsed once "parsed" is gone
+        self.materialize()
+
         state = self.__dict__.copy()
-        state.pop("parsed")
+        state.pop("parsed", None)
+        state.pop("_extracted", None)
+        state.pop("_lazy_fields_extracted", None)
         return state
 
+    def materialize(self) -> None:
+        """
+        Parse any of this entity's :class:`LazyField`'s that haven't been accessed yet, as well as those of the
+        entities nested within it, so that ``parsed`` is no longer needed (ex. before it's released).
+        """
+        for name in self._lazy_field_names():
+            getattr(self, name)
+
+        for value in list(self.__dict__.values()):
+            for entity in value if isinstance(value, list) else [value]:
+                if isinstance(entity, Parsable):
+                    entity.materialize()
+
+    def parse_unsafe_fields(self) -> None:
+        """
+        Parse any of this entity's :class:`LazyField`'s that aren't ``safe`` (whose exceptions are raised, rather than
+        logged), so that an error parsing them is raised now (ex. while the entity is being built), rather than the
+        first time they're accessed.
+        """
+        for name in self._lazy_field_names():
+            if not inspect.getattr_static(type(self), name).safe:
+                getattr(self, name)
+
+    def select(self, selector: list | str) -> list[Tag]:
+        """
+        Select on ``parsed`` with :func:`~amazonorders.util.select`, using the matches from the entity's single pass.
+
+        :param selector: The CSS selector(s) for the field.
+        :return: The selected tag.
+        """
+        return util.select(self.parsed, selector, self._extract())
+
+    def select_one(self, selector: list | str) -> Tag | None:
+        """
+        Select on ``parsed`` with :func:`~amazonorders.util.select_one`, using the matches from the entity's single
+        pass.
+
+        :param selector: The CSS selector(s) for the field.
+        :return: The selected tag.
+        """
+        return util.select_one(self.parsed, selector, self._extract())
+
+    def _extract(self) -> dict[str, list[Tag]]:
+        extracted = self.__dict__.get("_extracted")
+        if extracted is None:
+            extracted = self._extracted = util.extract(self.parsed, self._css_selectors(self.EXTRACTED_SELECTORS))
+        return extracted
+
+    def _extract_lazy_fields(self) -> None:
+        # Deferred until a LazyField is first read, so building the entity doesn't match every field's selectors
+        if self.__dict__.get("_lazy_fields_extracted"):
+            return
+        self._lazy_fields_extracted = True
+
+        selector_names: list[str] = []
+        for name in self._lazy_field_names():
+            if name not in self.__dict__ and self._wants(name):
+                selector_names += inspect.getattr_static(type(self), name).selectors
+
+        extracted = self._extract()
+        css_selectors = [s for s in self._css_selectors(selector_names) if s not in extracted]
+        if css_selectors:
+            extracted.update(util.extract(self.parsed, css_selectors))
+
+    def _css_selectors(self, selector_names: Iterable[str]) -> list[str]:
+        css_selectors = []
+        for selector_name in dict.fromkeys(selector_names):
+            selector = getattr(self.config.selectors, selector_name)
+            for s in selector if isinstance(selector, list) else [selector]:
+                css_selectors.append(s.css_selector if isinstance(s, Selector) else s)
+        return css_selectors
+
+    def _wants(self, field: str) -> bool:
+        return True
+
+    def _lazy_field_names(self) -> tuple[str, ...]:
+        return _lazy_field_names(type(self))
+
+    def _parse_lazy_field(self, field: LazyField) -> Any:
+        if self.__dict__.get("parsed") is None:
+            # Ex. the entity was unpickled
+            return None
+
+        self._extract_lazy_fields()
+
+        if field.parse:
+            parse_function = getattr(self, field.parse)
+            return self.safe_parse(parse_function, **field.kwargs) if field.safe else parse_function(**field.kwargs)
+
+        return self.safe_simple_parse(selector=getattr(self.config.selectors, str(field.selector)), **field.kwargs)
+
     def safe_parse(self, parse_function: Callable[..., Any], **kwargs: Any) -> Any:
         """
         Execute the given parse function on a field, handling any common parse exceptions and passing
@@ -44,7 +231,9 @@ class Parsable:
         :return: The return value from ``parse_function``.
         """
         if not parse_function.__name__.startswith("_parse_") and parse_function.__name__ != "simple_parse":
-            raise AmazonOrdersError("The name of the `parse_function` passed to this method must start with `_parse_`.")
+            raise AmazonOrdersError(
+                "The name of the `parse_function` passed to this method must start with `_parse_`."
+            )
 
         try:
             return parse_function(**kwargs)
@@ -52,7 +241,9 @@ class Parsable:
             function = "simple_parse"
             if parse_function.__name__ != function:
                 function = parse_function.__name__.split("_parse_")[1]
-            logger.warning(f"When building {self.__class__.__name__}, `{function}` could not be parsed.", exc_info=True)
+            logger.warning(
+                f"When building {self.__class__.__name__}, `{function}` could not be parsed.", exc_info=True
+            )
             return None
 
     def simple_parse(
@@ -96,8 +287,14 @@ class Parsable:
 
         value: int | float | bool | date | str | None = None
 
-        for s in selector:
-            for tag in self.parsed.select(s):
+        page_type = util.get_page_type(self.parsed) if isinstance(selector, util.SelectorList) else ""
+        indexes = selector.order(page_type) if isinstance(selector, util.SelectorList) else range(len(selector))
+        matched_index = None
+        for i in indexes:
+            s = selector[i]
+            # Only the first match's attribute is ever used, so there's no need to find every match
+            tags = [self.select_one(s)] if attr_name else self.select(s)
+            for tag in tags:
                 if tag:
                     if attr_name:
                         value = tag.attrs[attr_name]
@@ -105,6 +302,8 @@ class Parsable:
                         if attr_name == "href" or attr_name == "src":
                             value = self.with_base_url(value)
 
+                        if isinstance(selector, util.SelectorList):
+                            selector.record(page_type, i)
                         return value
                     else:
                         if text_contains and text_contains not in tag.text:
@@ -142,11 +341,16 @@ class Parsable:
                                 value = None
                     break
             if value:
+                matched_index = i
                 break
 
+        if isinstance(selector, util.SelectorList):
+            selector.record(page_type, matched_index)
+
         if value is None and required:
             raise AmazonOrdersEntityError(
-                f"When building {self.__class__.__name__}, field for selector `{selector}` was None, but this is not allowed."
+                f"When building {self.__class__.__name__}, field for selector `{selector}` was None, but this is "
+                f"not allowed."
             )
 
         return value
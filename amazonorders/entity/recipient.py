@@ -6,7 +6,7 @@ import logging
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
-from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.parsable import Parsable, lazy_field
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +16,20 @@ class Recipient(Parsable):
     The person receiving an Amazon :class:`~amazonorders.entity.order.Order`.
     """
 
+    EXTRACTED_SELECTORS = ("FIELD_RECIPIENT_NAME_SELECTOR",)
+
+    #: The Recipient address.
+    address: str | None = lazy_field(
+        parse="_parse_address",
+        selectors=(
+            "FIELD_RECIPIENT_ADDRESS1_SELECTOR",
+            "FIELD_RECIPIENT_ADDRESS2_SELECTOR",
+            "FIELD_RECIPIENT_ADDRESS_CITY_STATE_POSTAL_SELECTOR",
+            "FIELD_RECIPIENT_ADDRESS_COUNTRY_SELECTOR",
+            "FIELD_RECIPIENT_ADDRESS_FALLBACK_SELECTOR",
+        ),
+    )
+
     def __init__(self, parsed: Tag, config: AmazonOrdersConfig) -> None:
         super().__init__(parsed, config)
 
@@ -23,8 +37,6 @@ class Recipient(Parsable):
         self.name: str = self.safe_simple_parse(
             selector=self.config.selectors.FIELD_RECIPIENT_NAME_SELECTOR, required=True
         )
-        #: The Recipient address.
-        self.address: str | None = self.safe_parse(self._parse_address)
 
     def __repr__(self) -> str:
         return f'<Recipient: "{self.name}">'
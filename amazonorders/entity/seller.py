@@ -6,7 +6,7 @@ import logging
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
-from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.parsable import Parsable, lazy_field
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +16,14 @@ class Seller(Parsable):
     An Amazon Seller of an Amazon :class:`~amazonorders.entity.item.Item`.
     """
 
+    #: The Seller name.
+    name: str = lazy_field("FIELD_SELLER_NAME_SELECTOR", prefix_split="Sold by:")
+    #: The Seller link.
+    link: str | None = lazy_field("FIELD_SELLER_LINK_SELECTOR", attr_name="href")
+
     def __init__(self, parsed: Tag, config: AmazonOrdersConfig) -> None:
         super().__init__(parsed, config)
 
-        #: The Seller name.
-        self.name: str = self.safe_simple_parse(
-            self.config.selectors.FIELD_SELLER_NAME_SELECTOR, prefix_split="Sold by:"
-        )
-        #: The Seller link.
-        self.link: str | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_SELLER_LINK_SELECTOR, attr_name="href"
-        )
-
     def __repr__(self) -> str:
         return f'<Seller: "{self.name}">'
 
@@ -6,10 +6,9 @@ from typing import TypeVar
 
 from bs4 import Tag
 
-from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.item import Item
-from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.parsable import Parsable, lazy_field
 
 logger = logging.getLogger(__name__)
 
@@ -21,20 +20,16 @@ class Shipment(Parsable):
     An Amazon Shipment, which should contain one or more :class:`~amazonorders.entity.item.Item`'s.
     """
 
+    #: The Shipment Items.
+    items: list[Item] = lazy_field(parse="_parse_items", safe=False, selectors=("ITEM_ENTITY_SELECTOR",))
+    #: The Shipment delivery status.
+    delivery_status: str | None = lazy_field("FIELD_SHIPMENT_DELIVERY_STATUS_SELECTOR")
+    #: The Shipment tracking link.
+    tracking_link: str | None = lazy_field("FIELD_SHIPMENT_TRACKING_LINK_SELECTOR", attr_name="href")
+
     def __init__(self, parsed: Tag, config: AmazonOrdersConfig) -> None:
         super().__init__(parsed, config)
 
-        #: The Shipment Items.
-        self.items: list[Item] = self._parse_items()
-        #: The Shipment delivery status.
-        self.delivery_status: str | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_SHIPMENT_DELIVERY_STATUS_SELECTOR
-        )
-        #: The Shipment tracking link.
-        self.tracking_link: str | None = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_SHIPMENT_TRACKING_LINK_SELECTOR, attr_name="href"
-        )
-
     def __repr__(self) -> str:
         return f'<Shipment: "{self.items}">'
 
@@ -53,7 +48,7 @@ class Shipment(Parsable):
 
         items: list[Item] = [
             self.config.item_cls(x, self.config)
-            for x in util.select(self.parsed, self.config.selectors.ITEM_ENTITY_SELECTOR)
+            for x in self.select(self.config.selectors.ITEM_ENTITY_SELECTOR)
         ]
         items.sort()
         return items
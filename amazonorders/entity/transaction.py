@@ -8,7 +8,7 @@ from datetime import date
 from bs4 import Tag
 
 from amazonorders.conf import AmazonOrdersConfig
-from amazonorders.entity.parsable import Parsable
+from amazonorders.entity.parsable import Parsable, lazy_field
 from amazonorders.exception import AmazonOrdersError
 
 logger = logging.getLogger(__name__)
@@ -19,27 +19,30 @@ class Transaction(Parsable):
     An Amazon Transaction.
     """
 
+    EXTRACTED_SELECTORS = ("FIELD_TRANSACTION_GRAND_TOTAL_SELECTOR", "FIELD_TRANSACTION_ORDER_NUMBER_SELECTOR")
+
+    #: The Transaction payment method.
+    payment_method: str = lazy_field("FIELD_TRANSACTION_PAYMENT_METHOD_SELECTOR")
+    #: The Transaction is pending or not.
+    is_pending: bool = lazy_field(parse="_parse_is_pending")
+    #: The Transaction Order details link.
+    order_details_link: str = lazy_field(
+        parse="_parse_order_details_link", selectors=("FIELD_TRANSACTION_ORDER_LINK_SELECTOR",)
+    )
+    #: The Transaction seller name.
+    seller: str = lazy_field("FIELD_TRANSACTION_SELLER_NAME_SELECTOR")
+
     def __init__(self, parsed: Tag, config: AmazonOrdersConfig, completed_date: date) -> None:
         super().__init__(parsed, config)
 
         #: The Transaction completed date.
         self.completed_date: date = completed_date
-        #: The Transaction payment method.
-        self.payment_method: str = self.safe_simple_parse(
-            selector=self.config.selectors.FIELD_TRANSACTION_PAYMENT_METHOD_SELECTOR
-        )
         #: The Transaction grand total.
         self.grand_total: float = self.safe_parse(self._parse_grand_total)
         #: The Transaction was a refund or not.
         self.is_refund: bool = self.grand_total > 0
-        #: The Transaction is pending or not.
-        self.is_pending: bool = self.safe_parse(self._parse_is_pending)
         #: The Transaction Order number.
         self.order_number: str = self.safe_parse(self._parse_order_number)
-        #: The Transaction Order details link.
-        self.order_details_link: str = self.safe_parse(self._parse_order_details_link)
-        #: The Transaction seller name.
-        self.seller: str = self.safe_simple_parse(selector=self.config.selectors.FIELD_TRANSACTION_SELLER_NAME_SELECTOR)
 
     def __repr__(self) -> str:
         return f'<Transaction {self.completed_date}: "Order #{self.order_number}, Grand Total: {self.grand_total}">'
@@ -31,6 +31,10 @@ class AuthForm(ABC):
     image URL to :func:`~amazonorders.session.IODefault.prompt` as ``img_url``.
     """
 
+    #: The type of page this form is expected on (see :class:`~amazonorders.util.ResponseClassifier`). On a page of
+    #: that type, it is tried before the other forms.
+    response_type: str | None = None
+
     def __init__(
         self,
         config: AmazonOrdersConfig,
@@ -53,6 +57,17 @@ class AuthForm(ABC):
         #: The ``<form>`` data that will be submitted.
         self.data: dict[str, Any] | None = None
 
+    def select_response(self, amazon_session: "AmazonSession", amazon_session_response: AmazonSessionResponse) -> bool:
+        """
+        Select the ``<form>`` from the given response. By default, this calls :func:`select_form` with its parsed
+        HTML, but a form that can be recognized without parsing the response may override it.
+
+        :param amazon_session: The ``AmazonSession`` on which to submit the form.
+        :param amazon_session_response: The response from which to select the ``<form>``.
+        :return: Whether the ``<form>`` selection was successful.
+        """
+        return self.select_form(amazon_session, amazon_session_response.parsed)
+
     def select_form(self, amazon_session: "AmazonSession", parsed: Tag) -> bool:
         """
         Using the ``selector`` defined on this instance, select the ``<form>`` for the given :class:`~bs4.Tag`.
@@ -166,6 +181,8 @@ class AuthForm(ABC):
 
 
 class SignInForm(AuthForm):
+    response_type = util.ResponseClassifier.SIGN_IN_REDIRECT
+
     def __init__(
         self, config: AmazonOrdersConfig, selector: str | None = None, solution_attr_key: str = "email"
     ) -> None:
@@ -206,6 +223,8 @@ class MfaDeviceSelectForm(AuthForm):
     each of ``input`` tag.
     """
 
+    response_type = util.ResponseClassifier.MFA
+
     def __init__(
         self, config: AmazonOrdersConfig, selector: str | None = None, solution_attr_key: str = "otpDeviceContext"
     ) -> None:
@@ -247,6 +266,8 @@ class MfaDeviceSelectForm(AuthForm):
 
 
 class MfaForm(AuthForm):
+    response_type = util.ResponseClassifier.MFA
+
     def __init__(
         self, config: AmazonOrdersConfig, selector: str | None = None, solution_attr_key: str = "otpCode"
     ) -> None:
@@ -283,6 +304,8 @@ class MfaForm(AuthForm):
 
 
 class CaptchaForm(AuthForm):
+    response_type = util.ResponseClassifier.CAPTCHA
+
     def __init__(
         self,
         config: AmazonOrdersConfig,
@@ -335,21 +358,41 @@ class CaptchaForm(AuthForm):
 
 
 class JSAuthBlocker(AuthForm):
-    def __init__(self, config: AmazonOrdersConfig, regex: str) -> None:
+    """
+    Raises when the page is a JavaScript-based bot challenge, which cannot be solved. By default, the challenge is
+    recognized from the response's classification (see :class:`~amazonorders.util.ResponseClassifier`), without
+    parsing it. If a ``regex`` is given, it is searched for in the page's text instead.
+    """
+
+    response_type = util.ResponseClassifier.BOT_CHALLENGE
+
+    def __init__(self, config: AmazonOrdersConfig, regex: str | None = None) -> None:
         self.regex = regex
 
         super().__init__(config, None)
 
+    def select_response(self, amazon_session: "AmazonSession", amazon_session_response: AmazonSessionResponse) -> bool:
+        if self.regex:
+            return super().select_response(amazon_session, amazon_session_response)
+
+        if amazon_session_response.response_type == util.ResponseClassifier.BOT_CHALLENGE:
+            self._raise_challenge_error()
+
+        return False
+
     def select_form(self, amazon_session: "AmazonSession", parsed: Tag) -> bool:
         if not self.regex:
             raise AmazonOrdersError("Must set a regex first.")  # pragma: no cover
 
         if re.search(self.regex, parsed.text):
-            raise AmazonOrdersAuthError(
-                "A JavaScript-based authentication challenge page has been found. This "
-                "library cannot solve these challenges. See "
-                "https://amazon-orders.readthedocs.io/troubleshooting.html"
-                "#captcha-keep-blocking-automated-login for more details."
-            )
+            self._raise_challenge_error()
 
         return False
+
+    def _raise_challenge_error(self) -> None:
+        raise AmazonOrdersAuthError(
+            "A JavaScript-based authentication challenge page has been found. This "
+            "library cannot solve these challenges. See "
+            "https://amazon-orders.readthedocs.io/troubleshooting.html"
+            "#captcha-keep-blocking-automated-login for more details."
+        )
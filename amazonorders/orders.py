@@ -2,22 +2,29 @@ __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
 import asyncio
+import collections
 import concurrent.futures
 import datetime
+import functools
 import logging
-from collections.abc import Callable
-from typing import Any
+import urllib.parse
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Any, TypeVar
 
 from bs4 import Tag
 
-from amazonorders import util
+from amazonorders import util, workers
+from amazonorders.checkpoint import Checkpoint
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.order import Order
-from amazonorders.exception import AmazonOrdersError, AmazonOrdersNotFoundError
+from amazonorders.exception import AmazonOrdersAuthRedirectError, AmazonOrdersError, AmazonOrdersNotFoundError
 from amazonorders.session import AmazonSession
+from amazonorders.util import AmazonSessionResponse
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class AmazonOrders:
     """
@@ -43,39 +50,142 @@ class AmazonOrders:
         if self.debug:
             logger.setLevel(logging.DEBUG)
 
-    def get_order(self, order_id: str, clone: Order | None = None) -> Order:
+    def get_order(self, order_id: str, clone: Order | None = None, fields: Iterable[str] | None = None) -> Order:
         """
         Get the full details for a given Amazon Order ID.
 
         :param order_id: The Amazon Order ID to lookup.
         :param clone: If a partially populated version of the Order has already been fetched from history.
+        :param fields: If given, only these fields are parsed (see :attr:`~amazonorders.entity.order.Order.FIELDS`),
+            and the rest are left ``None``.
         :return: The requested Order.
         """
         if not self.amazon_session.is_authenticated:
             raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
 
+        fields = self._validate_fields(fields)
+
         meta = {"index": clone.index} if clone else None
 
         order_details_response = self.amazon_session.get(
-            f"{self.config.constants.ORDER_DETAILS_URL}?orderID={order_id}"
+            f"{self.config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+            parse_only=self.config.selectors.ORDER_DETAILS_PAGE_SELECTOR,
+            lazy_parse=bool(self.config.parse_workers),
         )
-        self.amazon_session.check_response(order_details_response, meta=meta)
 
-        if not order_details_response.response.url.startswith(self.config.constants.ORDER_DETAILS_URL):
-            raise AmazonOrdersNotFoundError(
-                f"Amazon redirected, which likely means Order {order_id} was not found.", meta=meta
+        return self._build_order_details(order_id, order_details_response, clone, meta, fields)
+
+    async def aget_order(
+        self, order_id: str, clone: Order | None = None, fields: Iterable[str] | None = None
+    ) -> Order:
+        """
+        The awaitable version of :func:`get_order`, which can be used from an already running event loop.
+
+        :param order_id: The Amazon Order ID to lookup.
+        :param clone: If a partially populated version of the Order has already been fetched from history.
+        :param fields: If given, only these fields are parsed.
+        :return: The requested Order.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        fields = self._validate_fields(fields)
+
+        meta = {"index": clone.index} if clone else None
+
+        order_details_response = await self.amazon_session.aget(
+            f"{self.config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+            parse_only=self.config.selectors.ORDER_DETAILS_PAGE_SELECTOR,
+            lazy_parse=bool(self.config.parse_workers),
+        )
+
+        if self.amazon_session.parse_executor:
+            # Await the parse worker here, rather than holding an executor thread while it builds the Order
+            await self._async_wrapper(self._check_order_details_response, order_id, order_details_response, meta)
+            return await self._abuild_in_parse_worker(
+                workers.build_order_details,
+                order_details_response,
+                order_id,
+                workers.dumps(clone, self.config) if clone else None,
+                fields,
             )
 
-        order_details_tag = util.select_one(
-            order_details_response.parsed, self.config.selectors.ORDER_DETAILS_ENTITY_SELECTOR
+        return await self._async_wrapper(
+            self._build_order_details, order_id, order_details_response, clone, meta, fields
         )
 
-        if not order_details_tag:
-            raise AmazonOrdersError(f"Could not parse details for Order {order_id}. Check if Amazon changed the HTML.")
+    def get_orders(
+        self, order_ids: Iterable[str], max_concurrency: int | None = None
+    ) -> dict[str, Order | AmazonOrdersError]:
+        """
+        Get the full details for many Amazon Order IDs at once, fetching them concurrently on the session's
+        :attr:`~amazonorders.session.AmazonSession.executor`.
 
-        order: Order = self.config.order_cls(order_details_tag, self.config, full_details=True, clone=clone)
+        A failure for one Order (ex. it was not found, or could not be parsed) does not abort the batch. Instead, the
+        error is returned in place of that Order, with ``order_id`` in its
+        :attr:`~amazonorders.exception.AmazonOrdersError.meta`. If the session expires mid-batch, however,
+        :class:`~amazonorders.exception.AmazonOrdersAuthRedirectError` is still raised, since every remaining Order
+        would fail the same way.
 
-        return order
+        :param order_ids: The Amazon Order IDs to lookup. Duplicates are only fetched once.
+        :param max_concurrency: The maximum number of Orders to fetch at once, defaults to ``thread_pool_size``.
+        :return: A dict of each Order ID to its Order, or the error that prevented fetching it, in the order given.
+        """
+        order_ids = list(order_ids)
+
+        return self._order_results(
+            order_ids, self._iter_sync(self._build_orders_batch_async(order_ids, max_concurrency))
+        )
+
+    async def aget_orders(
+        self, order_ids: Iterable[str], max_concurrency: int | None = None
+    ) -> dict[str, Order | AmazonOrdersError]:
+        """
+        The awaitable version of :func:`get_orders`, which can be used from an already running event loop.
+
+        :param order_ids: The Amazon Order IDs to lookup. Duplicates are only fetched once.
+        :param max_concurrency: The maximum number of Orders to fetch at once, defaults to ``thread_pool_size``.
+        :return: A dict of each Order ID to its Order, or the error that prevented fetching it, in the order given.
+        """
+        order_ids = list(order_ids)
+
+        results = [result async for result in self._build_orders_batch_async(order_ids, max_concurrency)]
+
+        return self._order_results(order_ids, results)
+
+    def prefetch(self, orders: Iterable[Order], max_concurrency: int | None = None) -> dict[str, AmazonOrdersError]:
+        """
+        Load the details for many lazy Orders (see ``lazy_details`` in :func:`get_order_history`) at once, fetching
+        them concurrently rather than one at a time as each is accessed. Orders whose details are already loaded are
+        not fetched again.
+
+        :param orders: The Orders for which to load details.
+        :param max_concurrency: The maximum number of Orders to fetch at once, defaults to ``thread_pool_size``.
+        :return: A dict of each Order number whose details could not be fetched to its error. Those Orders are left
+            lazy, so their details are requested again when next accessed.
+        """
+        pending_orders = [order for order in orders if order.details_pending]
+
+        results = self.get_orders([order.order_number for order in pending_orders], max_concurrency)
+
+        return self._apply_order_details(pending_orders, results)
+
+    async def aprefetch(
+        self, orders: Iterable[Order], max_concurrency: int | None = None
+    ) -> dict[str, AmazonOrdersError]:
+        """
+        The awaitable version of :func:`prefetch`, which can be used from an already running event loop. Since
+        accessing a lazy Order's details blocks while they are fetched, async code should prefetch them first.
+
+        :param orders: The Orders for which to load details.
+        :param max_concurrency: The maximum number of Orders to fetch at once, defaults to ``thread_pool_size``.
+        :return: A dict of each Order number whose details could not be fetched to its error.
+        """
+        pending_orders = [order for order in orders if order.details_pending]
+
+        results = await self.aget_orders([order.order_number for order in pending_orders], max_concurrency)
+
+        return self._apply_order_details(pending_orders, results)
 
     def get_order_history(
         self,
@@ -84,6 +194,15 @@ class AmazonOrders:
         full_details: bool = False,
         keep_paging: bool = True,
         time_filter: str | None = None,
+        since_order: str | None = None,
+        since_date: datetime.date | None = None,
+        checkpoint: str | None = None,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+        parallel_pages: bool = False,
+        details_filter: Callable[[Order], bool] | None = None,
+        lazy_details: bool = False,
+        fields: Iterable[str] | None = None,
     ) -> list[Order]:
         """
         Get the Amazon Order history for a given year.
@@ -97,78 +216,1118 @@ class AmazonOrders:
             request per Order.
         :param keep_paging: ``False`` if only one page should be fetched.
         :param time_filter: Override year-based filtering. Supported values: 'last30', 'months-3', 'year-YYYY'.
+        :param since_order: The number of the newest Order already known (ex. from a previous sync). The history is
+            newest first, so once this Order is reached, it and all older Orders are omitted, no further pages are
+            requested, and no details are fetched for them.
+        :param since_date: Like ``since_order``, but stops at the first Order placed before this date. Orders placed
+            on ``since_date`` are still returned.
+        :param checkpoint: A path at which to checkpoint progress. If the crawl errors out (or the process dies),
+            calling this method again with the same parameters and ``checkpoint`` resumes it, without re-fetching the
+            pages and Orders that were already fetched. The checkpoint is deleted once the crawl completes.
+        :param on_error: What to do when an individual Order fails to build (ex. its details request fails). ``raise``
+            (the default) raises the error, discarding the rest of the history. ``skip`` logs a warning and omits the
+            Order. ``collect`` omits the Order and appends the error to ``errors``, with ``index`` and
+            ``order_number`` in its :attr:`~amazonorders.exception.AmazonOrdersError.meta`. Errors fetching a history
+            page are always raised.
+        :param errors: The list to which errors are appended with ``on_error="collect"``, which is required then. Pass
+            a new list to each crawl, so that concurrent crawls don't mix their errors.
+        :param parallel_pages: ``True`` if, once the first page is fetched, the remaining pages should be requested
+            concurrently (using the Order count on the first page, and up to ``thread_pool_size`` at a time), rather
+            than following each page's link to the next. Falls back to following links if the count is missing or
+            the page size isn't as expected, and is ignored with ``since_order`` or ``since_date``.
+        :param details_filter: If given, full details are only fetched for the Orders for which this returns ``True``
+            (implying ``full_details``). It is passed each Order as built from the history page, so it can only use
+            fields populated there (ex. ``grand_total``, ``order_placed_date``, ``recipient``, or Item titles).
+        :param lazy_details: ``True`` if Orders that aren't fetched with full details should instead fetch their
+            details page the first time one of their :attr:`~amazonorders.entity.order.Order.FULL_DETAILS_FIELDS`
+            is accessed. Use :func:`prefetch` to load the details for many such Orders concurrently.
+        :param fields: If given, only these fields are parsed (see :attr:`~amazonorders.entity.order.Order.FIELDS`),
+            and the rest are left ``None``. Details pages are only fetched if one of the requested fields is only
+            populated with full details, so ex. ``fields=["order_placed_date", "grand_total"]`` never fetches them.
         :return: A list of the requested Orders.
         """
+        return list(
+            self.iter_order_history(
+                year=year,
+                start_index=start_index,
+                full_details=full_details,
+                keep_paging=keep_paging,
+                time_filter=time_filter,
+                since_order=since_order,
+                since_date=since_date,
+                checkpoint=checkpoint,
+                on_error=on_error,
+                errors=errors,
+                parallel_pages=parallel_pages,
+                details_filter=details_filter,
+                lazy_details=lazy_details,
+                fields=fields,
+            )
+        )
+
+    async def aget_order_history(
+        self,
+        year: int = datetime.date.today().year,
+        start_index: int | None = None,
+        full_details: bool = False,
+        keep_paging: bool = True,
+        time_filter: str | None = None,
+        since_order: str | None = None,
+        since_date: datetime.date | None = None,
+        checkpoint: str | None = None,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+        parallel_pages: bool = False,
+        details_filter: Callable[[Order], bool] | None = None,
+        lazy_details: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> list[Order]:
+        """
+        The awaitable version of :func:`get_order_history`, which can be used from an already running event loop.
+
+        :param year: The year for which to get history (ignored if time_filter is provided).
+        :param start_index: The index of the Order from which to start fetching in the history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param time_filter: Override year-based filtering. Supported values: 'last30', 'months-3', 'year-YYYY'.
+        :param since_order: The number of the newest Order already known, at which to stop.
+        :param since_date: The date before which Orders are already known, at which to stop.
+        :param checkpoint: A path at which to checkpoint progress, and from which to resume.
+        :param on_error: ``raise``, ``skip``, or ``collect`` errors building individual Orders.
+        :param errors: The list to which errors are appended with ``on_error="collect"``.
+        :param parallel_pages: ``True`` if remaining pages should be requested concurrently, based on the Order count.
+        :param details_filter: If given, full details are only fetched for the Orders for which this returns ``True``.
+        :param lazy_details: ``True`` if Orders without full details should fetch them on first access.
+        :param fields: If given, only these fields are parsed.
+        :return: A list of the requested Orders.
+        """
+        return [
+            order
+            async for order in self.aiter_order_history(
+                year=year,
+                start_index=start_index,
+                full_details=full_details,
+                keep_paging=keep_paging,
+                time_filter=time_filter,
+                since_order=since_order,
+                since_date=since_date,
+                checkpoint=checkpoint,
+                on_error=on_error,
+                errors=errors,
+                parallel_pages=parallel_pages,
+                details_filter=details_filter,
+                lazy_details=lazy_details,
+                fields=fields,
+            )
+        ]
+
+    def iter_order_history(
+        self,
+        year: int = datetime.date.today().year,
+        start_index: int | None = None,
+        full_details: bool = False,
+        keep_paging: bool = True,
+        time_filter: str | None = None,
+        as_completed: bool = False,
+        since_order: str | None = None,
+        since_date: datetime.date | None = None,
+        checkpoint: str | None = None,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+        parallel_pages: bool = False,
+        details_filter: Callable[[Order], bool] | None = None,
+        lazy_details: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[Order]:
+        """
+        Get the Amazon Order history for a given year, yielding each Order as soon as it is built rather than
+        waiting for the entire history to be fetched. Breaking out of the iteration early cancels any pending work.
+
+        See :func:`get_order_history` for details on the shared parameters.
+
+        :param year: The year for which to get history (ignored if time_filter is provided).
+        :param start_index: The index of the Order from which to start fetching in the history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param time_filter: Override year-based filtering. Supported values: 'last30', 'months-3', 'year-YYYY'.
+        :param since_order: The number of the newest Order already known, at which to stop.
+        :param since_date: The date before which Orders are already known, at which to stop.
+        :param checkpoint: A path at which to checkpoint progress, and from which to resume.
+        :param on_error: ``raise``, ``skip``, or ``collect`` errors building individual Orders.
+        :param errors: The list to which errors are appended with ``on_error="collect"``.
+        :param parallel_pages: ``True`` if remaining pages should be requested concurrently, based on the Order count.
+        :param details_filter: If given, full details are only fetched for the Orders for which this returns ``True``.
+        :param lazy_details: ``True`` if Orders without full details should fetch them on first access.
+        :param fields: If given, only these fields are parsed.
+        :param as_completed: ``True`` if Orders should be yielded in the order they finish building, rather than the
+            order they appear in the history. This gives the lowest time to first result.
+        :return: An iterator of the requested Orders.
+        """
+        orders = self.aiter_order_history(
+            year=year,
+            start_index=start_index,
+            full_details=full_details,
+            keep_paging=keep_paging,
+            time_filter=time_filter,
+            as_completed=as_completed,
+            since_order=since_order,
+            since_date=since_date,
+            checkpoint=checkpoint,
+            on_error=on_error,
+            errors=errors,
+            parallel_pages=parallel_pages,
+            details_filter=details_filter,
+            lazy_details=lazy_details,
+            fields=fields,
+        )
+
+        return self._iter_sync(orders)
+
+    def aiter_order_history(
+        self,
+        year: int = datetime.date.today().year,
+        start_index: int | None = None,
+        full_details: bool = False,
+        keep_paging: bool = True,
+        time_filter: str | None = None,
+        as_completed: bool = False,
+        since_order: str | None = None,
+        since_date: datetime.date | None = None,
+        checkpoint: str | None = None,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+        parallel_pages: bool = False,
+        details_filter: Callable[[Order], bool] | None = None,
+        lazy_details: bool = False,
+        fields: Iterable[str] | None = None,
+    ) -> AsyncIterator[Order]:
+        """
+        The async flavour of :func:`iter_order_history`, for use with ``async for``.
+
+        :param year: The year for which to get history (ignored if time_filter is provided).
+        :param start_index: The index of the Order from which to start fetching in the history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param time_filter: Override year-based filtering. Supported values: 'last30', 'months-3', 'year-YYYY'.
+        :param since_order: The number of the newest Order already known, at which to stop.
+        :param since_date: The date before which Orders are already known, at which to stop.
+        :param checkpoint: A path at which to checkpoint progress, and from which to resume.
+        :param on_error: ``raise``, ``skip``, or ``collect`` errors building individual Orders.
+        :param errors: The list to which errors are appended with ``on_error="collect"``.
+        :param parallel_pages: ``True`` if remaining pages should be requested concurrently, based on the Order count.
+        :param details_filter: If given, full details are only fetched for the Orders for which this returns ``True``.
+        :param lazy_details: ``True`` if Orders without full details should fetch them on first access.
+        :param fields: If given, only these fields are parsed.
+        :param as_completed: ``True`` if Orders should be yielded in the order they finish building, rather than the
+            order they appear in the history.
+        :return: An async iterator of the requested Orders.
+        """
         if not self.amazon_session.is_authenticated:
             raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
 
-        optional_start_index = f"&startIndex={start_index}" if start_index else ""
+        self._validate_on_error(on_error, errors)
+        self._validate_max_pending_order_tasks()
+
+        fields = self._validate_fields(fields)
+        if fields is not None and since_date:
+            # Needed to know where the new Orders end
+            fields |= {"order_placed_date"}
 
         # Use time_filter if provided, otherwise default to year-based filtering
         filter_value = time_filter if time_filter else f"year-{year}"
 
-        next_page: str | None = (
-            f"{self.config.constants.ORDER_HISTORY_URL}?{self.config.constants.HISTORY_FILTER_QUERY_PARAM}={filter_value}{optional_start_index}"
-        )
+        next_page: str | None = self._get_order_history_url(filter_value, start_index)
 
         current_index = int(start_index) if start_index else 0
 
-        return asyncio.run(self._build_orders_async(next_page, keep_paging, full_details, current_index))
+        order_history_checkpoint = None
+        if checkpoint:
+            order_history_checkpoint = Checkpoint(
+                checkpoint,
+                {
+                    "crawl": "order_history",
+                    "filter": filter_value,
+                    "start_index": current_index,
+                    "full_details": full_details,
+                    "keep_paging": keep_paging,
+                    "since_order": since_order,
+                    "since_date": since_date,
+                    "fields": sorted(fields) if fields is not None else None,
+                    "on_error": on_error,
+                    "parallel_pages": parallel_pages,
+                    "details_filter": self._get_callable_name(details_filter) if details_filter else None,
+                    "lazy_details": lazy_details,
+                },
+                self.config,
+            )
+
+        return self._build_orders_async(
+            next_page,
+            keep_paging,
+            full_details,
+            current_index,
+            as_completed,
+            since_order=since_order,
+            since_date=since_date,
+            checkpoint=order_history_checkpoint,
+            on_error=on_error,
+            errors=errors,
+            parallel_pages=parallel_pages,
+            details_filter=details_filter,
+            lazy_details=lazy_details,
+            fields=fields,
+        )
 
-    async def _build_orders_async(
-        self, next_page: str | None, keep_paging: bool, full_details: bool, current_index: int
+    def get_order_history_range(
+        self,
+        start_year: int,
+        end_year: int = datetime.date.today().year,
+        full_details: bool = False,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
     ) -> list[Order]:
-        order_tasks = []
+        """
+        Get the Amazon Order history for every year from ``start_year`` to ``end_year`` (inclusive). Years are
+        crawled concurrently, sharing the session's :attr:`~amazonorders.session.AmazonSession.executor` (and so its
+        concurrency budget), and years in which no Orders were placed are skipped after a single request.
 
-        while next_page:
-            page_response = self.amazon_session.get(next_page)
-            self.amazon_session.check_response(page_response, meta={"index": current_index})
+        Orders are returned newest first (``end_year`` first), as they would appear in the history. Note that
+        :attr:`~amazonorders.entity.order.Order.index` is the Order's index within its year's history.
 
-            order_tags = util.select(page_response.parsed, self.config.selectors.ORDER_HISTORY_ENTITY_SELECTOR)
+        :param start_year: The first year for which to get history.
+        :param end_year: The last year for which to get history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param on_error: What to do when an individual Order fails to build, like in :func:`get_order_history`.
+            Errors also have the Order's ``year`` in their :attr:`~amazonorders.exception.AmazonOrdersError.meta`.
+        :param errors: The list to which errors are appended with ``on_error="collect"``.
+        :return: A list of the requested Orders.
+        """
+        return list(
+            self.iter_order_history_range(
+                start_year, end_year, full_details=full_details, on_error=on_error, errors=errors
+            )
+        )
 
-            if not order_tags:
-                order_count_tag = util.select_one(
-                    page_response.parsed, self.config.selectors.ORDER_HISTORY_COUNT_SELECTOR
-                )
-                if order_count_tag and order_count_tag.text.startswith("0 "):
-                    break
-                else:
-                    raise AmazonOrdersError("Could not parse Order history. Check if Amazon changed the HTML.")
+    def iter_order_history_range(
+        self,
+        start_year: int,
+        end_year: int = datetime.date.today().year,
+        full_details: bool = False,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+    ) -> Iterator[Order]:
+        """
+        The streaming version of :func:`get_order_history_range`, yielding each Order as soon as it is built (and all
+        Orders from newer years have been yielded).
 
-            for order_tag in order_tags:
-                order_tasks.append(self._async_wrapper(self._build_order, order_tag, full_details, current_index))
+        :param start_year: The first year for which to get history.
+        :param end_year: The last year for which to get history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param on_error: ``raise``, ``skip``, or ``collect`` errors building individual Orders.
+        :param errors: The list to which errors are appended with ``on_error="collect"``.
+        :return: An iterator of the requested Orders.
+        """
+        return self._iter_sync(
+            self.aiter_order_history_range(
+                start_year, end_year, full_details=full_details, on_error=on_error, errors=errors
+            )
+        )
 
-                current_index += 1
+    def aiter_order_history_range(
+        self,
+        start_year: int,
+        end_year: int = datetime.date.today().year,
+        full_details: bool = False,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+    ) -> AsyncIterator[Order]:
+        """
+        The async flavour of :func:`iter_order_history_range`, for use with ``async for``.
 
-            next_page = None
-            if keep_paging:
-                next_page_tag = util.select_one(page_response.parsed, self.config.selectors.NEXT_PAGE_LINK_SELECTOR)
-                if next_page_tag:
-                    next_page = str(next_page_tag["href"])
-                    if not next_page.startswith("http"):
-                        next_page = f"{self.config.constants.BASE_URL}{next_page}"
-                else:
-                    logger.debug("No next page")
+        :param start_year: The first year for which to get history.
+        :param end_year: The last year for which to get history.
+        :param full_details: Get the full details for each Order in the history. This will execute an additional
+            request per Order.
+        :param on_error: ``raise``, ``skip``, or ``collect`` errors building individual Orders.
+        :param errors: The list to which errors are appended with ``on_error="collect"``.
+        :return: An async iterator of the requested Orders.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        if start_year > end_year:
+            raise AmazonOrdersError(f"start_year {start_year} must not be after end_year {end_year}.")
+
+        self._validate_on_error(on_error, errors)
+        self._validate_max_pending_order_tasks()
+
+        return self._build_orders_range_async(
+            list(range(end_year, start_year - 1, -1)), full_details, on_error, errors
+        )
+
+    async def _build_orders_range_async(
+        self, years: list[int], full_details: bool, on_error: str, errors: list[AmazonOrdersError] | None
+    ) -> AsyncIterator[Order]:
+        # The newest year is needed first regardless, and its page tells us which years the account has history for
+        first_page_response = await self._aget_order_history_page(self._get_order_history_url(f"year-{years[0]}"), 0)
+
+        available_years = self._get_order_history_years(first_page_response)
+        if available_years:
+            skipped_years = [year for year in years[1:] if year not in available_years]
+            if skipped_years:
+                logger.debug(f"Skipping years with no Order history: {skipped_years}")
+            years = [years[0]] + [year for year in years[1:] if year in available_years]
+
+        end_of_year = object()
+        queues: list[asyncio.Queue] = []
+        year_tasks: list[asyncio.Future] = []
+
+        async def crawl_year(
+            year: int, queue: asyncio.Queue, page_response: AmazonSessionResponse | None = None
+        ) -> None:
+            orders = self._build_orders_async(
+                self._get_order_history_url(f"year-{year}"),
+                True,
+                full_details,
+                0,
+                first_page_response=page_response,
+                on_error=on_error,
+                errors=errors,
+                # Each year's history is indexed from 0, so the year is needed to tell where an Order was
+                error_meta={"year": year},
+            )
+            try:
+                async for order in orders:
+                    await queue.put(order)
+            except Exception as e:
+                await queue.put(e)
             else:
-                logger.debug("keep_paging is False, not paging")
+                await queue.put(end_of_year)
+            finally:
+                await orders.aclose()  # type: ignore[attr-defined]
+
+        for i, year in enumerate(years):
+            # Bounding each year's queue means years that aren't being yielded yet only run ahead so far
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self.config.max_pending_order_tasks)
+            queues.append(queue)
+            year_tasks.append(asyncio.ensure_future(crawl_year(year, queue, first_page_response if i == 0 else None)))
+
+        try:
+            # Years don't overlap, so yielding each year in turn is a date-ordered merge
+            for queue in queues:
+                while True:
+                    item = await queue.get()
+                    if item is end_of_year:
+                        break
+                    elif isinstance(item, Exception):
+                        raise item
+
+                    yield item
+        finally:
+            for year_task in year_tasks:
+                year_task.cancel()
+            await asyncio.gather(*year_tasks, return_exceptions=True)
+
+    async def _build_orders_async(
+        self,
+        next_page: str | None,
+        keep_paging: bool,
+        full_details: bool,
+        current_index: int,
+        as_completed: bool = False,
+        first_page_response: AmazonSessionResponse | None = None,
+        since_order: str | None = None,
+        since_date: datetime.date | None = None,
+        checkpoint: Checkpoint | None = None,
+        on_error: str = "raise",
+        errors: list[AmazonOrdersError] | None = None,
+        parallel_pages: bool = False,
+        details_filter: Callable[[Order], bool] | None = None,
+        lazy_details: bool = False,
+        fields: frozenset[str] | None = None,
+        error_meta: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Order]:
+        # Each requested page's URL, the index of its first Order, and its fetch, which are processed in order
+        page_tasks: collections.deque[tuple[str | None, int, asyncio.Future]] = collections.deque()
+        fanned_out = False
+        # With parallel_pages, the remaining pages that haven't been fetched yet. Only thread_pool_size pages are
+        # fetched (or fetched, but not yet processed) at once, so that they aren't all held in memory together
+        fan_out_queue: collections.deque[tuple[str, int]] = collections.deque()
+        # When stream_history_pages is enabled, maps each page's fetch to the cards streamed from it that haven't been
+        # queued yet, and to how many have been. Cards are only streamed when the window isn't needed to find where
+        # new Orders end, and when they aren't built in parse workers
+        stream_pages = (
+            self.config.stream_history_pages and not (since_order or since_date) and not self.config.parse_workers
+        )
+        streamed_tags: dict[asyncio.Future, collections.deque[Tag]] = {}
+        streamed_counts: dict[asyncio.Future, int] = {}
+        tag_streamed = asyncio.Event()
+        tag_streamed_task: asyncio.Future | None = None
+        loop = asyncio.get_running_loop()
 
-        return await asyncio.gather(*order_tasks)
+        def fetch_page(page: str, start_index: int) -> None:
+            page_tags: collections.deque[Tag] = collections.deque()
 
-    def _build_order(self, order_tag: list[Tag], full_details: bool, current_index: int) -> Order:
-        order: Order = self.config.order_cls(order_tag, self.config, index=current_index)
+            def on_element(order_tag: Tag) -> None:
+                # Called from the thread reading the page, as each card arrives
+                page_tags.append(order_tag)
+                loop.call_soon_threadsafe(tag_streamed.set)
 
-        if full_details:
-            if len(util.select(order.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0:
-                logger.warning(
-                    f"Order {order.order_number} was partially populated, since it is an unsupported Order type."
-                )
+            page_task = asyncio.ensure_future(
+                self._aget_order_history_page(page, start_index, on_element if stream_pages else None)
+            )
+            page_tasks.append((page, start_index, page_task))
+            if stream_pages:
+                streamed_tags[page_task] = page_tags
+                streamed_counts[page_task] = 0
+
+        def fetch_fan_out_pages() -> None:
+            while fan_out_queue and len(page_tasks) < self.config.thread_pool_size:
+                fetch_page(*fan_out_queue.popleft())
+
+        # Each queued Order's tag and index, its history card if it had to be built early (or the error building it),
+        # and whether it's an unsupported Order type. Orders built in a parse worker have no tag, so the worker checks
+        # their type instead
+        queued_tags: collections.deque[
+            tuple[Tag | None, int, Order | AmazonOrdersError | None, bool | None]
+        ] = collections.deque()
+        # Maps each in-flight Order task to its index in the history
+        pending_tasks: dict[asyncio.Future, int] = {}
+        # Orders that have been built but not yet yielded, keyed by their index in the history (or None, if the Order
+        # failed and on_error isn't "raise", so that it's skipped)
+        completed_orders: dict[int, Order | None] = {}
+        # Orders already built by a previous run of this crawl, keyed by their index in the history, which are
+        # released as they're yielded
+        checkpointed_orders: dict[int, Order] = {}
+        completed = False
+
+        if checkpoint:
+            if checkpoint.resumed:
+                next_page, current_index = self._resume_order_history_checkpoint(checkpoint, next_page, current_index)
+                checkpointed_orders = checkpoint.records.pop("orders", {})
+                for index in checkpoint.records.pop("lazy_orders", {}):
+                    # Details loaders aren't pickled, so they're reattached
+                    order = checkpointed_orders.get(index)
+                    if order:
+                        order._set_details_loader(
+                            functools.partial(self.get_order, order.order_number, clone=order, fields=fields)
+                        )
             else:
-                order = self.get_order(order.order_number, clone=order)
+                # Each page is recorded (in "pages", by its position in the crawl) as its URL, the index of its first
+                # Order, and its number of Orders, and each built Order is recorded (in "orders") by its index, along
+                # with whether it's lazy (in "lazy_orders")
+                checkpoint.state = {"page_count": 0, "next_page": next_page}
+
+        next_index = current_index
+
+        if first_page_response:
+            first_page_task = asyncio.get_running_loop().create_future()
+            first_page_task.set_result(first_page_response)
+            page_tasks.append((next_page, current_index, first_page_task))
+        elif next_page:
+            fetch_page(next_page, current_index)
+
+        try:
+            # Orders from pages that were completed by a previous run are yielded without fetching those pages again
+            for index in sorted(checkpointed_orders):
+                if index < current_index:
+                    yield checkpointed_orders.pop(index)
+
+            while page_tasks or queued_tags or pending_tasks:
+                if page_tasks and page_tasks[0][2] in streamed_tags:
+                    # Only the first page's cards are queued early, so the queue stays in index order
+                    _, head_start_index, head_task = page_tasks[0]
+                    head_tags = streamed_tags[head_task]
+                    while head_tags:
+                        queued_tags.append(
+                            (head_tags.popleft(), head_start_index + streamed_counts[head_task], None, None)
+                        )
+                        streamed_counts[head_task] += 1
+
+                # Completed but not yet yielded Orders count towards the window too, so that the reorder buffer
+                # stays bounded when an early Order is slow to build
+                while queued_tags and (
+                    len(pending_tasks) + len(completed_orders) < self.config.max_pending_order_tasks
+                ):
+                    order_tag, index, order, skip_items = queued_tags.popleft()
+                    if index in checkpointed_orders:
+                        completed_orders[index] = checkpointed_orders.pop(index)
+                        continue
+                    if isinstance(order, AmazonOrdersError):
+                        # It already failed in a parse worker, so it fails here, where on_error applies
+                        order_task = loop.create_future()
+                        order_task.set_exception(order)
+                        pending_tasks[order_task] = index
+                        continue
+                    order_task = asyncio.ensure_future(
+                        self._abuild_order(
+                            order_tag, full_details, index, order, details_filter, lazy_details, fields, skip_items
+                        )
+                    )
+                    pending_tasks[order_task] = index
+
+                waiting = set(pending_tasks)
+                if page_tasks:
+                    # Pages are processed in order, so later pages that have already been fetched wait for this one
+                    waiting.add(page_tasks[0][2])
+                    if page_tasks[0][2] in streamed_tags:
+                        # Also wake up when the page streams a card, rather than waiting for the whole page
+                        if tag_streamed_task is None or tag_streamed_task.done():
+                            tag_streamed_task = asyncio.ensure_future(tag_streamed.wait())
+                        waiting.add(tag_streamed_task)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                tag_streamed.clear()
+
+                for task in done:
+                    if task is tag_streamed_task:
+                        continue
+                    elif page_tasks and task is page_tasks[0][2]:
+                        page_url, current_index, _ = page_tasks.popleft()
+                        fetch_fan_out_pages()
+                        page_response = task.result()
+                        streamed_tags.pop(task, None)
+                        # The cards that were streamed were already queued
+                        streamed_count = streamed_counts.pop(task, 0)
+
+                        # Each card's tag, its Order if it has already been built (or the error building it), and
+                        # whether it's an unsupported Order type, if it was checked in a parse worker
+                        page_orders: list[tuple[Tag | None, Order | AmazonOrdersError | None, bool | None]]
+                        if self.config.parse_workers:
+                            # The page is only parsed in a parse worker, which builds its Orders and returns them
+                            # with what's needed to page, so the page isn't parsed here as well
+                            worker_orders, next_page_href, order_count_text = await self._abuild_in_parse_worker(
+                                workers.build_orders, page_response, current_index, fields
+                            )
+                            page_orders = [(None, order, skip_items) for order, skip_items in worker_orders]
+                        else:
+                            if page_response.elements is not None:
+                                order_tags = page_response.elements
+                            else:
+                                order_tags = util.select(
+                                    page_response.parsed, self.config.selectors.ORDER_HISTORY_ENTITY_SELECTOR
+                                )
+                            page_orders = [(order_tag, None, None) for order_tag in order_tags]
+                            next_page_href, order_count_text = self._get_history_page_links(page_response)
+
+                        if not page_orders:
+                            if order_count_text and order_count_text.startswith("0 "):
+                                if checkpoint:
+                                    self._record_order_history_page(checkpoint, page_url, current_index, 0, page_tasks)
+                                continue
+                            else:
+                                raise AmazonOrdersError(
+                                    "Could not parse Order history. Check if Amazon changed the HTML."
+                                )
+
+                        page_start_index = current_index
+                        reached_known_order = False
+                        if since_order or since_date:
+                            if not self.config.parse_workers:
+                                # The cards are needed up front to know where the new Orders end, but they're cheap
+                                # compared to a details request, and are reused rather than being built again
+                                built_orders = await self._async_wrapper(
+                                    self._build_orders_page, order_tags, current_index, fields
+                                )
+                                page_orders = [
+                                    (order_tag, order, None) for order_tag, order in zip(order_tags, built_orders)
+                                ]
+                            for order_tag, order, skip_items in page_orders:
+                                if isinstance(order, Order) and self._is_known_order(order, since_order, since_date):
+                                    logger.debug(f"Reached known Order {order.order_number}, not paging")
+                                    reached_known_order = True
+                                    break
+
+                                queued_tags.append((order_tag, current_index, order, skip_items))
+                                current_index += 1
+                        else:
+                            current_index += streamed_count
+                            for order_tag, order, skip_items in page_orders[streamed_count:]:
+                                queued_tags.append((order_tag, current_index, order, skip_items))
+                                current_index += 1
+
+                        next_page = None
+                        if not keep_paging:
+                            logger.debug("keep_paging is False, not paging")
+                        elif not reached_known_order and not fanned_out:
+                            next_page = self._get_next_page(next_page_href)
+
+                        if next_page and parallel_pages and not (since_order or since_date):
+                            fan_out_pages = self._get_fan_out_pages(
+                                order_count_text, next_page, page_start_index, len(page_orders)
+                            )
+                            if fan_out_pages:
+                                logger.debug(f"Fetching {len(fan_out_pages)} remaining pages concurrently")
+                                fanned_out = True
+                                fan_out_queue.extend(fan_out_pages)
+                                fetch_fan_out_pages()
+                                next_page = None
+
+                        if next_page:
+                            # Fetch the next page off of the event loop while the Orders from this page (which
+                            # may be executing their own details requests) continue to run
+                            fetch_page(next_page, current_index)
+
+                        if checkpoint:
+                            self._record_order_history_page(
+                                checkpoint, page_url, page_start_index, current_index - page_start_index, page_tasks
+                            )
+                    else:
+                        index = pending_tasks.pop(task)
+                        try:
+                            order = task.result()
+                        except AmazonOrdersAuthRedirectError:
+                            raise
+                        except Exception as e:
+                            if on_error == "raise":
+                                raise
+                            completed_orders[index] = None
+                            self._handle_order_error(e, index, on_error, errors, error_meta)
+                        else:
+                            completed_orders[index] = order
+                            if checkpoint:
+                                self._record_order(checkpoint, index, order)
+
+                if checkpoint:
+                    # Pickling the recorded Orders (which parses their remaining lazy fields) and writing them is
+                    # done off of the event loop
+                    await self._async_wrapper(checkpoint.save, False)
+
+                if as_completed:
+                    for index in list(completed_orders):
+                        completed_order = completed_orders.pop(index)
+                        if completed_order:
+                            yield completed_order
+                else:
+                    while next_index in completed_orders:
+                        completed_order = completed_orders.pop(next_index)
+                        next_index += 1
+                        if completed_order:
+                            yield completed_order
+
+            completed = True
+        except Exception:
+            if checkpoint and pending_tasks:
+                # Let in-flight Orders finish, so the work already done for them is checkpointed rather than lost
+                await asyncio.wait(pending_tasks)
+                for task, index in pending_tasks.items():
+                    if not task.cancelled() and task.exception() is None:
+                        self._record_order(checkpoint, index, task.result())
+                pending_tasks.clear()
+            raise
+        finally:
+            cancelled_tasks = list(pending_tasks) + [page_task for _, _, page_task in page_tasks]
+            if tag_streamed_task is not None:
+                cancelled_tasks.append(tag_streamed_task)
+            for cancelled_task in cancelled_tasks:
+                cancelled_task.cancel()
+            await asyncio.gather(*cancelled_tasks, return_exceptions=True)
+
+            if checkpoint:
+                if completed:
+                    await self._async_wrapper(checkpoint.delete)
+                else:
+                    await self._async_wrapper(checkpoint.save)
+
+    def _get_fan_out_pages(
+        self, order_count_text: str | None, next_page: str, page_start_index: int, page_size: int
+    ) -> list[tuple[str, int]] | None:
+        order_count_str = order_count_text.strip().split(" ")[0].replace(",", "") if order_count_text else ""
+        if not order_count_str.isdigit():
+            logger.debug("Order count not found, following page links instead")
+            return None
+
+        next_page_parts = urllib.parse.urlparse(next_page)
+        query = urllib.parse.parse_qs(next_page_parts.query, keep_blank_values=True)
+        next_start_index = query.get("startIndex", [""])[0]
+        if not next_start_index.isdigit() or int(next_start_index) != page_start_index + page_size:
+            logger.debug("Next page doesn't start where expected, following page links instead")
+            return None
+
+        fan_out_pages = []
+        for start_index in range(int(next_start_index), int(order_count_str), page_size):
+            query["startIndex"] = [str(start_index)]
+            fan_out_page = urllib.parse.urlunparse(
+                next_page_parts._replace(query=urllib.parse.urlencode(query, doseq=True, safe="*"))
+            )
+            fan_out_pages.append((fan_out_page, start_index))
+
+        return fan_out_pages
+
+    def _record_order(self, checkpoint: Checkpoint, index: int, order: Order) -> None:
+        checkpoint.record("orders", index, order)
+        if order.details_pending:
+            checkpoint.record("lazy_orders", index, True)
+
+    def _record_order_history_page(
+        self,
+        checkpoint: Checkpoint,
+        page_url: str | None,
+        page_start_index: int,
+        page_order_count: int,
+        page_tasks: collections.deque[tuple[str | None, int, asyncio.Future]],
+    ) -> None:
+        checkpoint.record("pages", checkpoint.state["page_count"], (page_url, page_start_index, page_order_count))
+        checkpoint.state["page_count"] += 1
+        checkpoint.state["next_page"] = page_tasks[0][0] if page_tasks else None
+
+    def _resume_order_history_checkpoint(
+        self, checkpoint: Checkpoint, next_page: str | None, current_index: int
+    ) -> tuple[str | None, int]:
+        # Pages recorded beyond page_count are from before an earlier resume, and will be recorded again
+        recorded_pages = checkpoint.records.pop("pages", {})
+        pages = [recorded_pages[i] for i in range(checkpoint.state["page_count"])]
+        checkpointed_orders = checkpoint.records.get("orders", {})
+
+        for i, (page_url, page_start_index, page_order_count) in enumerate(pages):
+            page_indexes = range(page_start_index, page_start_index + page_order_count)
+            if any(index not in checkpointed_orders for index in page_indexes):
+                # Resume from the first page with Orders that weren't built, which will be fetched (and recorded) again
+                checkpoint.state["page_count"] = i
+                logger.debug(f"Resuming Order history from index {page_start_index}")
+                return page_url, page_start_index
+
+        if pages:
+            page_url, page_start_index, page_order_count = pages[-1]
+            next_page, current_index = checkpoint.state["next_page"], page_start_index + page_order_count
+        logger.debug(f"Resuming Order history from index {current_index}")
+
+        return next_page, current_index
+
+    async def _build_orders_batch_async(
+        self, order_ids: Iterable[str], max_concurrency: int | None
+    ) -> AsyncIterator[tuple[str, Order | AmazonOrdersError]]:
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        if max_concurrency is None:
+            max_concurrency = self.config.thread_pool_size
+        if max_concurrency < 1:
+            raise AmazonOrdersError("max_concurrency must be greater than 0.")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(order_id: str) -> tuple[str, Order | AmazonOrdersError]:
+            async with semaphore:
+                try:
+                    return order_id, await self.aget_order(order_id)
+                except AmazonOrdersAuthRedirectError:
+                    raise
+                except AmazonOrdersError as e:
+                    e.meta = {**(e.meta or {}), "order_id": order_id}
+                    return order_id, e
+                except Exception as e:
+                    logger.debug(f"An error occurred fetching Order {order_id}.", exc_info=True)
+                    return order_id, AmazonOrdersError(e, meta={"order_id": order_id})
+
+        tasks = [asyncio.ensure_future(fetch(order_id)) for order_id in dict.fromkeys(order_ids)]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _order_results(
+        self, order_ids: Iterable[str], results: Iterable[tuple[str, Order | AmazonOrdersError]]
+    ) -> dict[str, Order | AmazonOrdersError]:
+        results_by_id = dict(results)
+        return {order_id: results_by_id[order_id] for order_id in order_ids}
+
+    async def _aget_order_history_page(
+        self, page: str, current_index: int, on_order_tag: Callable[[Tag], None] | None = None
+    ) -> AmazonSessionResponse:
+        element_stream = None
+        if on_order_tag:
+            element_stream = util.ElementStream(self.config.selectors.ORDER_HISTORY_ENTITY_SELECTOR, on_order_tag)
+
+        page_response = await self.amazon_session.aget(
+            page,
+            parse_only=self.config.selectors.ORDER_HISTORY_PAGE_SELECTOR,
+            element_stream=element_stream,
+            lazy_parse=bool(self.config.parse_workers),
+        )
+        await self._async_wrapper(self.amazon_session.check_response, page_response, {"index": current_index})
+        return page_response
+
+    def _get_order_history_url(self, filter_value: str, start_index: int | None = None) -> str:
+        optional_start_index = f"&startIndex={start_index}" if start_index else ""
+
+        return (
+            f"{self.config.constants.ORDER_HISTORY_URL}?{self.config.constants.HISTORY_FILTER_QUERY_PARAM}="
+            f"{filter_value}{optional_start_index}"
+        )
+
+    def _get_order_history_years(self, page_response: AmazonSessionResponse) -> set[int]:
+        years = set()
+        for option_tag in util.select(page_response.parsed, self.config.selectors.ORDER_HISTORY_TIME_FILTER_SELECTOR):
+            filter_type, _, year = str(option_tag.get("value", "")).partition("-")
+            if filter_type == "year" and year.isdigit():
+                years.add(int(year))
+        return years
+
+    def _get_history_page_links(self, page_response: AmazonSessionResponse) -> tuple[str | None, str | None]:
+        next_page_tag = util.select_one(page_response.parsed, self.config.selectors.NEXT_PAGE_LINK_SELECTOR)
+        order_count_tag = util.select_one(page_response.parsed, self.config.selectors.ORDER_HISTORY_COUNT_SELECTOR)
+
+        return (
+            str(next_page_tag["href"]) if next_page_tag else None,
+            order_count_tag.text if order_count_tag else None,
+        )
+
+    def _get_next_page(self, next_page_href: str | None) -> str | None:
+        if not next_page_href:
+            logger.debug("No next page")
+            return None
+
+        next_page = next_page_href
+        if not next_page.startswith("http"):
+            next_page = f"{self.config.constants.BASE_URL}{next_page}"
+        return next_page
+
+    def _build_order_details(
+        self,
+        order_id: str,
+        order_details_response: AmazonSessionResponse,
+        clone: Order | None,
+        meta: dict[str, Any] | None,
+        fields: frozenset[str] | None = None,
+    ) -> Order:
+        self._check_order_details_response(order_id, order_details_response, meta)
+
+        if self.amazon_session.parse_executor:
+            return self._build_in_parse_worker(
+                workers.build_order_details,
+                order_details_response,
+                order_id,
+                workers.dumps(clone, self.config) if clone else None,
+                fields,
+            )
+
+        order_details_tag = util.select_one(
+            order_details_response.parsed, self.config.selectors.ORDER_DETAILS_ENTITY_SELECTOR
+        )
+
+        if not order_details_tag:
+            raise AmazonOrdersError(f"Could not parse details for Order {order_id}. Check if Amazon changed the HTML.")
+
+        order: Order = self.config.order_cls(
+            order_details_tag, self.config, full_details=True, clone=clone, **self._fields_kwargs(fields)
+        )
+        # So that the Order fails here, where on_error applies, rather than when it's used
+        order.parse_unsafe_fields()
 
         return order
 
-    async def _async_wrapper(self, func: Callable, *args: Any) -> Order:
+    def _check_order_details_response(
+        self, order_id: str, order_details_response: AmazonSessionResponse, meta: dict[str, Any] | None
+    ) -> None:
+        self.amazon_session.check_response(order_details_response, meta=meta)
+
+        if not order_details_response.response.url.startswith(self.config.constants.ORDER_DETAILS_URL):
+            raise AmazonOrdersNotFoundError(
+                f"Amazon redirected, which likely means Order {order_id} was not found.", meta=meta
+            )
+
+    async def _abuild_order(
+        self,
+        order_tag: Tag,
+        full_details: bool,
+        current_index: int,
+        order: Order | None = None,
+        details_filter: Callable[[Order], bool] | None = None,
+        lazy_details: bool = False,
+        fields: frozenset[str] | None = None,
+        skip_items: bool | None = None,
+    ) -> Order:
+        if not order:
+            order = await self._async_wrapper(self._build_order, order_tag, current_index, fields)
+
+        if details_filter:
+            # Evaluated on the history card, so Orders that don't need details never cost a request
+            full_details = details_filter(order)
+
+        if fields is not None and not fields & set(self.config.order_cls.FULL_DETAILS_FIELDS):
+            # None of the requested fields are on the details page, so there's no need to fetch it
+            full_details = lazy_details = False
+
+        if full_details and self._details_supported(order, skip_items):
+            try:
+                order = await self.aget_order(order.order_number, clone=order, fields=fields)
+            except AmazonOrdersError as e:
+                e.meta = {**(e.meta or {}), "index": current_index, "order_number": order.order_number}
+                raise
+        elif lazy_details and self._details_supported(order, skip_items):
+            order._set_details_loader(
+                functools.partial(self.get_order, order.order_number, clone=order, fields=fields)
+            )
+
+        if not order.full_details:
+            # So that the Order fails here, where on_error applies, rather than when it's used
+            try:
+                await self._async_wrapper(order.parse_unsafe_fields)
+            except AmazonOrdersError as e:
+                e.meta = {**(e.meta or {}), "index": current_index, "order_number": order.order_number}
+                raise
+
+        return order
+
+    def _validate_on_error(self, on_error: str, errors: list[AmazonOrdersError] | None) -> None:
+        if on_error not in ("raise", "skip", "collect"):
+            raise AmazonOrdersError(f"on_error must be 'raise', 'skip', or 'collect', not '{on_error}'.")
+        if on_error == "collect" and errors is None:
+            raise AmazonOrdersError("errors must be given a list to collect errors in when on_error is 'collect'.")
+
+    def _validate_max_pending_order_tasks(self) -> None:
+        # Otherwise, no Orders could ever be scheduled, and paging would never finish
+        if self.config.max_pending_order_tasks < 1:
+            raise AmazonOrdersError("max_pending_order_tasks must be greater than 0 to fetch Order history.")
+
+    def _handle_order_error(
+        self,
+        error: Exception,
+        index: int,
+        on_error: str,
+        errors: list[AmazonOrdersError] | None,
+        meta: dict[str, Any] | None = None,
+    ) -> None:
+        if not isinstance(error, AmazonOrdersError):
+            error = AmazonOrdersError(error)
+        error.meta = {"order_number": None, **(error.meta or {}), **(meta or {}), "index": index}
+
+        logger.warning(f"Order at index {index} ({error.meta['order_number']}) failed to build, skipping: {error}")
+        if on_error == "collect" and errors is not None:
+            errors.append(error)
+
+    def _build_order(self, order_tag: Tag, current_index: int, fields: frozenset[str] | None = None) -> Order:
+        return self.config.order_cls(order_tag, self.config, index=current_index, **self._fields_kwargs(fields))
+
+    def _build_orders_page(
+        self, order_tags: list[Tag], current_index: int, fields: frozenset[str] | None = None
+    ) -> list[Order]:
+        return [self._build_order(order_tag, current_index + i, fields) for i, order_tag in enumerate(order_tags)]
+
+    def _build_in_parse_worker(self, func: Callable, page_response: AmazonSessionResponse, *args: Any) -> Any:
+        # Waits in the calling thread (ex. in get_order()) while the page's HTML is parsed in a parse worker
+        parse_executor = self.amazon_session.parse_executor
+        if not parse_executor:
+            raise AmazonOrdersError("parse_workers must be set to build Orders in parse workers.")  # pragma: no cover
+
+        data = parse_executor.submit(
+            func, page_response.response.content, page_response.encoding, page_response.response.url, *args
+        ).result()
+        return workers.loads(data, self.config)
+
+    async def _abuild_in_parse_worker(self, func: Callable, page_response: AmazonSessionResponse, *args: Any) -> Any:
+        # The awaitable version of _build_in_parse_worker(), which waits on the event loop, rather than holding an
+        # executor thread while the page's HTML is parsed in a parse worker
+        parse_executor = self.amazon_session.parse_executor
+        if not parse_executor:
+            raise AmazonOrdersError("parse_workers must be set to build Orders in parse workers.")  # pragma: no cover
+
+        data = await asyncio.wrap_future(
+            parse_executor.submit(
+                func, page_response.response.content, page_response.encoding, page_response.response.url, *args
+            )
+        )
+        return workers.loads(data, self.config)
+
+    def _get_callable_name(self, func: Callable) -> str:
+        # A name that's the same from one run to the next (unlike its repr), so that a checkpoint can tell whether the
+        # same callable was given
+        func = getattr(func, "func", func)
+        return f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', type(func).__qualname__)}"
+
+    def _validate_fields(self, fields: Iterable[str] | None) -> frozenset[str] | None:
+        if fields is None:
+            return None
+
+        fields = frozenset(fields)
+        valid_fields = {"order_number", "index", "items.title"}
+        valid_fields.update(self.config.order_cls.FIELDS)
+        valid_fields.update(f"items.{field}" for field in self.config.item_cls.FIELDS)
+        unknown_fields = fields - valid_fields
+        if unknown_fields:
+            raise AmazonOrdersError(
+                f"Unknown fields: {', '.join(sorted(unknown_fields))}. See Order.FIELDS and Item.FIELDS."
+            )
+
+        return fields
+
+    def _fields_kwargs(self, fields: frozenset[str] | None) -> dict[str, Any]:
+        # Only passed when a projection is requested, so custom order_class implementations without it still work
+        return {"fields": fields} if fields is not None else {}
+
+    def _is_known_order(self, order: Order, since_order: str | None, since_date: datetime.date | None) -> bool:
+        if since_order and order.order_number == since_order:
+            return True
+
+        return bool(since_date and order.order_placed_date and order.order_placed_date < since_date)
+
+    def _apply_order_details(
+        self, orders: list[Order], results: dict[str, Order | AmazonOrdersError]
+    ) -> dict[str, AmazonOrdersError]:
+        errors = {}
+        for order in orders:
+            result = results[order.order_number]
+            if isinstance(result, AmazonOrdersError):
+                errors[order.order_number] = result
+            else:
+                with order._details_lock:
+                    if order.details_pending:
+                        order.apply_details(result)
+
+        return errors
+
+    def _details_supported(self, order: Order, skip_items: bool | None = None) -> bool:
+        if skip_items is None:
+            # Otherwise, the Order was built in a parse worker, which checked its card
+            skip_items = len(util.select(order.parsed, self.config.selectors.ORDER_SKIP_ITEMS)) > 0
+
+        if skip_items:
+            logger.warning(
+                f"Order {order.order_number} was partially populated, since it is an unsupported Order type."
+            )
+            return False
+
+        return True
+
+    def _iter_sync(self, orders: AsyncIterator[T]) -> Iterator[T]:
+        # If this is called from a thread that is already running an event loop (ex. Jupyter, or an async service
+        # calling the synchronous API), the private loop can't be run in this thread, so run it in a helper thread
+        try:
+            asyncio.get_running_loop()
+            runner: concurrent.futures.ThreadPoolExecutor | None = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        except RuntimeError:
+            runner = None
+
+        loop = asyncio.new_event_loop()
+
+        def run(coro: Any) -> Any:
+            if runner:
+                return runner.submit(loop.run_until_complete, coro).result()
+            return loop.run_until_complete(coro)
+
+        try:
+            while True:
+                try:
+                    order = run(orders.__anext__())
+                except StopAsyncIteration:
+                    break
+
+                yield order
+        finally:
+            run(orders.aclose())  # type: ignore[attr-defined]
+            loop.close()
+            if runner:
+                runner.shutdown()
+
+    async def _async_wrapper(self, func: Callable, *args: Any) -> Any:
         loop = asyncio.get_running_loop()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.thread_pool_size) as pool:
-            result = await loop.run_in_executor(pool, func, *args)
-        return result
+        return await loop.run_in_executor(self.amazon_session.executor, func, *args)
@@ -48,6 +48,20 @@ class Selectors:
 
     NEXT_PAGE_LINK_SELECTOR = "ul.a-pagination li.a-last a"
 
+    ##########################################################################
+    # CSS selectors for partial parsing
+    #
+    # When a page is requested for one of these purposes, only the elements
+    # matching its selectors (and their descendants) are parsed, along with
+    # SIGN_IN_FORM_SELECTOR. Since they're evaluated as the page is parsed,
+    # these must be compound selectors (no combinators or ``:has()``). If
+    # none match, the whole page is parsed.
+    ##########################################################################
+
+    ORDER_HISTORY_PAGE_SELECTOR = ["section.js-yo-container", "div#ordersContainer"]
+    ORDER_DETAILS_PAGE_SELECTOR = ["div#orderDetails", "div#ordersContainer"]
+    TRANSACTIONS_PAGE_SELECTOR = ["div#cpefront-mpo-widget"]
+
     ##########################################################################
     # CSS selectors for Entities and Fields
     #
@@ -60,6 +74,7 @@ class Selectors:
 
     ORDER_HISTORY_ENTITY_SELECTOR = ["div.order-card", "div.order"]
     ORDER_HISTORY_COUNT_SELECTOR = ".js-yo-container span.num-orders"
+    ORDER_HISTORY_TIME_FILTER_SELECTOR = "select[name='timeFilter'] option"
     ORDER_DETAILS_ENTITY_SELECTOR = ["div#orderDetails", "div#ordersContainer"]
     ITEM_ENTITY_SELECTOR = [
         "[data-component='purchasedItems'] .a-fixed-left-grid",
@@ -1,23 +1,36 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
+import concurrent.futures
+import datetime
+import functools
 import json
 import logging
 import os
+import random
+import re
+import threading
 import time
-from typing import Any
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlencode, urlparse
 
 import requests
 import requests.adapters
 from requests import Response, Session
-from requests.utils import dict_from_cookiejar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import dict_from_cookiejar, get_encoding_from_headers
 
 from amazonorders.conf import AmazonOrdersConfig, config_file_lock, cookies_file_lock, debug_output_file_lock
 from amazonorders.exception import AmazonOrdersAuthError, AmazonOrdersAuthRedirectError, AmazonOrdersError
 from amazonorders.forms import AuthForm, CaptchaForm, JSAuthBlocker, MfaDeviceSelectForm, MfaForm, SignInForm
+from amazonorders import util, workers
 from amazonorders.util import AmazonSessionResponse
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +65,127 @@ class IODefault:
         return input(f"--> {msg}: ")
 
 
+class RateLimiter:
+    """
+    A thread-safe token bucket that paces requests made on an :class:`AmazonSession`, shared by everything using that
+    session. Up to ``burst`` requests may be sent at once, after which requests are paced to ``requests_per_second``.
+
+    When Amazon appears to be throttling (a ``5xx`` response, or its "verify that you're not a robot" page), the rate
+    is backed off multiplicatively, then recovers gradually (additively) with each successful response.
+    """
+
+    #: The factor the rate is multiplied by each time Amazon throttles.
+    BACKOFF_FACTOR = 0.5
+    #: The fraction of ``requests_per_second`` recovered with each successful response.
+    RECOVERY_STEP = 0.05
+    #: The fraction of ``requests_per_second`` the rate will never back off below.
+    MIN_RATE_FRACTION = 0.02
+
+    def __init__(self, requests_per_second: float, burst: int, throttle_text_regex: str | None = None) -> None:
+        #: The maximum rate, in requests per second. ``0`` disables rate limiting.
+        self.requests_per_second: float = requests_per_second
+        #: The number of requests that may be sent at once.
+        self.burst: int = max(1, burst)
+        #: The current rate, in requests per second, which is backed off from ``requests_per_second`` when throttled.
+        self.rate: float = requests_per_second
+
+        # Anchored matching is used, since the regex is bookended by wildcards, and an unanchored search of a large
+        # page would be quadratic
+        self._throttle_text_regex = re.compile(throttle_text_regex) if throttle_text_regex else None
+        self._tokens: float = float(self.burst)
+        self._updated: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        ``False`` if ``requests_per_second`` is ``0``, in which case requests are never paced.
+        """
+        return self.requests_per_second > 0
+
+    def reserve(self) -> float:
+        """
+        Reserve the next request, returning how long (in seconds) to wait before sending it.
+
+        :return: The number of seconds to wait before sending the request.
+        """
+        if not self.enabled:
+            return 0
+
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Block until the next request may be sent.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """
+        The awaitable version of :func:`acquire`, which waits without blocking the event loop.
+        """
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def record(self, response: Response, response_type: str | None = None) -> None:
+        """
+        Adjust the rate based on the given response, backing off if it looks like Amazon is throttling, and
+        otherwise recovering.
+
+        :param response: The response to check.
+        :param response_type: The type of page the response was classified as (see
+            :class:`~amazonorders.util.ResponseClassifier`), in which case a bot challenge is recognized from that,
+            rather than by matching the throttle regex against the response's text.
+        """
+        if not self.enabled:
+            return
+
+        if response_type is not None:
+            throttled = response_type in (util.ResponseClassifier.SERVER_ERROR, util.ResponseClassifier.BOT_CHALLENGE)
+        else:
+            throttled = response.status_code >= 500 or bool(
+                self._throttle_text_regex and self._throttle_text_regex.match(response.text)
+            )
+
+        if throttled:
+            self.throttled()
+        else:
+            self.succeeded()
+
+    def throttled(self) -> None:
+        """
+        Back off the rate, since Amazon appears to be throttling.
+        """
+        with self._lock:
+            self._refill()
+            self.rate = max(self.requests_per_second * self.MIN_RATE_FRACTION, self.rate * self.BACKOFF_FACTOR)
+            # Drop any banked burst, so the backoff takes effect immediately
+            self._tokens = min(self._tokens, 0)
+        logger.warning(f"Amazon appears to be throttling requests, backing off to {self.rate:.2f} requests/second.")
+
+    def succeeded(self) -> None:
+        """
+        Recover some of the rate, since a request succeeded.
+        """
+        with self._lock:
+            if self.rate < self.requests_per_second:
+                self._refill()
+                self.rate = min(self.requests_per_second, self.rate + self.requests_per_second * self.RECOVERY_STEP)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
 class AmazonSession:
     """
     An interface for interacting with Amazon and authenticating an underlying :class:`requests.Session`. Utilizing
@@ -86,7 +220,7 @@ class AmazonSession:
                     "field-keywords",
                 ),
                 MfaForm(config, config.selectors.CAPTCHA_OTP_FORM_SELECTOR),
-                JSAuthBlocker(config, config.constants.JS_ROBOT_TEXT_REGEX),
+                JSAuthBlocker(config),
             ]
 
         #: An Amazon username. Environment variable ``AMAZON_USERNAME`` will override passed in or config value.
@@ -118,6 +252,33 @@ class AmazonSession:
         #: If :func:`login` has been executed and successfully logged in the session.
         self.is_authenticated: bool = False
 
+        #: The rate limiter shared by all requests made on this session.
+        self.rate_limiter: RateLimiter = RateLimiter(config.requests_per_second or 0, config.requests_burst or 1)
+        #: Labels each response with the type of page it is, so only the pages that need it are parsed.
+        self.classifier: util.ResponseClassifier = util.ResponseClassifier(config.constants)
+
+        #: Counts of the requests made on this session, for tuning the retry policy. ``requests`` is every attempt,
+        #: ``retries`` is how many of those were retries, and ``retries_exhausted`` is how many requests still failed
+        #: after ``AmazonOrdersConfig.max_request_attempts``. ``bytes_decoded`` is the total size of the response
+        #: bodies that were parsed, and ``bytes_decoded_per_second`` is the rate at which they were decoded and parsed.
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "retries": 0,
+            "retries_exhausted": 0,
+            "bytes_decoded": 0,
+            "bytes_decoded_per_second": 0,
+        }
+
+        self._stats_lock: threading.Lock = threading.Lock()
+        self._decode_seconds: float = 0
+        self._retry_exceptions: tuple[type[BaseException], ...] = tuple(
+            util.load_class(exception_class.split(".")[:-1], exception_class.split(".")[-1])
+            for exception_class in (config.retry_exceptions or [])
+        )
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._parse_executor: concurrent.futures.ProcessPoolExecutor | None = None
+        self._executor_lock: threading.Lock = threading.Lock()
+
         cookie_dir = os.path.dirname(self.config.cookie_jar_path)
         with config_file_lock:
             if not os.path.exists(cookie_dir):
@@ -129,49 +290,206 @@ class AmazonSession:
                     cookies = requests.utils.cookiejar_from_dict(data)
                     self.session.cookies.update(cookies)
 
-    def request(self, method: str, url: str, persist_cookies: bool = False, **kwargs: Any) -> AmazonSessionResponse:
+    def __enter__(self) -> "AmazonSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        The long-lived executor shared by everything making concurrent requests on this session. Its
+        ``max_workers`` is ``AmazonOrdersConfig.thread_pool_size``, so that value bounds the number of requests in
+        flight at any given time. It is created on first use, and shut down by :func:`close`.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.config.thread_pool_size, thread_name_prefix="amazonorders"
+                )
+            return self._executor
+
+    @property
+    def parse_executor(self) -> concurrent.futures.ProcessPoolExecutor | None:
+        """
+        The process pool that Orders are built in from the HTML of history and details pages when
+        ``AmazonOrdersConfig.parse_workers`` is set, so that parsing isn't limited to a single core, or ``None`` if it
+        isn't. Requests are still executed on the :attr:`executor`. It is created on first use, and shut down by
+        :func:`close`.
+        """
+        if not self.config.parse_workers:
+            return None
+
+        with self._executor_lock:
+            if self._parse_executor is None:
+                self._parse_executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=int(self.config.parse_workers),
+                    initializer=workers.init_worker,
+                    initargs=(self.config,),
+                )
+            return self._parse_executor
+
+    def close(self) -> None:
         """
-        Execute the request against Amazon with base headers, parsing and storing the response.
+        Shut down the session's :attr:`executor` and :attr:`parse_executor` (waiting for in-flight work to finish)
+        and close the underlying :class:`requests.Session`. Persisted session data is not cleared, and the session
+        can still be used after this is called.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            if self._parse_executor is not None:
+                self._parse_executor.shutdown(wait=True)
+                self._parse_executor = None
+        self.session.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        persist_cookies: bool = False,
+        parse_only: list[str] | None = None,
+        element_stream: util.ElementStream | None = None,
+        lazy_parse: bool = False,
+        retry: bool | None = None,
+        **kwargs: Any,
+    ) -> AmazonSessionResponse:
+        """
+        Execute the request against Amazon with base headers, parsing and storing the response. Requests are paced by
+        the session's :attr:`rate_limiter`, and ``GET`` requests that fail with a retryable status or exception are
+        retried with jittered exponential backoff, per ``AmazonOrdersConfig.max_request_attempts``.
 
         :param method: The request method to execute.
         :param url: The URL to execute ``method`` on.
         :param persist_cookies: If ``True``, cookies from the response will be persisted to a file.
+        :param parse_only: The selectors for the parts of the page the request is for (ex.
+            :attr:`~amazonorders.selectors.Selectors.ORDER_HISTORY_PAGE_SELECTOR`), so only they are parsed, unless
+            ``AmazonOrdersConfig.partial_parse`` is disabled.
+        :param element_stream: If given, a successful response's body is streamed to it as it is read, so the
+            elements it matches are handed off before the rest of the page has arrived. Once an element has been
+            handed off, the request is no longer retried.
+        :param lazy_parse: If ``True``, the response is only parsed the first time its
+            :attr:`~amazonorders.util.AmazonSessionResponse.parsed` is accessed (ex. when its HTML will be parsed in
+            a :attr:`parse_executor` worker instead).
+        :param retry: ``True`` if the request may be retried, which by default is only the case for ``GET`` requests,
+            since other requests (ex. submitting a one-time password) may not be safe to repeat.
         :param kwargs: Remaining ``kwargs`` will be passed to :func:`requests.request`.
         :return: The response from the executed request.
         """
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
-        kwargs["headers"].update(self.config.constants.BASE_HEADERS)
-
-        url_to_log = url
-        if self.debug:
-            if "params" in kwargs:
-                encoded_params = urlencode(kwargs["params"])
-                if encoded_params not in url:
-                    url_to_log += "?" + encoded_params
-            logger.debug(f"{method} request: {url_to_log}")
-
-        response = self.session.request(method, url, **kwargs)
-        amazon_session_response = AmazonSessionResponse(response, self.config.bs4_parser)
+        if retry is None:
+            retry = method.upper() == "GET"
+
+        attempt = 1
+        while True:
+            self.rate_limiter.acquire()
+            self._increment_stat("requests")
+
+            try:
+                amazon_session_response = self._request(
+                    method, url, persist_cookies, parse_only, element_stream, lazy_parse, **kwargs
+                )
+            except Exception as e:
+                if not retry or (element_stream is not None and element_stream.elements):
+                    # Not safe to repeat, or elements have already been handed off, so they would be handed off again
+                    raise
+                delay = self._get_retry_delay(attempt, url, exception=e)
+                if delay is None:
+                    raise
+            else:
+                delay = None
+                if retry:
+                    delay = self._get_retry_delay(attempt, url, response=amazon_session_response.response)
+                if delay is None:
+                    return amazon_session_response
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        persist_cookies: bool,
+        parse_only: list[str] | None,
+        element_stream: util.ElementStream | None = None,
+        lazy_parse: bool = False,
+        **kwargs: Any,
+    ) -> AmazonSessionResponse:
+        url_to_log = self._prepare_request(method, url, kwargs)
+
+        response = self.session.request(method, url, stream=element_stream is not None, **kwargs)
+        amazon_session_response = AmazonSessionResponse(
+            response,
+            self.config.bs4_parser,
+            self._get_parse_only(parse_only),
+            self._get_element_stream(response, element_stream),
+            self.classifier,
+            lazy_parse,
+        )
 
-        if persist_cookies:
-            cookies = dict_from_cookiejar(self.session.cookies)
-            with cookies_file_lock:
-                with open(self.config.cookie_jar_path, "w", encoding="utf-8") as f:
-                    f.write(json.dumps(cookies))
+        self._handle_response(amazon_session_response, url_to_log, persist_cookies)
 
-        if self.debug:
-            url_str = ""
-            if url_to_log != amazon_session_response.response.url:
-                url_str = f" - (redirected) {amazon_session_response.response.url}"
-            logger.debug(f"Response: {amazon_session_response.response.status_code}{url_str}")
+        return amazon_session_response
 
-            page_name = self._get_page_from_url(self.config.output_dir, amazon_session_response.response.url)
-            with open(os.path.join(self.config.output_dir, page_name), "w", encoding="utf-8") as html_file:
-                logger.debug(f"Response written to file: {html_file.name}")
-                html_file.write(amazon_session_response.response.text)
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        persist_cookies: bool = False,
+        parse_only: list[str] | None = None,
+        element_stream: util.ElementStream | None = None,
+        lazy_parse: bool = False,
+        retry: bool | None = None,
+        **kwargs: Any,
+    ) -> AmazonSessionResponse:
+        """
+        The awaitable version of :func:`request`, paced and retried the same way. By default, each attempt is executed
+        on the session's :attr:`executor`, so it does not block the event loop. :class:`AsyncAmazonSession` executes
+        them with a native async HTTP client instead.
 
-        return amazon_session_response
+        :param method: The request method to execute.
+        :param url: The URL to execute ``method`` on.
+        :param persist_cookies: If ``True``, cookies from the response will be persisted to a file.
+        :param parse_only: The selectors for the parts of the page the request is for, so only they are parsed.
+        :param element_stream: If given, a successful response's body is streamed to it. :class:`AsyncAmazonSession`
+            reads the whole body before feeding it.
+        :param lazy_parse: If ``True``, the response is only parsed the first time its ``parsed`` is accessed.
+        :param retry: ``True`` if the request may be retried, which by default is only the case for ``GET`` requests.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`requests.request`.
+        :return: The response from the executed request.
+        """
+        if retry is None:
+            retry = method.upper() == "GET"
+
+        attempt = 1
+        while True:
+            # Wait for the rate limiter (and any backoff) on the event loop, rather than tying up a thread in the
+            # executor
+            await self.rate_limiter.aacquire()
+            self._increment_stat("requests")
+
+            try:
+                amazon_session_response = await self._asend(
+                    method, url, persist_cookies, parse_only, element_stream, lazy_parse, kwargs
+                )
+            except Exception as e:
+                if not retry or (element_stream is not None and element_stream.elements):
+                    # Not safe to repeat, or elements have already been handed off, so they would be handed off again
+                    raise
+                delay = self._get_retry_delay(attempt, url, exception=e)
+                if delay is None:
+                    raise
+            else:
+                delay = None
+                if retry:
+                    delay = self._get_retry_delay(attempt, url, response=amazon_session_response.response)
+                if delay is None:
+                    return amazon_session_response
+
+            await asyncio.sleep(delay)
+            attempt += 1
 
     def get(self, url: str, **kwargs: Any) -> AmazonSessionResponse:
         """
@@ -193,6 +511,26 @@ class AmazonSession:
         """
         return self.request("POST", url, **kwargs)
 
+    async def aget(self, url: str, **kwargs: Any) -> AmazonSessionResponse:
+        """
+        Perform a ``GET`` request with :func:`arequest`.
+
+        :param url: The URL to request.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`AmazonSession.arequest`.
+        :return: The response from the executed request.
+        """
+        return await self.arequest("GET", url, **kwargs)
+
+    async def apost(self, url: str, **kwargs: Any) -> AmazonSessionResponse:
+        """
+        Perform a ``POST`` request with :func:`arequest`.
+
+        :param url: The URL to request.
+        :param kwargs: Remaining ``kwargs`` will be passed to :func:`AmazonSession.arequest`.
+        :return: The response from the executed request.
+        """
+        return await self.arequest("POST", url, **kwargs)
+
     def auth_cookies_stored(self) -> bool:
         cookies = dict_from_cookiejar(self.session.cookies)
         for cookie in self.config.constants.COOKIES_SET_WHEN_AUTHENTICATED:
@@ -220,8 +558,8 @@ class AmazonSession:
             # TODO: BeautifulSoup doesn't let us query for #nav-item-signout, maybe because it's dynamic on the page,
             #  but we should find a better way to do this
             if self.auth_cookies_stored() or (
-                "Hello, sign in" not in last_response.response.text
-                and "nav-item-signout" in last_response.response.text
+                b"Hello, sign in" not in last_response.response.content
+                and b"nav-item-signout" in last_response.response.content
             ):
                 self.is_authenticated = True
                 break
@@ -240,8 +578,8 @@ class AmazonSession:
 
                 form_found = False
 
-            for form in self.auth_forms:
-                if form.select_form(self, last_response.parsed):
+            for form in self._get_auth_forms(last_response.response_type):
+                if form.select_response(self, last_response):
                     form_found = True
 
                     form.fill_form()
@@ -278,6 +616,11 @@ class AmazonSession:
 
         self.is_authenticated = False
 
+    def _get_auth_forms(self, response_type: str | None) -> list[AuthForm]:
+        # The forms for the type of page the response was classified as are tried first, then the rest in order, so
+        # that a page a form doesn't expect is still handled
+        return sorted(self.auth_forms, key=lambda form: form.response_type != response_type)
+
     def build_response_error(self, response: Response) -> str:
         """
         Build an error message from the given response.
@@ -306,16 +649,157 @@ class AmazonSession:
         """
         if not amazon_session_response.response.ok:
             raise AmazonOrdersError(self.build_response_error(amazon_session_response.response), meta=meta)
-        if amazon_session_response.response.url.startswith(self.config.constants.SIGN_IN_URL) or (
-            amazon_session_response.parsed
-            and amazon_session_response.parsed.select_one(self.config.selectors.SIGN_IN_FORM_SELECTOR) is not None
-        ):
+        # A challenge (ex. a Captcha or MFA page) served from the sign-in URL is classified as that challenge, but it
+        # is still a redirect to login, so the URL is checked regardless of the classification
+        sign_in_redirect = amazon_session_response.response.url.startswith(self.config.constants.SIGN_IN_URL)
+        if amazon_session_response.response_type is not None:
+            # The response was classified without parsing it, so a sign-in redirect doesn't need to be parsed to be
+            # detected
+            sign_in_redirect |= amazon_session_response.response_type == util.ResponseClassifier.SIGN_IN_REDIRECT
+        else:
+            sign_in_redirect |= bool(
+                util.select_one(amazon_session_response.parsed, self.config.selectors.SIGN_IN_FORM_SELECTOR)
+            )
+        if sign_in_redirect:
             logger.debug("Amazon redirect to login, so persisted AmazonSession will be logged out.")
             self.logout()
             raise AmazonOrdersAuthRedirectError(
                 "Amazon redirected to login. Call AmazonSession.login() to reauthenticate first.", meta=meta
             )
 
+    async def _asend(
+        self,
+        method: str,
+        url: str,
+        persist_cookies: bool,
+        parse_only: list[str] | None,
+        element_stream: util.ElementStream | None,
+        lazy_parse: bool,
+        kwargs: dict[str, Any],
+    ) -> AmazonSessionResponse:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            functools.partial(
+                self._request, method, url, persist_cookies, parse_only, element_stream, lazy_parse, **kwargs
+            ),
+        )
+
+    def _get_parse_only(self, parse_only: list[str] | None) -> list[str] | None:
+        if not parse_only or not self.config.partial_parse:
+            return None
+
+        # The sign-in form is always kept, so check_response() can tell when the session was logged out
+        return list(parse_only) + [self.config.selectors.SIGN_IN_FORM_SELECTOR]
+
+    def _get_element_stream(
+        self, response: Response, element_stream: util.ElementStream | None
+    ) -> util.ElementStream | None:
+        # Only a page that loaded successfully has elements worth handing off early
+        if not response.ok or response.url.startswith(self.config.constants.SIGN_IN_URL):
+            return None
+
+        return element_stream
+
+    def _get_retry_delay(
+        self, attempt: int, url: str, response: Response | None = None, exception: Exception | None = None
+    ) -> float | None:
+        if exception is not None:
+            if not self._is_retryable_exception(exception):
+                return None
+            reason = f"{exception.__class__.__name__}: {exception}"
+        elif response is not None and response.status_code in (self.config.retry_statuses or []):
+            reason = f"status {response.status_code}"
+        else:
+            return None
+
+        if attempt >= (self.config.max_request_attempts or 1):
+            self._increment_stat("retries_exhausted")
+            logger.debug(f"Giving up on {url} after {attempt} attempts ({reason}).")
+            return None
+
+        backoff_max = float(self.config.retry_backoff_max or 0)
+        # "Full jitter", so that concurrent requests that failed together don't all retry together
+        delay = random.uniform(0, min(backoff_max, float(self.config.retry_backoff_base or 0) * 2 ** (attempt - 1)))
+        if response is not None:
+            retry_after = self._get_retry_after(response)
+            if retry_after is not None:
+                delay = min(backoff_max, retry_after)
+
+        self._increment_stat("retries")
+        logger.debug(f"Retrying {url} in {delay:.2f} seconds, attempt {attempt} failed ({reason}).")
+
+        return delay
+
+    def _get_retry_after(self, response: Response) -> float | None:
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+
+        if retry_after.strip().isdigit():
+            return float(retry_after)
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+    def _is_retryable_exception(self, exception: Exception) -> bool:
+        return isinstance(exception, self._retry_exceptions)
+
+    def _increment_stat(self, key: str) -> None:
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def _record_decode(self, amazon_session_response: AmazonSessionResponse) -> None:
+        if not amazon_session_response.is_parsed:
+            return
+
+        with self._stats_lock:
+            self.stats["bytes_decoded"] += len(amazon_session_response.response.content or b"")
+            self._decode_seconds += amazon_session_response.decode_seconds
+            if self._decode_seconds:
+                self.stats["bytes_decoded_per_second"] = int(self.stats["bytes_decoded"] / self._decode_seconds)
+
+    def _prepare_request(self, method: str, url: str, kwargs: dict[str, Any]) -> str:
+        if "headers" not in kwargs:
+            kwargs["headers"] = {}
+        kwargs["headers"].update(self.config.constants.BASE_HEADERS)
+
+        url_to_log = url
+        if self.debug:
+            if "params" in kwargs:
+                encoded_params = urlencode(kwargs["params"])
+                if encoded_params not in url:
+                    url_to_log += "?" + encoded_params
+            logger.debug(f"{method} request: {url_to_log}")
+
+        return url_to_log
+
+    def _handle_response(
+        self, amazon_session_response: AmazonSessionResponse, url_to_log: str, persist_cookies: bool
+    ) -> None:
+        self.rate_limiter.record(amazon_session_response.response, amazon_session_response.response_type)
+        self._record_decode(amazon_session_response)
+
+        if persist_cookies:
+            cookies = dict_from_cookiejar(self.session.cookies)
+            with cookies_file_lock:
+                with open(self.config.cookie_jar_path, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(cookies))
+
+        if self.debug:
+            url_str = ""
+            if url_to_log != amazon_session_response.response.url:
+                url_str = f" - (redirected) {amazon_session_response.response.url}"
+            logger.debug(f"Response: {amazon_session_response.response.status_code}{url_str}")
+
+            page_name = self._get_page_from_url(self.config.output_dir, amazon_session_response.response.url)
+            with open(os.path.join(self.config.output_dir, page_name), "w", encoding="utf-8") as html_file:
+                logger.debug(f"Response written to file: {html_file.name}")
+                html_file.write(amazon_session_response.response.text)
+
     def _get_page_from_url(self, output_dir: str, url: str) -> str:
         page_name = os.path.splitext(os.path.basename(urlparse(url).path))[0]
         if not page_name:
@@ -346,3 +830,149 @@ class AmazonSession:
         )
         session.mount("https://", adapter)
         return session
+
+
+class AsyncAmazonSession(AmazonSession):
+    """
+    An :class:`AmazonSession` whose awaitable requests (:func:`arequest`, and so the ``a``-prefixed methods of
+    :class:`~amazonorders.orders.AmazonOrders` and :class:`~amazonorders.transactions.AmazonTransactions`) are
+    executed by a native async HTTP client, optionally with HTTP/2 multiplexing, rather than by blocking requests on
+    a thread pool. This means thousands of concurrent requests cost coroutines rather than threads. Requests are still
+    paced by :attr:`~AmazonSession.rate_limiter` and retried like any other, and parsing is done on the session's
+    :attr:`~AmazonSession.executor`, so it does not block the event loop.
+
+    The async client shares the underlying :class:`requests.Session`'s cookies, so :func:`login` and cookie
+    persistence work exactly as they do for :class:`AmazonSession`, as do checks like :func:`check_response`.
+
+    This requires `httpx <https://www.python-httpx.org>`_, which can be installed with
+    ``pip install amazon-orders[async]``.
+    """
+
+    def __init__(self, *args: Any, http2: bool = False, **kwargs: Any) -> None:
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            raise AmazonOrdersError(
+                "AsyncAmazonSession requires httpx. Install it with `pip install amazon-orders[async]`."
+            )
+
+        super().__init__(*args, **kwargs)
+
+        #: ``True`` if the async client should negotiate HTTP/2, so concurrent requests are multiplexed over a
+        #: single connection.
+        self.http2: bool = http2
+
+        self._async_client: "httpx.AsyncClient | None" = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> "AsyncAmazonSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    @property
+    def async_client(self) -> "httpx.AsyncClient":
+        """
+        The native async HTTP client. It is created on first use (and again if it is used from a new event loop),
+        and closed by :func:`aclose`.
+        """
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # Connections are bound to the event loop they were opened on, so a client can't be reused across loops
+            self._async_client = httpx.AsyncClient(
+                cookies=self.session.cookies,
+                follow_redirects=True,
+                http2=self.http2,
+                limits=httpx.Limits(max_connections=self.config.connection_pool_size),
+            )
+            self._async_client_loop = loop
+        elif self._async_client.cookies.jar is not self.session.cookies:
+            # logout() replaces the requests.Session, so keep sharing its cookie jar
+            self._async_client.cookies = self.session.cookies  # type: ignore[assignment]
+
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """
+        Close the native async client, then :func:`~AmazonSession.close` the session.
+        """
+        if self._async_client is not None:
+            if self._async_client_loop is asyncio.get_running_loop():
+                await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+        # close() waits on the executors' in-flight work, so keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def _asend(
+        self,
+        method: str,
+        url: str,
+        persist_cookies: bool,
+        parse_only: list[str] | None,
+        element_stream: util.ElementStream | None,
+        lazy_parse: bool,
+        kwargs: dict[str, Any],
+    ) -> AmazonSessionResponse:
+        url_to_log = self._prepare_request(method, url, kwargs)
+
+        response = await self.async_client.request(method, url, **kwargs)
+
+        # Parsing is done on the executor, so it does not block the event loop. The body has already been read, so
+        # any element_stream is fed it all at once
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            self._build_async_response,
+            response,
+            url_to_log,
+            persist_cookies,
+            parse_only,
+            element_stream,
+            lazy_parse,
+        )
+
+    def _is_retryable_exception(self, exception: Exception) -> bool:
+        import httpx
+
+        return isinstance(exception, httpx.TransportError) or super()._is_retryable_exception(exception)
+
+    def _build_async_response(
+        self,
+        response: "httpx.Response",
+        url_to_log: str,
+        persist_cookies: bool,
+        parse_only: list[str] | None,
+        element_stream: util.ElementStream | None = None,
+        lazy_parse: bool = False,
+    ) -> AmazonSessionResponse:
+        requests_response = self._to_requests_response(response)
+        amazon_session_response = AmazonSessionResponse(
+            requests_response,
+            self.config.bs4_parser,
+            self._get_parse_only(parse_only),
+            self._get_element_stream(requests_response, element_stream),
+            self.classifier,
+            lazy_parse,
+        )
+
+        self._handle_response(amazon_session_response, url_to_log, persist_cookies)
+
+        return amazon_session_response
+
+    def _to_requests_response(self, response: "httpx.Response") -> Response:
+        # Everything downstream (parsing, check_response(), forms) is written against requests.Response, so adapt the
+        # async client's response to one rather than duplicating those code paths
+        requests_response = Response()
+        requests_response.status_code = response.status_code
+        requests_response.reason = response.reason_phrase
+        requests_response.url = str(response.url)
+        requests_response.headers = CaseInsensitiveDict(response.headers)
+        requests_response._content = response.content
+        requests_response._content_consumed = True
+        requests_response.encoding = get_encoding_from_headers(requests_response.headers)
+        return requests_response
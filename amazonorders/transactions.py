@@ -1,6 +1,7 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
 import datetime
 import logging
 from typing import Any
@@ -9,10 +10,12 @@ from bs4 import Tag
 from dateutil import parser
 
 from amazonorders import util
+from amazonorders.checkpoint import Checkpoint
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.transaction import Transaction
 from amazonorders.exception import AmazonOrdersError
 from amazonorders.session import AmazonSession
+from amazonorders.util import AmazonSessionResponse
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +86,11 @@ class AmazonTransactions:
             logger.setLevel(logging.DEBUG)
 
     def get_transactions(
-        self, days: int = 365, next_page_data: dict[str, Any] | None = None, keep_paging: bool = True
+        self,
+        days: int = 365,
+        next_page_data: dict[str, Any] | None = None,
+        keep_paging: bool = True,
+        checkpoint: str | None = None,
     ) -> list[Transaction]:
         """
         Get Amazon Transaction history for a given number of days.
@@ -92,42 +99,173 @@ class AmazonTransactions:
         :param next_page_data: If a call to this method previously errored out, passing the exception's
             :attr:`~amazonorders.exception.AmazonOrdersError.meta` will continue paging where it left off.
         :param keep_paging: ``False`` if only one page should be fetched.
+        :param checkpoint: A path at which to checkpoint progress. If the crawl errors out (or the process dies),
+            calling this method again with the same parameters and ``checkpoint`` resumes it from the last page
+            fetched. The checkpoint is deleted once the crawl completes.
         :return: A list of the requested Transactions.
         """
         if not self.amazon_session.is_authenticated:
             raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
 
-        min_date = datetime.date.today() - datetime.timedelta(days=days)
+        transactions_checkpoint, min_date, next_page_data, transactions = self._start_transactions(
+            days, next_page_data, keep_paging, checkpoint
+        )
 
-        transactions: list[Transaction] = []
         first_page = True
         while first_page or keep_paging:
             first_page = False
 
-            page_response = self.amazon_session.post(self.config.constants.TRANSACTION_HISTORY_URL, data=next_page_data)
-            self.amazon_session.check_response(page_response, meta=next_page_data)
+            page_response = self.amazon_session.post(
+                self.config.constants.TRANSACTION_HISTORY_URL,
+                data=next_page_data,
+                parse_only=self.config.selectors.TRANSACTIONS_PAGE_SELECTOR,
+                # Paging only reads transactions, so it's safe to repeat
+                retry=True,
+            )
+            next_page_data = self._parse_transactions_page(page_response, next_page_data, min_date, transactions)
+            self._save_transactions_checkpoint(transactions_checkpoint, next_page_data, transactions)
 
-            form_tag = util.select_one(page_response.parsed, self.config.selectors.TRANSACTION_HISTORY_FORM_SELECTOR)
+            if not next_page_data:
+                keep_paging = False
 
-            if not form_tag:
-                transaction_container = util.select_one(
-                    page_response.parsed, self.config.selectors.TRANSACTION_HISTORY_CONTAINER_SELECTOR
-                )
-                if transaction_container and "don't have any transactions" in transaction_container.text:
-                    break
-                else:
-                    raise AmazonOrdersError("Could not parse Transaction history. Check if Amazon changed the HTML.")
+        if transactions_checkpoint:
+            transactions_checkpoint.delete()
 
-            loaded_transactions, next_page_data = _parse_transaction_form_tag(form_tag, self.config)
+        return transactions
 
-            for transaction in loaded_transactions:
-                if transaction.completed_date >= min_date:
-                    transactions.append(transaction)
-                else:
-                    next_page_data = None
-                    break
+    async def aget_transactions(
+        self,
+        days: int = 365,
+        next_page_data: dict[str, Any] | None = None,
+        keep_paging: bool = True,
+        checkpoint: str | None = None,
+    ) -> list[Transaction]:
+        """
+        The awaitable version of :func:`get_transactions`, which can be used from an already running event loop.
+
+        :param days: The number of days worth of Transactions to get.
+        :param next_page_data: If a call to this method previously errored out, passing the exception's
+            :attr:`~amazonorders.exception.AmazonOrdersError.meta` will continue paging where it left off.
+        :param keep_paging: ``False`` if only one page should be fetched.
+        :param checkpoint: A path at which to checkpoint progress, and from which to resume.
+        :return: A list of the requested Transactions.
+        """
+        if not self.amazon_session.is_authenticated:
+            raise AmazonOrdersError("Call AmazonSession.login() to authenticate first.")
+
+        loop = asyncio.get_running_loop()
+        # Loading and saving the checkpoint is done off of the event loop
+        transactions_checkpoint, min_date, next_page_data, transactions = await loop.run_in_executor(
+            self.amazon_session.executor, self._start_transactions, days, next_page_data, keep_paging, checkpoint
+        )
+
+        first_page = True
+        while first_page or keep_paging:
+            first_page = False
+
+            page_response = await self.amazon_session.apost(
+                self.config.constants.TRANSACTION_HISTORY_URL,
+                data=next_page_data,
+                parse_only=self.config.selectors.TRANSACTIONS_PAGE_SELECTOR,
+                # Paging only reads transactions, so it's safe to repeat
+                retry=True,
+            )
+            next_page_data = await loop.run_in_executor(
+                self.amazon_session.executor,
+                self._parse_transactions_page,
+                page_response,
+                next_page_data,
+                min_date,
+                transactions,
+            )
+            await loop.run_in_executor(
+                self.amazon_session.executor,
+                self._save_transactions_checkpoint,
+                transactions_checkpoint,
+                next_page_data,
+                transactions,
+            )
 
             if not next_page_data:
                 keep_paging = False
 
+        if transactions_checkpoint:
+            await loop.run_in_executor(self.amazon_session.executor, transactions_checkpoint.delete)
+
         return transactions
+
+    def _start_transactions(
+        self, days: int, next_page_data: dict[str, Any] | None, keep_paging: bool, checkpoint: str | None
+    ) -> tuple[Checkpoint | None, datetime.date, dict[str, Any] | None, list[Transaction]]:
+        min_date = datetime.date.today() - datetime.timedelta(days=days)
+        transactions: list[Transaction] = []
+
+        if not checkpoint:
+            return None, min_date, next_page_data, transactions
+
+        transactions_checkpoint = Checkpoint(
+            checkpoint,
+            {"crawl": "transactions", "days": days, "next_page_data": next_page_data, "keep_paging": keep_paging},
+            self.config,
+        )
+        if transactions_checkpoint.resumed:
+            # The date range is kept from the original run, so resuming on a later day doesn't shift it
+            state = transactions_checkpoint.state
+            recorded_transactions = transactions_checkpoint.records.pop("transactions", {})
+            transactions = [recorded_transactions[i] for i in range(state["transaction_count"])]
+            logger.debug(f"Resuming Transactions with {len(transactions)} already fetched")
+            return transactions_checkpoint, state["min_date"], state["next_page_data"], transactions
+
+        # Each fetched Transaction is recorded (in "transactions") by its index
+        transactions_checkpoint.state = {
+            "min_date": min_date,
+            "next_page_data": next_page_data,
+            "transaction_count": 0,
+        }
+
+        return transactions_checkpoint, min_date, next_page_data, transactions
+
+    def _save_transactions_checkpoint(
+        self,
+        transactions_checkpoint: Checkpoint | None,
+        next_page_data: dict[str, Any] | None,
+        transactions: list[Transaction],
+    ) -> None:
+        # Transaction pages are fetched one at a time, so save after each, recording only the page's new Transactions
+        if transactions_checkpoint:
+            state = transactions_checkpoint.state
+            for i in range(state["transaction_count"], len(transactions)):
+                transactions_checkpoint.record("transactions", i, transactions[i])
+            state["transaction_count"] = len(transactions)
+            state["next_page_data"] = next_page_data
+            transactions_checkpoint.save()
+
+    def _parse_transactions_page(
+        self,
+        page_response: AmazonSessionResponse,
+        next_page_data: dict[str, Any] | None,
+        min_date: datetime.date,
+        transactions: list[Transaction],
+    ) -> dict[str, str] | None:
+        self.amazon_session.check_response(page_response, meta=next_page_data)
+
+        form_tag = util.select_one(page_response.parsed, self.config.selectors.TRANSACTION_HISTORY_FORM_SELECTOR)
+
+        if not form_tag:
+            transaction_container = util.select_one(
+                page_response.parsed, self.config.selectors.TRANSACTION_HISTORY_CONTAINER_SELECTOR
+            )
+            if transaction_container and "don't have any transactions" in transaction_container.text:
+                return None
+            else:
+                raise AmazonOrdersError("Could not parse Transaction history. Check if Amazon changed the HTML.")
+
+        loaded_transactions, loaded_next_page_data = _parse_transaction_form_tag(form_tag, self.config)
+
+        for transaction in loaded_transactions:
+            if transaction.completed_date >= min_date:
+                transactions.append(transaction)
+            else:
+                return None
+
+        return loaded_next_page_data
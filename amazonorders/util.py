@@ -1,33 +1,445 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import codecs
+import functools
 import importlib
 import logging
 import re
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Iterable
+from html.parser import HTMLParser
 from typing import Any
+from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup, Tag
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.builder import builder_registry
 from requests import Response
 
+from amazonorders.exception import AmazonOrdersError
 from amazonorders.selectors import Selector
 
 logger = logging.getLogger(__name__)
 
+#: The BeautifulSoup parsers to try, fastest first, when ``bs4_parser`` is ``auto``. ``html.parser`` is built in to
+#: Python, so it is always available.
+AUTO_BS4_PARSERS = ["lxml", "html.parser"]
+
+#: How far into a response's body to look for a ``<meta>`` charset, when its ``Content-Type`` doesn't declare one.
+META_CHARSET_SCAN_BYTES = 4096
+
+_META_CHARSET_REGEX = re.compile(rb"<meta[^>]*?charset\s*=\s*[\"']?\s*([\w.:+-]+)", re.IGNORECASE)
+
+
+class ResponseClassifier:
+    """
+    Labels a response with the type of page it is (ex. a sign-in redirect or a Captcha challenge) from its status,
+    URL, and a scan of its body for the markers on :class:`~amazonorders.constants.Constants` (ex.
+    ``CAPTCHA_MARKERS``), without parsing it. This is used to decide whether a response needs to be parsed at all,
+    and which :class:`~amazonorders.forms.AuthForm` to try on it.
+    """
+
+    #: A page with the requested content.
+    OK = "ok"
+    #: The sign-in page, which Amazon redirects to when the session is not authenticated.
+    SIGN_IN_REDIRECT = "sign_in_redirect"
+    #: A Captcha challenge.
+    CAPTCHA = "captcha"
+    #: A one-time password challenge, or the choice of device to send one to.
+    MFA = "mfa"
+    #: A JavaScript-based bot challenge, which this library cannot solve.
+    BOT_CHALLENGE = "bot_challenge"
+    #: A ``5xx`` status.
+    SERVER_ERROR = "server_error"
+    #: Any other unsuccessful status.
+    ERROR = "error"
+
+    def __init__(self, constants: Any) -> None:
+        #: The constants with the URLs and markers to classify responses with.
+        self.constants: Any = constants
+
+    def classify(self, response: Response) -> str:
+        """
+        Classify the given response, whose body must already have been read.
+
+        :param response: The response to classify.
+        :return: The type of page, one of the values on this class (ex. :attr:`OK`).
+        """
+        content = response.content or b""
+
+        # A bot challenge may come with any status, and looks like throttling to the rate limiter either way
+        if self._contains_in_order(content, self.constants.BOT_CHALLENGE_MARKERS):
+            return self.BOT_CHALLENGE
+        if response.status_code >= 500:
+            return self.SERVER_ERROR
+        if not response.ok:
+            return self.ERROR
+        # Challenges are checked before the sign-in page, since they may be served from the sign-in URL
+        if self._contains_any(content, self.constants.CAPTCHA_MARKERS):
+            return self.CAPTCHA
+        if self._contains_any(content, self.constants.MFA_MARKERS):
+            return self.MFA
+        if response.url.startswith(self.constants.SIGN_IN_URL) or self._contains_any(
+            content, self.constants.SIGN_IN_FORM_MARKERS
+        ):
+            return self.SIGN_IN_REDIRECT
+        return self.OK
+
+    def _contains_any(self, content: bytes, markers: list[bytes]) -> bool:
+        return any(marker in content for marker in markers)
+
+    def _contains_in_order(self, content: bytes, markers: list[bytes]) -> bool:
+        if not markers:
+            return False
+
+        position = 0
+        for marker in markers:
+            position = content.find(marker, position)
+            if position == -1:
+                return False
+            position += len(marker)
+        return True
+
 
 class AmazonSessionResponse:
     """
     A wrapper for the :class:`requests.Response` object, which also contains the parsed HTML.
     """
 
-    def __init__(self, response: Response, bs4_parser: str) -> None:
+    #: The size of the chunks in which a response's body is read when it is streamed to an :class:`ElementStream`.
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        response: Response,
+        bs4_parser: str,
+        parse_only: list[str] | None = None,
+        element_stream: "ElementStream | None" = None,
+        classifier: ResponseClassifier | None = None,
+        lazy_parse: bool = False,
+    ) -> None:
         #: The request's response object.
         self.response: Response = response
-        #: The parsed HTML from the response.
-        self.parsed: Tag = BeautifulSoup(self.response.text, bs4_parser)
+        #: The elements that were handed off to ``element_stream`` as the body was read, in document order, or
+        #: ``None`` if the response was not streamed.
+        self.elements: list[Tag] | None = None
+        #: The charset the body was decoded with (see :func:`get_charset`).
+        self.encoding: str = "utf-8"
+        #: The number of seconds spent decoding and parsing the body (not including the time spent reading it).
+        self.decode_seconds: float = 0
+
+        page_type = urlparse(self.response.url).path
+        markup: str | bytes
+        if element_stream is not None:
+            markup = self._stream(element_stream, bs4_parser, page_type)
+            self.elements = element_stream.elements
+        else:
+            # The body is handed to the parser as bytes, rather than decoding it to a str first
+            markup = self.response.content
+            self.encoding = get_charset(self.response)
+        # So response.text uses the same charset, rather than detecting one
+        self.response.encoding = self.encoding
+
+        #: The type of page, if a ``classifier`` was given (see :class:`ResponseClassifier`).
+        self.response_type: str | None = classifier.classify(self.response) if classifier else None
+
+        self._markup: str | bytes | None = markup
+        self._parse_kwargs: dict[str, Any] = {
+            "bs4_parser": bs4_parser,
+            "page_type": page_type,
+            "parse_only": parse_only,
+            "encoding": self.encoding,
+        }
+        self._parsed: Tag | None = None
+        if not lazy_parse and self.response_type in (None, ResponseClassifier.OK):
+            # Parse the pages with the requested content now (ex. on an executor thread), and anything else only if
+            # it's needed
+            self._parse()
+
+    @property
+    def parsed(self) -> Tag:
+        """
+        The parsed HTML from the response. If ``parse_only`` was given, only the matching elements were parsed. If
+        the response was streamed, the elements handed off to ``element_stream`` are not part of it. Responses that
+        were not classified as :attr:`ResponseClassifier.OK` (or were requested with ``lazy_parse``) are only parsed
+        the first time this is accessed.
+        """
+        return self._parse()
+
+    @property
+    def is_parsed(self) -> bool:
+        """
+        ``True`` if the response has been parsed.
+        """
+        return self._parsed is not None
+
+    def _parse(self) -> Tag:
+        if self._parsed is None:
+            start = time.perf_counter()
+            self._parsed = parse_html(self._markup or b"", **self._parse_kwargs)
+            self.decode_seconds += time.perf_counter() - start
+            self._markup = None
+        return self._parsed
+
+    def _stream(self, element_stream: "ElementStream", bs4_parser: str, page_type: str) -> str:
+        element_stream.reset()
+        element_stream.bs4_parser = bs4_parser
+        element_stream.page_type = page_type
+
+        decoder = None
+        chunks = []
+        for chunk in self.response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+            if decoder is None:
+                self.encoding = get_charset(self.response, head=chunk)
+                decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+            chunks.append(chunk)
+
+            start = time.perf_counter()
+            element_stream.feed(decoder.decode(chunk))
+            self.decode_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        if decoder is not None:
+            element_stream.feed(decoder.decode(b"", final=True))
+        element_stream.close()
+        self.decode_seconds += time.perf_counter() - start
+
+        if self.response._content is False:
+            # The body was read from the connection as it was streamed, so keep it for response.content
+            self.response._content = b"".join(chunks)
+
+        return element_stream.remainder
+
+
+def parse_html(
+    markup: str | bytes,
+    bs4_parser: str,
+    page_type: str | None = None,
+    parse_only: list[str] | None = None,
+    encoding: str | None = None,
+) -> BeautifulSoup:
+    """
+    Parse the given HTML with BeautifulSoup, using the given parser. All of the library's parsing goes through
+    this function, so every page is parsed with the same backend, and :class:`~amazonorders.selectors.Selectors` can
+    be evaluated the same way regardless of which is used.
+
+    :param markup: The HTML to parse.
+    :param bs4_parser: The BeautifulSoup parser to use, or ``auto`` to use the fastest one that is installed (see
+        :attr:`AUTO_BS4_PARSERS`).
+    :param page_type: The type of page being parsed, for :class:`SelectorStats` (see :func:`get_page_type`).
+    :param parse_only: If given, only the elements matching these compound CSS selectors (ex. ``div#orderDetails``,
+        but not ``div#orderDetails span``), and their descendants, are parsed, which is faster and uses less memory
+        than parsing the whole page. If none of them match, the whole page is parsed.
+    :param encoding: If ``markup`` is ``bytes``, the charset it is encoded with, so the parser doesn't have to detect
+        it.
+    :return: The parsed HTML.
+    """
+    bs4_parser = resolve_bs4_parser(bs4_parser)
+    from_encoding = encoding if isinstance(markup, bytes) else None
+
+    parsed = None
+    if parse_only:
+        parsed = BeautifulSoup(
+            markup, bs4_parser, parse_only=_ParseOnlyStrainer(parse_only), from_encoding=from_encoding
+        )
+        if not parsed.find(True, recursive=False):
+            logger.debug(f"No elements matched {parse_only}, so the whole page will be parsed")
+            parsed = None
+    if parsed is None:
+        parsed = BeautifulSoup(markup, bs4_parser, from_encoding=from_encoding)
+
+    if page_type:
+        parsed.__dict__["amazon_orders_page_type"] = page_type
+    return parsed
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_bs4_parser(bs4_parser: str) -> str:
+    """
+    Resolve the BeautifulSoup parser to use for the given ``bs4_parser`` config value.
+
+    :param bs4_parser: The BeautifulSoup parser, or ``auto`` to use the fastest one that is installed.
+    :return: The BeautifulSoup parser.
+    """
+    if bs4_parser != "auto":
+        return bs4_parser
+
+    for candidate in AUTO_BS4_PARSERS:
+        if builder_registry.lookup(candidate):
+            logger.debug(f"Using BeautifulSoup parser {candidate}")
+            return candidate
+
+    return "html.parser"  # pragma: no cover
 
 
-def select(parsed: Tag, selector: list[str | Selector] | str | Selector) -> list[Tag]:
+def get_charset(response: Response, head: bytes | None = None, default: str = "utf-8") -> str:
+    """
+    Get the charset of the given response's body, without detecting it from the body's contents. The charset declared
+    by the response's ``Content-Type`` header is used, then one declared by a ``<meta>`` tag in the first
+    :attr:`META_CHARSET_SCAN_BYTES` of the body, and otherwise ``default``.
+
+    :param response: The response.
+    :param head: The start of the body, if it hasn't been read yet (ex. it is being streamed).
+    :param default: The charset to use if the response doesn't declare a known one.
+    :return: The charset, as a Python codec name.
+    """
+    charset = None
+    _, *params = (response.headers.get("Content-Type") or "").split(";")
+    for param in params:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            charset = value.strip(" \"'")
+
+    if not charset:
+        if head is None:
+            head = response.content or b""
+        match = _META_CHARSET_REGEX.search(head[:META_CHARSET_SCAN_BYTES])
+        if match:
+            charset = match.group(1).decode("ascii")
+
+    try:
+        return codecs.lookup(charset or default).name
+    except LookupError:
+        logger.debug(f"Unknown charset {charset}, so {default} will be used")
+        return codecs.lookup(default).name
+
+
+class SelectorStats:
+    """
+    Counts of which alternative in each list of selectors matched, per page type (the path of the page's URL), which
+    shows which layouts Amazon is serving. Populated by :func:`select` and :func:`select_one` for the ``list``
+    selectors on the config's :class:`~amazonorders.selectors.Selectors`, and available from
+    :attr:`~amazonorders.conf.AmazonOrdersConfig.selector_stats`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Maps (selector name, page type) to hit counts for each alternative, followed by the miss count
+        self._counts: dict[tuple[str, str], list[int]] = {}
+        # Maps selector names to a label for each alternative
+        self._labels: dict[str, list[str]] = {}
+
+    def record(self, name: str, page_type: str, alternatives: list[str | Selector], index: int | None) -> None:
+        """
+        Record that the alternative at ``index`` matched, or that none did if ``index`` is ``None``.
+
+        :param name: The name of the selector list.
+        :param page_type: The type of page on which the selection was made.
+        :param alternatives: The alternatives in the selector list.
+        :param index: The index of the alternative that matched.
+        """
+        size = len(alternatives)
+        with self._lock:
+            counts = self._counts.get((name, page_type))
+            if counts is None:
+                counts = self._counts[(name, page_type)] = [0] * (size + 1)
+                if name not in self._labels:
+                    self._labels[name] = [_selector_label(s) for s in alternatives]
+            counts[index if index is not None else size] += 1
+
+    def preferred(self, name: str, page_type: str) -> int | None:
+        """
+        Get the index of the alternative that has matched most often on this type of page.
+
+        :param name: The name of the selector list.
+        :param page_type: The type of page on which the selection is being made.
+        :return: The index of the alternative, or ``None`` if none has matched yet.
+        """
+        with self._lock:
+            counts = self._counts.get((name, page_type))
+            if not counts:
+                return None
+            hits = counts[:-1]
+
+        best = max(range(len(hits)), key=hits.__getitem__)
+        return best if hits[best] else None
+
+    def get_stats(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """
+        Get the hit and miss counts.
+
+        :return: A dict of each selector name to a dict of each page type to its ``hits`` (a dict of each
+            alternative to how many times it matched) and ``misses`` (how many times no alternative matched).
+        """
+        with self._lock:
+            counts = {key: list(value) for key, value in self._counts.items()}
+            labels = dict(self._labels)
+
+        stats: dict[str, dict[str, dict[str, Any]]] = {}
+        for (name, page_type), value in sorted(counts.items()):
+            stats.setdefault(name, {})[page_type] = {
+                "hits": dict(zip(labels[name], value[:-1])),
+                "misses": value[-1],
+            }
+        return stats
+
+    def reset(self) -> None:
+        """
+        Clear all counts.
+        """
+        with self._lock:
+            self._counts.clear()
+            self._labels.clear()
+
+
+def _selector_label(selector: str | Selector) -> str:
+    if isinstance(selector, Selector):
+        return f"{selector.css_selector} (text={selector.text!r})"
+    return selector
+
+
+class SelectorList(list):
+    """
+    A ``list`` of alternative selectors from :class:`~amazonorders.selectors.Selectors`, as compiled by
+    :func:`compile_selectors`, which records which alternative matches in a :class:`SelectorStats`. If ``adaptive``,
+    the alternative that has matched most often on the type of page being parsed is tried first.
+    """
+
+    def __init__(self, name: str, selectors: list[str | Selector], stats: SelectorStats, adaptive: bool) -> None:
+        super().__init__(selectors)
+
+        #: The name of the selector on :class:`~amazonorders.selectors.Selectors`.
+        self.name: str = name
+        #: Where matches are recorded.
+        self.stats: SelectorStats = stats
+        #: ``True`` if the most frequently matched alternative should be tried first.
+        self.adaptive: bool = adaptive
+
+    def __reduce__(self) -> Any:
+        # Pickled as a plain list, since the stats belong to the config that compiled it
+        return list, (list(self),)
+
+    def order(self, page_type: str) -> list[int]:
+        """
+        Get the indexes of the alternatives, in the order they should be tried on the given type of page.
+
+        :param page_type: The type of page on which the selection is being made.
+        :return: The indexes of the alternatives.
+        """
+        indexes = list(range(len(self)))
+        if self.adaptive:
+            preferred = self.stats.preferred(self.name, page_type)
+            if preferred:
+                indexes.remove(preferred)
+                indexes.insert(0, preferred)
+        return indexes
+
+    def record(self, page_type: str, index: int | None) -> None:
+        """
+        Record that the alternative at ``index`` matched on the given type of page, or that none did if ``index`` is
+        ``None``.
+
+        :param page_type: The type of page on which the selection was made.
+        :param index: The index of the alternative that matched.
+        """
+        self.stats.record(self.name, page_type, self, index)
+
+
+def select(
+    parsed: Tag, selector: list[str | Selector] | str | Selector, extracted: dict[str, list[Tag]] | None = None
+) -> list[Tag]:
     """
     This is a helper function that extends BeautifulSoup's `select() <https://www.crummy.com/software/
     BeautifulSoup/bs4/doc/#css-selectors-through-the-css-property>`_ method to allow for multiple selectors.
@@ -36,30 +448,16 @@ def select(parsed: Tag, selector: list[str | Selector] | str | Selector) -> list
 
     :param parsed: The ``Tag`` from which to attempt selection.
     :param selector: The CSS selector(s) for the field.
+    :param extracted: The matches of CSS selectors within ``parsed``, from :func:`extract`, which are used instead of
+        searching ``parsed`` again.
     :return: The selected tag.
     """
-    if isinstance(selector, str) or isinstance(selector, Selector):
-        selector = [selector]
-
-    for s in selector:
-        tag: list = []
-
-        if isinstance(s, Selector):
-            for t in parsed.select(s.css_selector):
-                if t and t.text.strip() == s.text:
-                    tag += t
-        elif isinstance(s, str):
-            tag = parsed.select(s)
-        else:
-            raise TypeError(f"Invalid selector type: {type(s)}")
-
-        if tag:
-            return tag
-
-    return []
+    return _select(parsed, selector, functools.partial(_select_all, extracted=extracted)) or []
 
 
-def select_one(parsed: Tag, selector: list[str | Selector] | str | Selector) -> Tag | None:
+def select_one(
+    parsed: Tag, selector: list[str | Selector] | str | Selector, extracted: dict[str, list[Tag]] | None = None
+) -> Tag | None:
     """
     This is a helper function that extends BeautifulSoup's `select_one() <https://www.crummy.com/software/
     BeautifulSoup/bs4/doc/#css-selectors-through-the-css-property>`_ method to allow for multiple selectors.
@@ -68,26 +466,366 @@ def select_one(parsed: Tag, selector: list[str | Selector] | str | Selector) ->
 
     :param parsed: The ``Tag`` from which to attempt selection.
     :param selector: The CSS selector(s) for the field.
+    :param extracted: The matches of CSS selectors within ``parsed``, from :func:`extract`, which are used instead of
+        searching ``parsed`` again.
     :return: The selection tag.
     """
-    if isinstance(selector, str) or isinstance(selector, Selector):
-        selector = [selector]
+    return _select(parsed, selector, functools.partial(_select_first, extracted=extracted))
+
 
-    for s in selector:
-        tag: Tag | None = None
+def extract(parsed: Tag, css_selectors: Iterable[str]) -> dict[str, list[Tag]]:
+    """
+    Find the matches of many CSS selectors within ``parsed`` in a single pass over its descendants, rather than
+    searching it once per selector. The result can be passed to :func:`select` and :func:`select_one` as
+    ``extracted``, for any selectors (or alternatives) that were extracted.
 
-        if isinstance(s, Selector):
-            t = parsed.select_one(s.css_selector)
-            if t and t.text.strip() == s.text:
-                tag = t
-        elif isinstance(s, str):
-            tag = parsed.select_one(s)
+    Each selector is indexed by the ID, class, attribute, or tag name its matches must have, so most descendants are
+    only checked against the few selectors they could match.
+
+    :param parsed: The ``Tag`` from which to extract.
+    :param css_selectors: The CSS selectors to match.
+    :return: A dict of each CSS selector to its matches, in document order (as ``select()`` would return them).
+    """
+    extracted: dict[str, list[Tag]] = {}
+    # Maps a key (ex. a class name) to the selectors that can only match a Tag with that key
+    indexed: dict[tuple[str, str], list[tuple[soupsieve.SoupSieve, list[Tag]]]] = {}
+    unindexed: list[tuple[soupsieve.SoupSieve, list[Tag]]] = []
+
+    for css_selector in css_selectors:
+        if css_selector in extracted:
+            continue
+
+        compiled_selector = compile_selector(css_selector)
+        matches = extracted[css_selector] = []
+        keys = {_index_key(s) for s in compiled_selector.selectors}
+        if None in keys:
+            unindexed.append((compiled_selector, matches))
         else:
-            raise TypeError(f"Invalid selector type: {type(s)}")
+            for key in keys:
+                indexed.setdefault(key, []).append((compiled_selector, matches))  # type: ignore[arg-type]
+
+    for tag in parsed.descendants:
+        if not isinstance(tag, Tag):
+            continue
+
+        candidates = list(unindexed)
+        for key in _tag_keys(tag.name, tag.attrs):
+            candidates += indexed.get(key, ())
+
+        matched: set[int] = set()
+        for compiled_selector, matches in candidates:
+            # A selector indexed under more than one key can be a candidate more than once
+            if id(matches) not in matched and compiled_selector.match(tag):
+                matched.add(id(matches))
+                matches.append(tag)
+
+    return extracted
+
+
+def _index_key(selector: Any) -> tuple[str, str] | None:
+    # The selector's rightmost compound, which the matched Tag itself must satisfy
+    if selector.ids:
+        return "#", selector.ids[0].lower()
+    if selector.classes:
+        return ".", selector.classes[0].lower()
+    for attribute in selector.attributes:
+        if not attribute.inverse and not attribute.prefix:
+            return "@", attribute.attribute.lower()
+    if selector.tag and selector.tag.name != "*" and not selector.tag.prefix:
+        return "<", selector.tag.name.lower()
+    return None
+
+
+class _CompoundSelectorMatcher:
+    # Matches a tag against compound CSS selectors given only its name and attributes (ex. while it is being parsed,
+    # when its parents and children don't exist yet), only evaluating the selectors that could possibly match it
+
+    def __init__(self, css_selectors: list[str]) -> None:
+        self._indexed: dict[tuple[str, str], list[soupsieve.SoupSieve]] = {}
+        self._unindexed: list[soupsieve.SoupSieve] = []
+        for css_selector in css_selectors:
+            compiled_selector = compile_selector(css_selector)
+            keys = {_index_key(s) for s in compiled_selector.selectors}
+            if None in keys:
+                self._unindexed.append(compiled_selector)
+            else:
+                for key in keys:
+                    self._indexed.setdefault(key, []).append(compiled_selector)  # type: ignore[arg-type]
+
+    def matches(self, name: str, attrs: Any) -> bool:
+        attrs = {attribute: "" if value is None else value for attribute, value in dict(attrs).items()}
+
+        candidates = list(self._unindexed)
+        for key in _tag_keys(name, attrs):
+            candidates += self._indexed.get(key, ())
+        if not candidates:
+            return False
+
+        tag = Tag(name=name, attrs=attrs)
+        return any(compiled_selector.match(tag) for compiled_selector in candidates)
+
+
+class _ParseOnlyStrainer(SoupStrainer):
+    # Allows the elements that match any of the given compound CSS selectors to be created while parsing. Implements
+    # the parse-time hooks of both bs4 < 4.13 (search_tag()) and bs4 >= 4.13 (allow_tag_creation())
+
+    def __init__(self, css_selectors: list[str]) -> None:
+        super().__init__()
+
+        self._matcher = _CompoundSelectorMatcher(css_selectors)
+
+    def allow_tag_creation(self, nsprefix: str | None, name: str, attrs: dict[str, Any] | None) -> bool:
+        return self._matcher.matches(name, attrs or {})
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+    def search_tag(self, markup_name: Any = None, markup_attrs: Any = None) -> bool:
+        return self._matcher.matches(markup_name, markup_attrs or {})
+
+
+def _tag_keys(name: str, attrs: dict[str, Any]) -> list[tuple[str, str]]:
+    keys = [("<", name.lower())]
+    for attribute, value in attrs.items():
+        keys.append(("@", attribute.lower()))
+        if attribute == "class":
+            keys += [(".", c.lower()) for c in (value if isinstance(value, list) else value.split())]
+        elif attribute == "id" and isinstance(value, str):
+            keys.append(("#", value.lower()))
+    return keys
+
+
+class ElementStream(HTMLParser):
+    """
+    Incrementally parses HTML as it is fed (ex. while a response's body is still downloading), and hands each element
+    that matches one of the given compound CSS selectors (ex. ``div.order-card``, but not ``div#orders div``) to
+    ``on_element`` as soon as its end tag has been read, rather than once the whole page has arrived. Only the
+    outermost matching elements are handed off, so a list of alternatives (ex. ``["div.order-card", "div.order"]``)
+    behaves like :func:`select` does for alternatives nested within one another.
+
+    Pass one as ``element_stream`` to :func:`~amazonorders.session.AmazonSession.request`, which feeds it the body as
+    it is read. Each handed off element is parsed on its own, and the rest of the page (the
+    :attr:`remainder`) becomes the response's :attr:`~AmazonSessionResponse.parsed` HTML.
+    """
+
+    def __init__(self, css_selectors: list[str], on_element: Callable[[Tag], None] | None = None) -> None:
+        self._matcher = _CompoundSelectorMatcher(css_selectors)
+
+        #: Called with each matching element, in document order, as soon as it has been parsed.
+        self.on_element: Callable[[Tag], None] | None = on_element
+        #: The BeautifulSoup parser each matching element is parsed with.
+        self.bs4_parser: str = "html.parser"
+        #: The type of page being parsed (see :func:`get_page_type`).
+        self.page_type: str | None = None
+
+        super().__init__(convert_charrefs=False)
+
+    def reset(self) -> None:
+        """
+        Discard everything fed so far, so the stream can be fed a page from the beginning (ex. when a request is
+        retried).
+        """
+        super().reset()
+
+        #: The matching elements handed off so far, in document order.
+        self.elements: list[Tag] = []
+        #: Once closed, the HTML that was fed, less the matching elements.
+        self.remainder: str = ""
+
+        # The chunks fed since the last hand-off, which start at _remainder_start, and the total length fed
+        self._chunks: list[str] = []
+        self._fed = 0
+        self._line_starts = [0]
+        self._remainder_parts: list[str] = []
+        self._remainder_start = 0
+        self._element_name: str | None = None
+        self._element_start = 0
+        self._element_depth = 0
+
+    def feed(self, data: str) -> None:
+        """
+        Feed the next chunk of HTML, handing off any matching elements it completes.
+
+        :param data: The HTML to feed.
+        """
+        offset = self._fed
+        self._chunks.append(data)
+        self._fed += len(data)
+        line_end = data.find("\n")
+        while line_end != -1:
+            self._line_starts.append(offset + line_end + 1)
+            line_end = data.find("\n", line_end + 1)
+
+        super().feed(data)
+
+    def close(self) -> None:
+        """
+        Finish parsing what has been fed, handing off the last matching element if it was never closed.
+        """
+        super().close()
+
+        if self._element_name is not None:
+            self._hand_off(self._fed)
+
+        self.remainder = "".join(self._remainder_parts) + self._buffer()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._element_name is None:
+            if self._matcher.matches(tag, attrs):
+                self._element_name = tag
+                self._element_start = self._offset()
+                self._element_depth = 1
+        elif tag == self._element_name:
+            self._element_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._element_name is None and self._matcher.matches(tag, attrs):
+            self._element_name = tag
+            self._element_start = self._offset()
+            self._hand_off(self._element_start + len(self.get_starttag_text() or ""))
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != self._element_name:
+            return
+
+        self._element_depth -= 1
+        if self._element_depth == 0:
+            start = self._remainder_start
+            self._hand_off(self._buffer().index(">", self._offset() - start) + start + 1)
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+
+    def _buffer(self) -> str:
+        # Joined only when an element is handed off (or the stream is closed), rather than on every feed, so each chunk
+        # is only copied about once
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def _hand_off(self, end: int) -> None:
+        name = self._element_name
+        buffer = self._buffer()
+        element_start = self._element_start - self._remainder_start
+        element_end = end - self._remainder_start
+        self._remainder_parts.append(buffer[:element_start])
+        markup = buffer[element_start:element_end]
+        self._chunks = [buffer[element_end:]]
+        self._remainder_start = end
+        self._element_name = None
+
+        element = parse_html(markup, self.bs4_parser, page_type=self.page_type).find(name)
+        if element is None:
+            return
+
+        self.elements.append(element)
+        if self.on_element is not None:
+            self.on_element(element)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_selector(css_selector: str) -> soupsieve.SoupSieve:
+    """
+    Compile the given CSS selector, so that it is only parsed once, no matter how many entities it is evaluated on.
+
+    :param css_selector: The CSS selector.
+    :return: The compiled selector, with ``select()`` and ``select_one()`` methods that take the ``Tag`` from which
+        to select.
+    """
+    return soupsieve.compile(css_selector)
+
+
+def compile_selectors(selectors: Any, stats: SelectorStats | None = None, adaptive: bool = False) -> None:
+    """
+    Compile every CSS selector on the given :class:`~amazonorders.selectors.Selectors`, including those in ``list``'s
+    and :class:`~amazonorders.selectors.Selector`'s, so that an invalid selector fails when the config is loaded,
+    rather than when it is first used.
+
+    If ``stats`` are given, each ``list`` on ``selectors`` is also replaced with a :class:`SelectorList`, which records
+    in ``stats`` which of its alternatives match.
+
+    :param selectors: The selectors to compile.
+    :param stats: Where to record which alternatives match.
+    :param adaptive: ``True`` if the alternative that matches most often should be tried first.
+    """
+    for name in dir(selectors):
+        if not name.isupper():
+            continue
+
+        value = getattr(selectors, name)
+        if stats is not None and isinstance(value, list):
+            setattr(selectors, name, SelectorList(name, value, stats, adaptive))
+
+        for s in value if isinstance(value, list) else [value]:
+            css_selector = s.css_selector if isinstance(s, Selector) else s
+            if not isinstance(css_selector, str):
+                continue
+
+            try:
+                compile_selector(css_selector)
+            except soupsieve.SelectorSyntaxError as e:
+                raise AmazonOrdersError(f"The selector {name} is invalid: {css_selector}") from e
+
+
+def get_page_type(parsed: Tag) -> str:
+    """
+    Get the type of page the given ``Tag`` was parsed from, which is the path of the page's URL, if it was parsed
+    from an :class:`AmazonSessionResponse`.
+
+    :param parsed: The ``Tag``.
+    :return: The page type, or ``unknown``.
+    """
+    root = parsed
+    while root.parent is not None:
+        root = root.parent
+
+    # Read from __dict__, since BeautifulSoup treats other unknown attributes as a search for a child tag
+    return root.__dict__.get("amazon_orders_page_type") or "unknown"
+
+
+def _select_all(parsed: Tag, s: str | Selector, extracted: dict[str, list[Tag]] | None = None) -> list[Tag]:
+    if isinstance(s, Selector):
+        return [t for t in _select_all(parsed, s.css_selector, extracted) if t and t.text.strip() == s.text]
+    elif isinstance(s, str):
+        if extracted is not None and s in extracted:
+            return list(extracted[s])
+        return compile_selector(s).select(parsed)
+    else:
+        raise TypeError(f"Invalid selector type: {type(s)}")
+
+
+def _select_first(parsed: Tag, s: str | Selector, extracted: dict[str, list[Tag]] | None = None) -> Tag | None:
+    if isinstance(s, Selector):
+        t = _select_first(parsed, s.css_selector, extracted)
+        return t if t and t.text.strip() == s.text else None
+    elif isinstance(s, str):
+        if extracted is not None and s in extracted:
+            return extracted[s][0] if extracted[s] else None
+        return compile_selector(s).select_one(parsed)
+    else:
+        raise TypeError(f"Invalid selector type: {type(s)}")
+
+
+def _select(parsed: Tag, selector: list[str | Selector] | str | Selector, select_function: Callable) -> Any:
+    if isinstance(selector, str) or isinstance(selector, Selector):
+        return select_function(parsed, selector) or None
+
+    if not isinstance(selector, SelectorList):
+        for s in selector:
+            tag = select_function(parsed, s)
+            if tag:
+                return tag
+        return None
 
+    page_type = get_page_type(parsed)
+    for i in selector.order(page_type):
+        tag = select_function(parsed, selector[i])
         if tag:
+            selector.record(page_type, i)
             return tag
 
+    selector.record(page_type, None)
     return None
 
 
@@ -0,0 +1,212 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import io
+import pickle
+from typing import IO, Any
+from urllib.parse import urlparse
+
+from amazonorders import util
+from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.entity.order import Order
+from amazonorders.exception import AmazonOrdersError
+
+# The config entities are built with in a parse worker process, set by init_worker() when the process starts
+_config: AmazonOrdersConfig | None = None
+
+
+class _ConfigPickler(pickle.Pickler):
+    # Pickles references to the given config, rather than the config itself, so that each process's entities share
+    # the config of the process they are loaded in
+
+    def __init__(self, file: IO[bytes], config: AmazonOrdersConfig) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.config = config
+
+    def persistent_id(self, obj: Any) -> str | None:
+        return "config" if obj is self.config else None
+
+
+class _ConfigUnpickler(pickle.Unpickler):
+    def __init__(self, file: IO[bytes], config: AmazonOrdersConfig) -> None:
+        super().__init__(file)
+
+        self.config = config
+
+    def persistent_load(self, pid: Any) -> AmazonOrdersConfig:
+        if pid != "config":
+            raise pickle.UnpicklingError(f"Unknown persistent ID {pid}")  # pragma: no cover
+
+        return self.config
+
+
+def dumps(obj: Any, config: AmazonOrdersConfig) -> bytes:
+    """
+    Pickle the given entities (or anything containing them) to be sent to or from a parse worker process, leaving
+    out ``config``, which each process has its own copy of.
+
+    :param obj: The object to pickle.
+    :param config: The config of the current process.
+    :return: The pickled object.
+    """
+    f = io.BytesIO()
+    dump(obj, f, config)
+    return f.getvalue()
+
+
+def dump(obj: Any, file: IO[bytes], config: AmazonOrdersConfig) -> None:
+    """
+    Pickle the given entities (or anything containing them) to a file, leaving out ``config`` (and so the credentials
+    in it), like :func:`dumps`.
+
+    :param obj: The object to pickle.
+    :param file: The file to write to.
+    :param config: The config of the current process.
+    """
+    _ConfigPickler(file, config).dump(obj)
+
+
+def loads(data: bytes, config: AmazonOrdersConfig) -> Any:
+    """
+    Unpickle an object pickled by :func:`dumps`, with the current process's ``config``.
+
+    :param data: The pickled object.
+    :param config: The config of the current process.
+    :return: The unpickled object.
+    """
+    return load(io.BytesIO(data), config)
+
+
+def load(file: IO[bytes], config: AmazonOrdersConfig) -> Any:
+    """
+    Unpickle the next object pickled to a file by :func:`dump`, with the current process's ``config``.
+
+    :param file: The file to read from.
+    :param config: The config of the current process.
+    :return: The unpickled object.
+    """
+    return _ConfigUnpickler(file, config).load()
+
+
+def init_worker(config: AmazonOrdersConfig) -> None:
+    """
+    Initialize a parse worker process with the config to build entities with. This is the ``initializer`` of
+    :attr:`~amazonorders.session.AmazonSession.parse_executor`.
+
+    :param config: The config to use.
+    """
+    global _config
+    _config = config
+
+
+def build_orders(
+    markup: bytes, encoding: str, url: str, start_index: int, fields: frozenset[str] | None = None
+) -> bytes:
+    """
+    Build the Orders on an Order history page, in a parse worker process. So that the page doesn't also have to be
+    parsed by the process that requested it, what's needed to page through history is returned with the Orders.
+
+    An error building one Order is returned in its place (with ``index`` and ``order_number`` in its
+    :attr:`~amazonorders.exception.AmazonOrdersError.meta`), rather than failing the whole page.
+
+    :param markup: The body of the history page.
+    :param encoding: The charset of ``markup``.
+    :param url: The URL of the history page.
+    :param start_index: The index of the page's first Order.
+    :param fields: If given, only these fields are parsed.
+    :return: Each of the page's Orders (or the error that prevented building it) with whether it's an unsupported
+        Order type (one that matches ``ORDER_SKIP_ITEMS``), the ``href`` of the page's next page link, and the text of
+        its Order count (each ``None`` if not found), pickled with :func:`dumps`.
+    """
+    config = _get_config()
+
+    parsed = util.parse_html(
+        markup,
+        config.bs4_parser,
+        page_type=urlparse(url).path,
+        parse_only=config.selectors.ORDER_HISTORY_PAGE_SELECTOR if config.partial_parse else None,
+        encoding=encoding,
+    )
+    order_tags = util.select(parsed, config.selectors.ORDER_HISTORY_ENTITY_SELECTOR)
+
+    orders: list[tuple[Order | AmazonOrdersError, bool]] = []
+    for i, order_tag in enumerate(order_tags):
+        skip_items = len(util.select(order_tag, config.selectors.ORDER_SKIP_ITEMS)) > 0
+        order = None
+        try:
+            order = config.order_cls(order_tag, config, index=start_index + i, **_fields_kwargs(fields))
+            # Parsed here, rather than while pickling, so that one Order failing doesn't fail the page
+            order.materialize()
+            orders.append((order, skip_items))
+        except Exception as e:
+            # Only AmazonOrdersError's are known to be safe to pickle
+            error = e if isinstance(e, AmazonOrdersError) else AmazonOrdersError(repr(e))
+            error.meta = {
+                "order_number": getattr(order, "order_number", None),
+                **(error.meta or {}),
+                "index": start_index + i,
+            }
+            orders.append((error, skip_items))
+
+    next_page_tag = util.select_one(parsed, config.selectors.NEXT_PAGE_LINK_SELECTOR)
+    order_count_tag = util.select_one(parsed, config.selectors.ORDER_HISTORY_COUNT_SELECTOR)
+
+    return dumps(
+        (
+            orders,
+            str(next_page_tag["href"]) if next_page_tag else None,
+            order_count_tag.text if order_count_tag else None,
+        ),
+        config,
+    )
+
+
+def build_order_details(
+    markup: bytes, encoding: str, url: str, order_id: str, clone: bytes | None, fields: frozenset[str] | None = None
+) -> bytes:
+    """
+    Build an Order from its details page, in a parse worker process.
+
+    :param markup: The body of the details page.
+    :param encoding: The charset of ``markup``.
+    :param url: The URL of the details page.
+    :param order_id: The Amazon Order ID.
+    :param clone: The Order built from history, pickled with :func:`dumps`, if there is one.
+    :param fields: If given, only these fields are parsed.
+    :return: The Order, pickled with :func:`dumps`.
+    """
+    config = _get_config()
+
+    parsed = util.parse_html(
+        markup,
+        config.bs4_parser,
+        page_type=urlparse(url).path,
+        parse_only=config.selectors.ORDER_DETAILS_PAGE_SELECTOR if config.partial_parse else None,
+        encoding=encoding,
+    )
+    order_details_tag = util.select_one(parsed, config.selectors.ORDER_DETAILS_ENTITY_SELECTOR)
+
+    if not order_details_tag:
+        raise AmazonOrdersError(f"Could not parse details for Order {order_id}. Check if Amazon changed the HTML.")
+
+    order: Order = config.order_cls(
+        order_details_tag,
+        config,
+        full_details=True,
+        clone=loads(clone, config) if clone else None,
+        **_fields_kwargs(fields),
+    )
+    return dumps(order, config)
+
+
+def _get_config() -> AmazonOrdersConfig:
+    if _config is None:
+        raise AmazonOrdersError("The parse worker was not initialized, call init_worker() first.")  # pragma: no cover
+
+    return _config
+
+
+def _fields_kwargs(fields: frozenset[str] | None) -> dict[str, Any]:
+    # Only passed when a projection is requested, so custom order_class implementations without it still work
+    return {"fields": fields} if fields is not None else {}
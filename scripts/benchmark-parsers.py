@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import argparse
+import glob
+import os
+import time
+
+from amazonorders import util
+from amazonorders.conf import AmazonOrdersConfig
+from bs4.builder import builder_registry
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.abspath(os.path.dirname(__file__)), ".."))
+RESOURCES_DIR = os.path.join(ROOT_DIR, "tests", "resources")
+BENCHMARK_DIR = os.path.join(ROOT_DIR, "build", "benchmark")
+
+
+def _build_entities(parsed, config):
+    entities = []
+    for order_tag in util.select(parsed, config.selectors.ORDER_HISTORY_ENTITY_SELECTOR):
+        entities.append(config.order_cls(order_tag, config))
+    order_details_tag = util.select_one(parsed, config.selectors.ORDER_DETAILS_ENTITY_SELECTOR)
+    if order_details_tag:
+        entities.append(config.order_cls(order_details_tag, config, full_details=True))
+    for entity in entities:
+        entity.materialize()
+    return entities
+
+
+def benchmark_parsers(args):
+    """
+    The purpose of this script is to compare the per-page cost of each installed BeautifulSoup parser on the pages in
+    tests/resources, both to parse the page, and to then build its Orders with the configured Selectors.
+
+    This script can be invoked with `python scripts/benchmark-parsers.py`, and parsers that aren't installed are
+    skipped. Pass `--partial` to only parse the parts of each page that are needed, as requests do.
+    """
+    pages = sorted(glob.glob(os.path.join(RESOURCES_DIR, "orders", "*.html")))
+
+    print(f"{'parser':<12} {'page':<48} {'parse (ms)':>12} {'build (ms)':>12}")
+
+    for bs4_parser in args.parsers:
+        if not builder_registry.lookup(bs4_parser):
+            print(f"{bs4_parser:<12} not installed, skipping")
+            continue
+
+        config = AmazonOrdersConfig(
+            config_path=os.path.join(BENCHMARK_DIR, "config.yml"),
+            data={
+                "output_dir": BENCHMARK_DIR,
+                "cookie_jar_path": os.path.join(BENCHMARK_DIR, "cookies.json"),
+                "bs4_parser": bs4_parser,
+            },
+        )
+
+        total_parse = total_build = 0.0
+        for page in pages:
+            with open(page, encoding="utf-8") as f:
+                html = f.read()
+
+            parse_only = None
+            if args.partial:
+                if "order-history" in os.path.basename(page):
+                    parse_only = config.selectors.ORDER_HISTORY_PAGE_SELECTOR
+                else:
+                    parse_only = config.selectors.ORDER_DETAILS_PAGE_SELECTOR
+                parse_only = list(parse_only) + [config.selectors.SIGN_IN_FORM_SELECTOR]
+
+            parse_time = build_time = 0.0
+            for _ in range(args.iterations):
+                start = time.perf_counter()
+                parsed = util.parse_html(html, config.bs4_parser, parse_only=parse_only)
+                parse_time += time.perf_counter() - start
+
+                start = time.perf_counter()
+                _build_entities(parsed, config)
+                build_time += time.perf_counter() - start
+
+            parse_ms = parse_time / args.iterations * 1000
+            build_ms = build_time / args.iterations * 1000
+            total_parse += parse_ms
+            total_build += build_ms
+            print(f"{bs4_parser:<12} {os.path.basename(page):<48} {parse_ms:>12.2f} {build_ms:>12.2f}")
+
+        print(f"{bs4_parser:<12} {'total':<48} {total_parse:>12.2f} {total_build:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark BeautifulSoup parsers on the test resources.")
+    parser.add_argument("--parsers", nargs="+", default=["html.parser", "lxml", "html5lib"])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--partial", action="store_true")
+
+    benchmark_parsers(parser.parse_args())
@@ -1,9 +1,9 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+from amazonorders import util
 from amazonorders.conf import AmazonOrdersConfig
 from amazonorders.entity.item import Item
-from bs4 import BeautifulSoup
 from tests.unittestcase import UnitTestCase
 
 
@@ -30,7 +30,7 @@ class TestItem(UnitTestCase):
 </div>
 </div>
 """
-        parsed = BeautifulSoup(html, self.test_config.bs4_parser)
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
 
         # WHEN
         item = Item(parsed, self.test_config)
@@ -55,7 +55,7 @@ class TestItem(UnitTestCase):
 </div>
 </div>
 """
-        parsed = BeautifulSoup(html, lxml_config.bs4_parser)
+        parsed = util.parse_html(html, lxml_config.bs4_parser)
 
         # WHEN
         item = Item(parsed, lxml_config)
@@ -3,8 +3,8 @@ __license__ = "MIT"
 
 import os
 
+from amazonorders import util
 from amazonorders.entity.order import Order
-from bs4 import BeautifulSoup
 from tests.unittestcase import UnitTestCase
 
 
@@ -14,7 +14,7 @@ class TestOrder(UnitTestCase):
         with open(
             os.path.join(self.RESOURCES_DIR, "orders", "order-currency-stripped-snippet.html"), encoding="utf-8"
         ) as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         order = Order(parsed, self.test_config, full_details=True)
@@ -33,7 +33,7 @@ class TestOrder(UnitTestCase):
         with open(
             os.path.join(self.RESOURCES_DIR, "orders", "order-promotion-applied-snippet.html"), encoding="utf-8"
         ) as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         order = Order(parsed, self.test_config, full_details=True)
@@ -46,7 +46,7 @@ class TestOrder(UnitTestCase):
         with open(
             os.path.join(self.RESOURCES_DIR, "orders", "order-details-coupon-savings.html"), encoding="utf-8"
         ) as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         order = Order(parsed, self.test_config, full_details=True)
@@ -59,7 +59,7 @@ class TestOrder(UnitTestCase):
         with open(
             os.path.join(self.RESOURCES_DIR, "orders", "order-details-111-6778632-7354601.html"), encoding="utf-8"
         ) as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         order = Order(parsed, self.test_config, full_details=True)
@@ -72,10 +72,42 @@ class TestOrder(UnitTestCase):
         with open(
             os.path.join(self.RESOURCES_DIR, "orders", "order-details-coupon-savings-multiple.html"), encoding="utf-8"
         ) as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         order = Order(parsed, self.test_config, full_details=True)
 
         # THEN
         self.assertEqual(order.coupon_savings, -1.29)
+
+    def test_order_streamed_matches_parsed_page(self):
+        for filename in sorted(os.listdir(os.path.join(self.RESOURCES_DIR, "orders"))):
+            if not filename.startswith("order-history-"):
+                continue
+
+            with self.subTest(filename=filename):
+                # GIVEN
+                with open(os.path.join(self.RESOURCES_DIR, "orders", filename), encoding="utf-8") as f:
+                    html = f.read()
+                selector = self.test_config.selectors.ORDER_HISTORY_ENTITY_SELECTOR
+                element_stream = util.ElementStream(selector)
+                element_stream.bs4_parser = self.test_config.bs4_parser
+
+                # WHEN
+                for i in range(0, len(html), 4096):
+                    element_stream.feed(html[i:i + 4096])
+                element_stream.close()
+                order_tags = util.select(util.parse_html(html, self.test_config.bs4_parser), selector)
+                orders = [Order(order_tag, self.test_config) for order_tag in order_tags]
+                streamed_orders = [Order(order_tag, self.test_config) for order_tag in element_stream.elements]
+
+                # THEN
+                self.assertEqual(len(orders), len(streamed_orders))
+                for order, streamed_order in zip(orders, streamed_orders):
+                    self.assertEqual(order.order_number, streamed_order.order_number)
+                    self.assertEqual(order.grand_total, streamed_order.grand_total)
+                    self.assertEqual(order.order_placed_date, streamed_order.order_placed_date)
+                    self.assertEqual(order.order_details_link, streamed_order.order_details_link)
+                    self.assertEqual(str(order.recipient), str(streamed_order.recipient))
+                    self.assertEqual([str(i) for i in order.items], [str(i) for i in streamed_order.items])
+                    self.assertEqual([str(s) for s in order.shipments], [str(s) for s in streamed_order.shipments])
@@ -1,8 +1,12 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
-from amazonorders.entity.parsable import Parsable
-from bs4 import BeautifulSoup
+import pickle
+from unittest.mock import patch
+
+from amazonorders import util
+from amazonorders.entity.item import Item
+from amazonorders.entity.parsable import Parsable, lazy_field
 from tests.unittestcase import UnitTestCase
 
 
@@ -10,7 +14,7 @@ class TestItem(UnitTestCase):
     def test_to_currency(self):
         # GIVEN
         html = "<html />"
-        parsed = BeautifulSoup(html, self.test_config.bs4_parser)
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
 
         # WHEN
         parsable = Parsable(parsed, self.test_config)
@@ -23,3 +27,132 @@ class TestItem(UnitTestCase):
         self.assertEqual(parsable.to_currency("1,234.99"), 1234.99)
         self.assertEqual(parsable.to_currency("$1,234.99"), 1234.99)
         self.assertIsNone(parsable.to_currency("not currency"))
+
+    def test_lazy_field(self):
+        # GIVEN
+        html = "<html><span class='name'>Name</span></html>"
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
+        parses = []
+
+        class Lazy(Parsable):
+            name: str | None = lazy_field(parse="_parse_name")
+
+            def _parse_name(self):
+                parses.append(True)
+                return self.simple_parse("span.name")
+
+        # WHEN
+        lazy = Lazy(parsed, self.test_config)
+
+        # THEN
+        self.assertEqual(0, len(parses))
+        self.assertEqual("Name", lazy.name)
+        self.assertEqual("Name", lazy.name)
+        self.assertEqual(1, len(parses))
+
+    def test_lazy_field_materialized_when_pickled(self):
+        # GIVEN
+        html = """
+<div class="yohtmlc-item">
+<a class="a-link-normal" href="/gp/product/B0018CJYCO">Item Title</a>
+<span class="a-size-small a-color-price">$1,234.99</span>
+</div>
+"""
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
+        item = Item(parsed, self.test_config)
+        self.assertNotIn("price", item.__dict__)
+
+        # WHEN
+        unpickled_item = pickle.loads(pickle.dumps(item))
+
+        # THEN
+        self.assertIn("price", item.__dict__)
+        self.assertNotIn("parsed", unpickled_item.__dict__)
+        self.assertEqual("Item Title", unpickled_item.title)
+        self.assertEqual(1234.99, unpickled_item.price)
+        self.assertIsNone(unpickled_item.seller)
+
+    def test_lazy_field_assigned_by_subclass(self):
+        # GIVEN
+        html = "<div class='yohtmlc-item'><a class='a-link-normal' href='/gp/product/B0018CJYCO'>Item Title</a></div>"
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
+
+        class CustomItem(Item):
+            def __init__(self, parsed, config):
+                super().__init__(parsed, config)
+
+                self.price = 10.0
+
+        # WHEN
+        item = CustomItem(parsed, self.test_config)
+        item.materialize()
+
+        # THEN
+        self.assertEqual(10.0, item.price)
+        self.assertIsNone(item.quantity)
+
+    def test_fields_extracted_in_single_pass(self):
+        # GIVEN
+        html = """<div class='yohtmlc-item'>
+    <a class='a-link-normal' href='/gp/product/B0018CJYCO'>Item Title</a>
+    <span class='a-color-price'>$7.00</span>
+    <span class='item-view-qty'>2</span>
+</div>"""
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
+
+        # WHEN
+        with patch("amazonorders.util.extract", wraps=util.extract) as mock_extract:
+            item = Item(parsed, self.test_config)
+            build_extract_count = mock_extract.call_count
+            item.materialize()
+
+        # THEN
+        self.assertEqual("Item Title", item.title)
+        self.assertEqual(7.0, item.price)
+        self.assertEqual(2, item.quantity)
+        # Building the Item only matches the selectors it uses in __init__, and the first lazy field read matches the
+        # rest at once
+        self.assertEqual(1, build_extract_count)
+        self.assertEqual(2, mock_extract.call_count)
+        build_css_selectors = mock_extract.call_args_list[0].args[1]
+        self.assertNotIn(self.test_config.selectors.FIELD_ITEM_PRICE_SELECTOR[0], build_css_selectors)
+        self.assertNotIn("_extracted", item.__getstate__())
+
+    def test_parse_unsafe_fields(self):
+        # GIVEN
+        html = "<html><span class='name'>Name</span></html>"
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
+
+        class Unsafe(Parsable):
+            name: str | None = lazy_field(parse="_parse_name")
+            broken: str | None = lazy_field(parse="_parse_broken", safe=False)
+
+            def _parse_name(self):
+                return self.simple_parse("span.name")
+
+            def _parse_broken(self):
+                raise ValueError("Broken")
+
+        unsafe = Unsafe(parsed, self.test_config)
+
+        # WHEN
+        with self.assertRaises(ValueError):
+            unsafe.parse_unsafe_fields()
+
+        # THEN
+        self.assertNotIn("name", unsafe.__dict__)
+
+    def test_unwanted_fields_not_extracted(self):
+        # GIVEN
+        html = "<div class='yohtmlc-item'><a class='a-link-normal' href='/gp/product/B0018CJYCO'>Item Title</a></div>"
+        parsed = util.parse_html(html, self.test_config.bs4_parser)
+
+        # WHEN
+        item = Item(parsed, self.test_config, fields=["price"])
+        item.price
+
+        # THEN
+        for css_selector in self.test_config.selectors.FIELD_ITEM_PRICE_SELECTOR:
+            self.assertIn(css_selector, item._extracted)
+        for css_selector in self.test_config.selectors.FIELD_ITEM_QUANTITY_SELECTOR:
+            self.assertNotIn(css_selector, item._extracted)
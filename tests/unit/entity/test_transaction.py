@@ -4,8 +4,8 @@ __license__ = "MIT"
 import os
 from datetime import date
 
+from amazonorders import util
 from amazonorders.entity.transaction import Transaction
-from bs4 import BeautifulSoup
 from tests.unittestcase import UnitTestCase
 
 
@@ -13,7 +13,7 @@ class TestTransaction(UnitTestCase):
     def test_parse(self):
         # GIVEN
         with open(os.path.join(self.RESOURCES_DIR, "transactions", "transaction-snippet.html"), encoding="utf-8") as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         transaction = Transaction(parsed, self.test_config, date(2024, 1, 1))
@@ -39,7 +39,7 @@ class TestTransaction(UnitTestCase):
         with open(
             os.path.join(self.RESOURCES_DIR, "transactions", "transaction-refund-snippet.html"), encoding="utf-8"
         ) as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
 
         # WHEN
         transaction = Transaction(parsed, self.test_config, date(2024, 1, 1))
@@ -0,0 +1,68 @@
+__copyright__ = "Copyright (c) 2024-2025 Alex Laird"
+__license__ = "MIT"
+
+import os
+
+from amazonorders.checkpoint import Checkpoint
+from tests.unittestcase import UnitTestCase
+
+
+class TestCheckpoint(UnitTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.checkpoint_path = os.path.join(self.test_output_dir, "crawl.checkpoint")
+
+    def test_save_appends_records(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.checkpoint_path, {"crawl": "test"}, self.test_config)
+        checkpoint.state = {"count": 0}
+        save_sizes = []
+
+        # WHEN
+        for i in range(5):
+            checkpoint.record("values", i, "x" * 1000)
+            checkpoint.state["count"] = i + 1
+            size_before = os.path.getsize(self.checkpoint_path) if os.path.exists(self.checkpoint_path) else 0
+            checkpoint.save()
+            save_sizes.append(os.path.getsize(self.checkpoint_path) - size_before)
+        resumed_checkpoint = Checkpoint(self.checkpoint_path, {"crawl": "test"}, self.test_config)
+
+        # THEN
+        # Each save only writes what was recorded since the last one
+        self.assertLess(max(save_sizes[1:]), 1100)
+        self.assertEqual(len(set(save_sizes[1:])), 1)
+        self.assertEqual({}, checkpoint.records)
+        self.assertTrue(resumed_checkpoint.resumed)
+        self.assertEqual({"count": 5}, resumed_checkpoint.state)
+        self.assertEqual({i: "x" * 1000 for i in range(5)}, resumed_checkpoint.records["values"])
+
+    def test_save_cut_short_ignored(self):
+        # GIVEN
+        checkpoint = Checkpoint(self.checkpoint_path, {"crawl": "test"}, self.test_config)
+        checkpoint.record("values", 0, "first")
+        checkpoint.state = {"count": 1}
+        checkpoint.save()
+        complete_size = os.path.getsize(self.checkpoint_path)
+        checkpoint.record("values", 1, "second")
+        checkpoint.state = {"count": 2}
+        checkpoint.save()
+        with open(self.checkpoint_path, "r+b") as f:
+            f.truncate(os.path.getsize(self.checkpoint_path) - 5)
+
+        # WHEN
+        resumed_checkpoint = Checkpoint(self.checkpoint_path, {"crawl": "test"}, self.test_config)
+        resumed_state = dict(resumed_checkpoint.state)
+        resumed_records = dict(resumed_checkpoint.records["values"])
+        resumed_checkpoint.record("values", 1, "second again")
+        resumed_checkpoint.state = {"count": 2}
+        resumed_checkpoint.save()
+        resumed_again_checkpoint = Checkpoint(self.checkpoint_path, {"crawl": "test"}, self.test_config)
+
+        # THEN
+        # The save that was cut short is ignored, and overwritten by the next one
+        self.assertEqual({"count": 1}, resumed_state)
+        self.assertEqual({0: "first"}, resumed_records)
+        self.assertGreater(os.path.getsize(self.checkpoint_path), complete_size)
+        self.assertEqual({"count": 2}, resumed_again_checkpoint.state)
+        self.assertEqual({0: "first", 1: "second again"}, resumed_again_checkpoint.records["values"])
@@ -120,6 +120,100 @@ class TestCli(UnitTestCase):
         self.assertIn("Order #113-4970960-6452217", response.output)
         self.assertIn("Order #112-9733602-9062669", response.output)
 
+    @responses.activate
+    def test_history_command_years(self):
+        # GIVEN
+        self.given_login_responses_success()
+        resp1, resp2 = self.given_order_history_2010_paginated()
+        resp3 = self.given_order_history_zero_orders(2009)
+
+        # WHEN
+        response = self.runner.invoke(
+            amazon_orders_cli,
+            [
+                "--config-path",
+                self.test_config.config_path,
+                "--username",
+                "some-username",
+                "--password",
+                "some-password",
+                "history",
+                "--years",
+                "2009-2010",
+            ],
+        )
+
+        # THEN
+        self.assertEqual(0, response.exit_code)
+        self.assertIn("Order History for 2009-2010, all pages", response.output)
+        self.assertIn("... 12 Orders parsed", response.output)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+
+    @responses.activate
+    def test_history_command_since_order(self):
+        # GIVEN
+        self.given_login_responses_success()
+        resp1, resp2 = self.given_order_history_2010_paginated()
+
+        # WHEN
+        response = self.runner.invoke(
+            amazon_orders_cli,
+            [
+                "--config-path",
+                self.test_config.config_path,
+                "--username",
+                "some-username",
+                "--password",
+                "some-password",
+                "history",
+                "--year",
+                "2010",
+                "--since-order",
+                "105-7345337-6583405",
+            ],
+        )
+
+        # THEN
+        self.assertEqual(0, response.exit_code)
+        self.assertIn("Order #104-5796370-4938630", response.output)
+        self.assertNotIn("Order #105-7345337-6583405", response.output)
+        self.assertIn("... 1 Orders parsed", response.output)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(0, resp2.call_count)
+
+    def test_history_command_years_invalid(self):
+        # WHEN
+        response = self.runner.invoke(
+            amazon_orders_cli,
+            ["--config-path", self.test_config.config_path, "history", "--years", "2025-2012"],
+        )
+
+        # THEN
+        self.assertEqual(2, response.exit_code)
+        self.assertIn("'2025-2012' starts after it ends.", response.output)
+
+    def test_history_command_years_conflicting_options(self):
+        # WHEN
+        response = self.runner.invoke(
+            amazon_orders_cli,
+            [
+                "--config-path",
+                self.test_config.config_path,
+                "history",
+                "--years",
+                "2012-2025",
+                "--single-page",
+                "--since-order",
+                "112-9733602-9062669",
+            ],
+        )
+
+        # THEN
+        self.assertEqual(2, response.exit_code)
+        self.assertIn("--years can't be combined with --single-page, --since-order.", response.output)
+
     @responses.activate
     def test_order_command(self):
         # GIVEN
@@ -156,6 +250,48 @@ class TestCli(UnitTestCase):
         self.assert_login_responses_success()
         self.assertIn("Order #112-2961628-4757846", response.output)
 
+    @responses.activate
+    def test_order_command_from_file(self):
+        # GIVEN
+        self.given_login_responses_success()
+        resp1 = self.given_any_order_details_exists("order-details-112-2961628-4757846.html")
+        order_ids_file_path = os.path.join(self.test_config.output_dir, "order-ids.txt")
+        with open(order_ids_file_path, "w", encoding="utf-8") as f:
+            f.write("112-9685975-5907428\n\n113-1909885-6198667\n")
+
+        # WHEN
+        response = self.runner.invoke(
+            amazon_orders_cli,
+            [
+                "--config-path",
+                self.test_config.config_path,
+                "--username",
+                "some-username",
+                "--password",
+                "some-password",
+                "order",
+                "112-2961628-4757846",
+                "--from-file",
+                order_ids_file_path,
+            ],
+        )
+
+        # THEN
+        self.assertEqual(0, response.exit_code)
+        self.assertEqual(3, resp1.call_count)
+        self.assertEqual(3, response.output.count("Order #112-2961628-4757846"))
+
+    def test_order_command_no_ids(self):
+        # WHEN
+        response = self.runner.invoke(
+            amazon_orders_cli,
+            ["--config-path", self.test_config.config_path, "order"],
+        )
+
+        # THEN
+        self.assertEqual(2, response.exit_code)
+        self.assertIn("Pass at least one Order ID, or --from-file.", response.output)
+
     @responses.activate
     @patch("amazonorders.transactions.datetime", wraps=datetime)
     def test_transactions_command(self, mock_today):
@@ -6,8 +6,14 @@ import shutil
 from unittest import TestCase
 
 import yaml
-from amazonorders import conf
+from amazonorders import conf, util
 from amazonorders.conf import AmazonOrdersConfig
+from amazonorders.exception import AmazonOrdersError
+from amazonorders.selectors import Selector, Selectors
+
+
+class InvalidSelectors(Selectors):
+    ORDER_SKIP_ITEMS = Selectors.ORDER_SKIP_ITEMS + [Selector("div:has(", "Purchased at Amazon")]
 
 
 class TestConf(TestCase):
@@ -44,6 +50,7 @@ class TestConf(TestCase):
         self.assertEqual(self.test_output_dir, config.output_dir)
         self.assertEqual(self.test_cookie_jar_path, config.cookie_jar_path)
         self.assertEqual("html.parser", config.bs4_parser)
+        self.assertEqual("html.parser", util.resolve_bs4_parser(config.bs4_parser))
 
         # GIVEN
         config.save()
@@ -53,7 +60,8 @@ class TestConf(TestCase):
         self.assertTrue(os.path.exists(config_path))
         with open(config.config_path) as f:
             self.assertEqual(
-                f"""auth_reattempt_wait: 5
+                f"""adaptive_selectors: false
+auth_reattempt_wait: 5
 bs4_parser: html.parser
 connection_pool_size: {thread_pool_size * 2}
 constants_class: amazonorders.constants.Constants
@@ -61,10 +69,28 @@ cookie_jar_path: {self.test_cookie_jar_path}
 item_class: amazonorders.entity.item.Item
 max_auth_attempts: 10
 max_auth_retries: 1
+max_pending_order_tasks: {thread_pool_size * 2}
+max_request_attempts: 3
 order_class: amazonorders.entity.order.Order
 output_dir: {self.test_output_dir}
+parse_workers: 0
+partial_parse: true
+requests_burst: 20
+requests_per_second: 0
+retry_backoff_base: 1
+retry_backoff_max: 30
+retry_exceptions:
+- requests.exceptions.ConnectionError
+- requests.exceptions.Timeout
+retry_statuses:
+- 429
+- 500
+- 502
+- 503
+- 504
 selectors_class: amazonorders.selectors.Selectors
 shipment_class: amazonorders.entity.shipment.Shipment
+stream_history_pages: false
 thread_pool_size: {thread_pool_size}
 """,
                 f.read(),
@@ -121,3 +147,47 @@ some_custom_config: {custom_config}
             self.assertEqual(7, persisted_config["max_auth_attempts"])
             self.assertEqual("test-username", persisted_config["username"])
             self.assertEqual("test-otp-secret-key", persisted_config["otp_secret_key"])
+
+    def test_invalid_selector_fails_on_load(self):
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            AmazonOrdersConfig(
+                data={
+                    "output_dir": self.test_output_dir,
+                    "cookie_jar_path": self.test_cookie_jar_path,
+                    "selectors_class": "tests.unit.test_conf.InvalidSelectors",
+                }
+            )
+
+        # THEN
+        self.assertEqual("The selector ORDER_SKIP_ITEMS is invalid: div:has(", str(cm.exception))
+
+    def test_selector_stats(self):
+        # GIVEN
+        config = AmazonOrdersConfig(
+            data={
+                "output_dir": self.test_output_dir,
+                "cookie_jar_path": self.test_cookie_jar_path,
+                "adaptive_selectors": True,
+            }
+        )
+
+        # THEN
+        self.assertIsInstance(config.selectors.FIELD_ORDER_NUMBER_SELECTOR, util.SelectorList)
+        self.assertTrue(config.selectors.FIELD_ORDER_NUMBER_SELECTOR.adaptive)
+        self.assertIs(config.selector_stats, config.selectors.FIELD_ORDER_NUMBER_SELECTOR.stats)
+        self.assertNotIsInstance(Selectors.FIELD_ORDER_NUMBER_SELECTOR, util.SelectorList)
+
+    def test_update_config_adaptive_selectors(self):
+        # GIVEN
+        config = AmazonOrdersConfig(
+            data={"output_dir": self.test_output_dir, "cookie_jar_path": self.test_cookie_jar_path}
+        )
+        self.assertFalse(config.selectors.FIELD_ORDER_NUMBER_SELECTOR.adaptive)
+
+        # WHEN
+        config.update_config("adaptive_selectors", True, save=False)
+
+        # THEN
+        self.assertTrue(config.selectors.FIELD_ORDER_NUMBER_SELECTOR.adaptive)
+        self.assertTrue(config.selectors.ORDER_HISTORY_ENTITY_SELECTOR.adaptive)
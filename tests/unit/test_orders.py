@@ -1,14 +1,32 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
+import gc
 import os
+import pickle
+import re
+import threading
+import time
 import unittest
+import weakref
 from datetime import date
+from unittest.mock import patch
 
 import responses
-from amazonorders.exception import AmazonOrdersAuthRedirectError, AmazonOrdersError, AmazonOrdersNotFoundError
+import respx
+from amazonorders import workers
+from amazonorders.checkpoint import Checkpoint
+from amazonorders.entity.order import Order
+from amazonorders.exception import (
+    AmazonOrdersAuthRedirectError,
+    AmazonOrdersEntityError,
+    AmazonOrdersError,
+    AmazonOrdersNotFoundError,
+)
 from amazonorders.orders import AmazonOrders
-from amazonorders.session import AmazonSession
+from amazonorders.session import AmazonSession, AsyncAmazonSession
+from amazonorders.util import AmazonSessionResponse
 from tests.unittestcase import UnitTestCase
 
 
@@ -105,7 +123,7 @@ class TestOrders(UnitTestCase):
             self.amazon_orders.get_order_history(year=year, start_index=start_index)
 
         # THEN
-        self.assertEqual(1, resp.call_count)
+        self.assertEqual(self.test_config.max_request_attempts, resp.call_count)
         self.assertEqual(cm.exception.meta["index"], start_index)
 
     @responses.activate
@@ -230,6 +248,381 @@ class TestOrders(UnitTestCase):
         self.assertEqual(1, resp1.call_count)
         self.assertEqual(1, resp2.call_count)
 
+    @responses.activate
+    def test_get_order_history_paginated_full_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+        resp3 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, full_details=True)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assert_orders_list_index(orders)
+        for order in orders:
+            self.assertTrue(order.full_details)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(12, resp3.call_count)
+
+    @responses.activate
+    def test_get_order_history_paginated_full_details_overlap(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), encoding="utf-8") as f:
+            next_page_body = f.read()
+        with open(
+            os.path.join(self.RESOURCES_DIR, "orders", "order-details-114-9460922-7737063.html"), encoding="utf-8"
+        ) as f:
+            details_body = f.read()
+        events = []
+        events_lock = threading.Lock()
+        details_started = threading.Event()
+
+        def record(event):
+            with events_lock:
+                events.append(event)
+
+        def next_page_callback(request):
+            record("next page started")
+            # Only finishes once a details request has started, or times out if paging waits for them
+            details_started.wait(timeout=5)
+            record("next page finished")
+            return 200, {}, next_page_body
+
+        def details_callback(request):
+            record("details started")
+            details_started.set()
+            return 200, {}, details_body
+
+        responses.add_callback(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            callback=next_page_callback,
+        )
+        responses.add_callback(
+            responses.GET,
+            re.compile(f"{self.test_config.constants.ORDER_DETAILS_URL}?.*"),
+            callback=details_callback,
+        )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year, full_details=True)
+
+        # THEN
+        # A details request for the first page started while the next page was still being fetched
+        self.assertEqual(12, len(orders))
+        self.assert_orders_list_index(orders)
+        self.assertEqual(1, events.count("next page started"))
+        self.assertEqual(12, events.count("details started"))
+        self.assertLess(events.index("next page started"), events.index("next page finished"))
+        self.assertIn("details started", events[:events.index("next page finished")])
+
+    @responses.activate
+    def test_get_order_history_full_details_pending_order_tasks_bounded(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.test_config.update_config("max_pending_order_tasks", 2, save=False)
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(
+            year=year, start_index=start_index, keep_paging=False, full_details=True
+        )
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(list(range(start_index, start_index + 10)), [order.index for order in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_iter_order_history(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.iter_order_history(
+            year=year, start_index=start_index, keep_paging=False, full_details=True
+        )
+
+        # THEN
+        self.assertEqual(start_index, next(orders).index)
+        self.assertEqual(list(range(start_index + 1, start_index + 10)), [order.index for order in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_iter_order_history_as_completed(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = list(
+            self.amazon_orders.iter_order_history(
+                year=year, start_index=start_index, keep_paging=False, full_details=True, as_completed=True
+            )
+        )
+
+        # THEN
+        self.assertEqual(set(range(start_index, start_index + 10)), {order.index for order in orders})
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_aiter_order_history(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+
+        async def collect():
+            return [order async for order in self.amazon_orders.aiter_order_history(year=year)]
+
+        # WHEN
+        orders = asyncio.run(collect())
+
+        # THEN
+        self.assertEqual(list(range(12)), [order.index for order in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_aget_order_history(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = asyncio.run(
+            self.amazon_orders.aget_order_history(
+                year=year, start_index=start_index, keep_paging=False, full_details=True
+            )
+        )
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(list(range(start_index, start_index + 10)), [order.index for order in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_from_running_event_loop(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2018
+        resp = self.given_order_history_exists(year)
+
+        async def get_order_history():
+            return self.amazon_orders.get_order_history(year=year, keep_paging=False)
+
+        # WHEN
+        orders = asyncio.run(get_order_history())
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_112_0399923_3070642(orders[3], False)
+        self.assertEqual(1, resp.call_count)
+
+    @respx.mock
+    def test_aget_order_history_async_session(self):
+        # GIVEN
+        amazon_session = AsyncAmazonSession("some-username", "some-password", config=self.test_config)
+        amazon_session.is_authenticated = True
+        amazon_orders = AmazonOrders(amazon_session)
+        year = 2020
+        start_index = 40
+        with open(
+            os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-{start_index}.html"), encoding="utf-8"
+        ) as f:
+            resp1 = respx.get(
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}&startIndex={start_index}"
+            ).respond(200, text=f.read())
+        with open(
+            os.path.join(self.RESOURCES_DIR, "orders", "order-details-114-9460922-7737063.html"), encoding="utf-8"
+        ) as f:
+            resp2 = respx.get(url__startswith=self.test_config.constants.ORDER_DETAILS_URL).respond(200, text=f.read())
+
+        async def get_order_history():
+            async with amazon_session:
+                return await amazon_orders.aget_order_history(
+                    year=year, start_index=start_index, keep_paging=False, full_details=True
+                )
+
+        # WHEN
+        orders = asyncio.run(get_order_history())
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual(list(range(start_index, start_index + 10)), [order.index for order in orders])
+        for order in orders:
+            self.assertTrue(order.full_details)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @respx.mock
+    def test_aget_order_async_session_not_found(self):
+        # GIVEN
+        amazon_session = AsyncAmazonSession("some-username", "some-password", config=self.test_config)
+        amazon_session.is_authenticated = True
+        amazon_orders = AmazonOrders(amazon_session)
+        order_id = "1234-fake-id"
+        resp1 = respx.get(f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}").respond(
+            302, headers={"Location": self.test_config.constants.BASE_URL}
+        )
+        resp2 = respx.get(self.test_config.constants.BASE_URL).respond(200, text="<html></html>")
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersNotFoundError):
+            asyncio.run(amazon_orders.aget_order(order_id))
+
+        # THEN
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_range(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        resp1, resp2 = self.given_order_history_2010_paginated()
+        # The 2010 page's year dropdown starts at 2007, so 2006 is skipped without a request
+        empty_year_resps = [self.given_order_history_zero_orders(year) for year in (2009, 2008, 2007)]
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history_range(2006, 2010)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(12)), [order.index for order in orders])
+        for order in orders:
+            self.assertEqual(2010, order.order_placed_date.year)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        for resp in empty_year_resps:
+            self.assertEqual(1, resp.call_count)
+        self.assertEqual(5, len(responses.calls))
+
+    @responses.activate
+    def test_get_order_history_range_on_error_collect(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        for year in (2009, 2008, 2007):
+            self.given_order_history_zero_orders(year)
+        self.given_order_details_fails_for("103-2893758-2262654")
+        errors = []
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history_range(
+            2006, 2010, full_details=True, on_error="collect", errors=errors
+        )
+
+        # THEN
+        self.assertEqual(11, len(orders))
+        self.assertEqual(1, len(errors))
+        self.assertEqual(
+            {"index": 3, "order_number": "103-2893758-2262654", "year": 2010},
+            {key: errors[0].meta[key] for key in ("index", "order_number", "year")},
+        )
+
+    def test_get_order_history_range_invalid(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history_range(2011, 2010)
+
+        # THEN
+        self.assertEqual("start_year 2011 must not be after end_year 2010.", str(cm.exception))
+
+    @responses.activate
+    def test_get_order_history_since_order(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        resp1, resp2 = self.given_order_history_2010_paginated()
+        resp3 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(
+            year=2010, full_details=True, since_order="002-7207876-5547402"
+        )
+
+        # THEN
+        self.assertEqual(4, len(orders))
+        self.assertEqual(list(range(4)), [order.index for order in orders])
+        self.assertEqual("104-5796370-4938630", orders[0].order_number)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(0, resp2.call_count)
+        self.assertEqual(4, resp3.call_count)
+
+    @responses.activate
+    def test_get_order_history_since_date(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        resp1, resp2 = self.given_order_history_2010_paginated()
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, since_date=date(2010, 5, 16))
+
+        # THEN
+        # Orders placed on since_date are still included
+        self.assertEqual(6, len(orders))
+        self.assertEqual(date(2010, 5, 16), orders[-1].order_placed_date)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(0, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_since_order_not_reached(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        resp1, resp2 = self.given_order_history_2010_paginated()
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, since_order="102-0568286-5292212")
+
+        # THEN
+        self.assertEqual(11, len(orders))
+        self.assertEqual(list(range(11)), [order.index for order in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
     @responses.activate
     def test_get_order_history_fresh(self):
         # GIVEN
@@ -467,6 +860,778 @@ class TestOrders(UnitTestCase):
         self.assertEqual(1, resp3.call_count)
         self.assertEqual(cm.exception.meta["index"], index)
 
+    @responses.activate
+    def test_get_order_history_checkpoint_resumes(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        checkpoint_path = os.path.join(self.test_output_dir, "order-history.checkpoint")
+        page_2_url = (
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2"
+        )
+        self.given_order_history_exists(2010, start_index=0)
+        responses.add(responses.GET, page_2_url, status=503)
+        resp1 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_orders.get_order_history(year=2010, full_details=True, checkpoint=checkpoint_path)
+
+        # THEN
+        self.assertTrue(os.path.exists(checkpoint_path))
+        first_run_details_count = resp1.call_count
+
+        # GIVEN
+        responses.reset()
+        resp2, resp3 = self.given_order_history_2010_paginated()
+        resp4 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, full_details=True, checkpoint=checkpoint_path)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(12)), [order.index for order in orders])
+        for order in orders:
+            self.assertTrue(order.full_details)
+        self.assertLessEqual(resp2.call_count, 1)
+        self.assertEqual(1, resp3.call_count)
+        # Orders whose details were fetched before the failure aren't fetched again
+        self.assertEqual(12, first_run_details_count + resp4.call_count)
+        self.assertFalse(os.path.exists(checkpoint_path))
+
+    @responses.activate
+    def test_get_order_history_checkpoint_leaves_out_credentials(self):
+        # GIVEN
+        self.test_config.update_config("username", "some-username@example.com", save=False)
+        self.test_config.update_config("password", "hunter2", save=False)
+        self.test_config.update_config("otp_secret_key", "SOMEOTPSECRETKEY", save=False)
+        self.amazon_session.is_authenticated = True
+        checkpoint_path = os.path.join(self.test_output_dir, "order-history.checkpoint")
+        self.given_order_history_exists(2010, start_index=0)
+        responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            status=503,
+        )
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_orders.get_order_history(year=2010, checkpoint=checkpoint_path)
+        with open(checkpoint_path, "rb") as f:
+            data = f.read()
+
+        # THEN
+        self.assertNotIn(b"some-username@example.com", data)
+        self.assertNotIn(b"hunter2", data)
+        self.assertNotIn(b"SOMEOTPSECRETKEY", data)
+
+    @responses.activate
+    def test_get_order_history_checkpoint_resumes_lazy_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        checkpoint_path = os.path.join(self.test_output_dir, "order-history.checkpoint")
+        self.given_order_history_exists(2010, start_index=0)
+        responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            status=503,
+        )
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_orders.get_order_history(year=2010, lazy_details=True, checkpoint=checkpoint_path)
+        responses.reset()
+        self.given_order_history_2010_paginated()
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, lazy_details=True, checkpoint=checkpoint_path)
+
+        # THEN
+        # Orders loaded from the checkpoint can still fetch their details
+        self.assertEqual(12, len(orders))
+        self.assertTrue(orders[0].details_pending)
+        self.assertEqual(0, resp.call_count)
+        self.assertIsNotNone(orders[0].payment_method)
+        self.assertEqual(1, resp.call_count)
+        self.assertTrue(orders[0].full_details)
+
+    @responses.activate
+    def test_get_order_history_checkpoint_different_options(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        checkpoint_path = os.path.join(self.test_output_dir, "order-history.checkpoint")
+        self.given_order_history_exists(2010, start_index=0)
+        responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+            "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+            status=503,
+        )
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_orders.get_order_history(year=2010, checkpoint=checkpoint_path)
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history(year=2010, lazy_details=True, checkpoint=checkpoint_path)
+
+        # THEN
+        self.assertIn("is for a different crawl", str(cm.exception))
+
+    @responses.activate
+    def test_iter_order_history_releases_yielded_orders(self):
+        # GIVEN
+        self.test_config.update_config("max_pending_order_tasks", 1, save=False)
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        order_refs = []
+        alive_counts = []
+
+        # WHEN
+        for order in self.amazon_orders.iter_order_history(year=2010):
+            order_refs.append(weakref.ref(order))
+            gc.collect()
+            alive_counts.append(sum(1 for order_ref in order_refs[:-1] if order_ref() is not None))
+
+        # THEN
+        self.assertEqual(12, len(order_refs))
+        # Without a checkpoint, nothing holds on to an Order once it has been yielded
+        self.assertEqual([0] * 12, alive_counts)
+
+    def test_get_order_history_checkpoint_different_crawl(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        checkpoint_path = os.path.join(self.test_output_dir, "order-history.checkpoint")
+        Checkpoint(checkpoint_path, {"crawl": "transactions"}, self.test_config).save()
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history(year=2010, checkpoint=checkpoint_path)
+
+        # THEN
+        self.assertIn("is for a different crawl", str(cm.exception))
+
+    def given_order_details_fails_for(self, failing_order_id):
+        with open(
+            os.path.join(self.RESOURCES_DIR, "orders", "order-details-114-9460922-7737063.html"), encoding="utf-8"
+        ) as f:
+            body = f.read()
+
+        def callback(request):
+            if f"orderID={failing_order_id}" in request.url:
+                return 503, {}, ""
+            return 200, {}, body
+
+        return responses.add_callback(
+            responses.GET, re.compile(f"{self.test_config.constants.ORDER_DETAILS_URL}?.*"), callback=callback
+        )
+
+    @responses.activate
+    def test_get_order_history_on_error_collect(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        failing_order_id = "103-2893758-2262654"
+        self.given_order_history_2010_paginated()
+        self.given_order_details_fails_for(failing_order_id)
+
+        errors = []
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(
+            year=2010, full_details=True, on_error="collect", errors=errors
+        )
+
+        # THEN
+        self.assertEqual(11, len(orders))
+        self.assertEqual([0, 1, 2] + list(range(4, 12)), [order.index for order in orders])
+        self.assertEqual(1, len(errors))
+        self.assertEqual(3, errors[0].meta["index"])
+        self.assertEqual(failing_order_id, errors[0].meta["order_number"])
+
+    @responses.activate
+    def test_get_order_history_on_error_collect_parse_error(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        failing_order_id = "103-2893758-2262654"
+        self.given_order_history_2010_paginated()
+        parse_items = Order._parse_items
+
+        def failing_parse_items(order):
+            if order.order_number == failing_order_id:
+                raise AmazonOrdersEntityError("Items could not be parsed.")
+            return parse_items(order)
+
+        errors = []
+
+        # WHEN
+        with patch.object(Order, "_parse_items", failing_parse_items):
+            orders = self.amazon_orders.get_order_history(year=2010, on_error="collect", errors=errors)
+
+        # THEN
+        # Items are parsed while each Order is built, so the failure is collected rather than raised on access
+        self.assertEqual(11, len(orders))
+        self.assertNotIn(failing_order_id, [order.order_number for order in orders])
+        for order in orders:
+            self.assertIn("items", order.__dict__)
+        self.assertEqual(1, len(errors))
+        self.assertEqual(3, errors[0].meta["index"])
+        self.assertEqual(failing_order_id, errors[0].meta["order_number"])
+
+    @responses.activate
+    def test_get_order_history_on_error_skip(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        self.given_order_details_fails_for("103-2893758-2262654")
+
+        errors = []
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, full_details=True, on_error="skip", errors=errors)
+
+        # THEN
+        self.assertEqual(11, len(orders))
+        self.assertEqual([], errors)
+
+    @responses.activate
+    def test_get_order_history_on_error_collect_concurrent(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        self.given_order_details_fails_for("103-2893758-2262654")
+        errors = []
+        other_errors = []
+
+        async def crawl():
+            return await asyncio.gather(
+                self.amazon_orders.aget_order_history(
+                    year=2010, full_details=True, on_error="collect", errors=errors
+                ),
+                self.amazon_orders.aget_order_history(
+                    year=2010, keep_paging=False, on_error="collect", errors=other_errors
+                ),
+            )
+
+        # WHEN
+        orders, other_orders = asyncio.run(crawl())
+
+        # THEN
+        # Each crawl's errors are kept apart, rather than one crawl resetting the other's
+        self.assertEqual(11, len(orders))
+        self.assertEqual(10, len(other_orders))
+        self.assertEqual(1, len(errors))
+        self.assertEqual("103-2893758-2262654", errors[0].meta["order_number"])
+        self.assertEqual([], other_errors)
+
+    @responses.activate
+    def test_get_order_history_on_error_raise(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        self.given_order_details_fails_for("103-2893758-2262654")
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history(year=2010, full_details=True)
+
+        # THEN
+        self.assertEqual("103-2893758-2262654", cm.exception.meta["order_number"])
+
+    def test_get_order_history_on_error_invalid(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history(year=2010, on_error="ignore")
+
+        # THEN
+        self.assertEqual("on_error must be 'raise', 'skip', or 'collect', not 'ignore'.", str(cm.exception))
+
+    def test_get_order_history_max_pending_order_tasks_invalid(self):
+        # GIVEN
+        self.test_config.update_config("max_pending_order_tasks", 0, save=False)
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.aiter_order_history(year=2010)
+        with self.assertRaises(AmazonOrdersError) as range_cm:
+            self.amazon_orders.aiter_order_history_range(2009, 2010)
+
+        # THEN
+        # Raised when the crawl is requested, before anything is fetched
+        self.assertEqual("max_pending_order_tasks must be greater than 0 to fetch Order history.", str(cm.exception))
+        self.assertEqual(
+            "max_pending_order_tasks must be greater than 0 to fetch Order history.", str(range_cm.exception)
+        )
+
+    def test_get_order_history_on_error_collect_no_errors(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history(year=2010, on_error="collect")
+
+        # THEN
+        self.assertEqual(
+            "errors must be given a list to collect errors in when on_error is 'collect'.", str(cm.exception)
+        )
+
+    @responses.activate
+    def test_get_order_history_parallel_pages(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2020-40.html"), encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2020&startIndex=40",
+                # Fewer Orders than the real history, to keep the number of pages down
+                body=f.read().replace("253 orders", "73 orders"),
+                status=200,
+            )
+        # Every remaining page is the same 10 Orders, which is enough to see that all offsets are requested
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2020-50.html"), encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                re.compile(f"{self.test_config.constants.ORDER_HISTORY_URL}.*startIndex=[1-9][0-9]+&ref_.*"),
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2020, start_index=40, parallel_pages=True)
+
+        # THEN
+        # The first page says there are 73 Orders, so startIndex 50 through 70 are requested at once
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(3, resp2.call_count)
+        requested_start_indexes = sorted(
+            int(re.search(r"startIndex=(\d+)", call.request.url).group(1)) for call in responses.calls[1:]
+        )
+        self.assertEqual([50, 60, 70], requested_start_indexes)
+        self.assertEqual(40, len(orders))
+        self.assertEqual(list(range(40, 80)), [order.index for order in orders])
+
+    @responses.activate
+    def test_get_order_history_parallel_pages_bounded(self):
+        # GIVEN
+        self.test_config.update_config("thread_pool_size", 2, save=False)
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_exists(2020, start_index=40)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2020-50.html"), encoding="utf-8") as f:
+            body = f.read()
+        started_urls = []
+        started_before_head_finished = []
+
+        def callback(request):
+            started_urls.append(request.url)
+            if "startIndex=50&" in request.url:
+                # The head page is slow, so later pages that were fetched would have to wait for it
+                time.sleep(0.5)
+                started_before_head_finished.extend(started_urls)
+            return 200, {}, body
+
+        responses.add_callback(
+            responses.GET,
+            re.compile(f"{self.test_config.constants.ORDER_HISTORY_URL}.*startIndex=[1-9][0-9]+&ref_.*"),
+            callback=callback,
+        )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2020, start_index=40, parallel_pages=True)
+
+        # THEN
+        # The first page says there are 253 Orders, but only thread_pool_size pages are fetched (or held) at once
+        self.assertEqual(21, len(started_urls))
+        self.assertEqual(2, len(started_before_head_finished))
+        self.assertEqual(220, len(orders))
+        self.assertEqual(list(range(40, 260)), [order.index for order in orders])
+
+    @responses.activate
+    def test_get_order_history_stream_history_pages(self):
+        # GIVEN
+        self.test_config.update_config("stream_history_pages", True, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(
+            year=year, start_index=start_index, keep_paging=False, full_details=True
+        )
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(43, orders[3].index)
+        self.assert_orders_list_index(orders)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_stream_history_pages_paginated(self):
+        # GIVEN
+        self.test_config.update_config("stream_history_pages", True, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2010
+        resp1 = self.given_order_history_exists(year, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-history-{year}-10.html"), encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=year)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(list(range(12)), [order.index for order in orders])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_history_parse_workers(self):
+        # GIVEN
+        self.test_config.update_config("parse_workers", 1, save=False)
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        try:
+            with patch.object(
+                AmazonSessionResponse, "_parse", autospec=True, side_effect=AmazonSessionResponse._parse
+            ) as mock_parse:
+                orders = self.amazon_orders.get_order_history(
+                    year=year, start_index=start_index, keep_paging=False, full_details=True
+                )
+        finally:
+            self.amazon_session.close()
+
+        # THEN
+        # The pages were only parsed in the parse worker
+        self.assertEqual(0, mock_parse.call_count)
+        self.assertEqual(10, len(orders))
+        self.assert_order_114_9460922_7737063(orders[3], True)
+        self.assertEqual(43, orders[3].index)
+        self.assert_orders_list_index(orders)
+        self.assertIs(self.test_config, orders[3].config)
+        self.assertIs(self.test_config, orders[3].items[0].config)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(10, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_parse_workers(self):
+        # GIVEN
+        self.test_config.update_config("parse_workers", 1, save=False)
+        self.amazon_session.is_authenticated = True
+        order_id = "112-9685975-5907428"
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{order_id}.html"), encoding="utf-8") as f:
+            resp = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        try:
+            order = self.amazon_orders.get_order(order_id)
+        finally:
+            self.amazon_session.close()
+
+        # THEN
+        self.assert_order_112_9685975_5907428_multiple_items_shipments_sellers(order, True)
+        self.assertIsNone(order.index)
+        self.assertIs(self.test_config, order.config)
+        self.assertEqual(1, resp.call_count)
+
+    def test_parse_workers_build_orders_error(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2020-40.html"), "rb") as f:
+            markup = f.read()
+        original_parse_items = Order._parse_items
+
+        def parse_items(order):
+            if order.order_number == "113-8612122-7012202":
+                raise AmazonOrdersEntityError("Items could not be parsed.")
+            return original_parse_items(order)
+
+        workers.init_worker(self.test_config)
+        self.addCleanup(setattr, workers, "_config", None)
+
+        # WHEN
+        with patch.object(Order, "_parse_items", parse_items):
+            orders, next_page_href, order_count_text = workers.loads(
+                workers.build_orders(markup, "utf-8", "https://www.amazon.com/your-orders/orders", 40),
+                self.test_config,
+            )
+
+        # THEN
+        # Only the Order that failed is an error, rather than the whole page failing
+        self.assertEqual(10, len(orders))
+        error, skip_items = orders[1]
+        self.assertIsInstance(error, AmazonOrdersEntityError)
+        self.assertEqual({"index": 41, "order_number": "113-8612122-7012202"}, error.meta)
+        self.assertFalse(skip_items)
+        self.assertEqual(
+            [40] + list(range(42, 50)),
+            [order.index for order, _ in orders if not isinstance(order, AmazonOrdersEntityError)],
+        )
+        self.assertIn("startIndex=50", next_page_href)
+        self.assertTrue(order_count_text.strip().startswith("253 "))
+
+    @responses.activate
+    def test_parse_workers_pickle_shares_config(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_exists(2020, start_index=40)
+        order = self.amazon_orders.get_order_history(year=2020, start_index=40, keep_paging=False)[3]
+        other_config = pickle.loads(pickle.dumps(self.test_config))
+
+        # WHEN
+        data = workers.dumps(order, self.test_config)
+        loaded_order = workers.loads(data, other_config)
+
+        # THEN
+        self.assertNotIn(self.test_config.output_dir.encode(), data)
+        self.assertIs(other_config, loaded_order.config)
+        self.assertIs(other_config, loaded_order.items[0].config)
+        self.assertEqual(order.order_number, loaded_order.order_number)
+        self.assertEqual(order.grand_total, loaded_order.grand_total)
+
+    @responses.activate
+    def test_get_fan_out_pages_unexpected_page_size(self):
+        # GIVEN
+        resp = self.given_order_history_exists(2020, start_index=40)
+        page_response = self.amazon_session.get(resp.url)
+        next_page_href, order_count_text = self.amazon_orders._get_history_page_links(page_response)
+        next_page = self.amazon_orders._get_next_page(next_page_href)
+
+        # WHEN
+        fan_out_pages = self.amazon_orders._get_fan_out_pages(order_count_text, next_page, 40, 10)
+        mismatched_fan_out_pages = self.amazon_orders._get_fan_out_pages(order_count_text, next_page, 30, 10)
+
+        # THEN
+        self.assertEqual(21, len(fan_out_pages))
+        self.assertEqual((next_page, 50), fan_out_pages[0])
+        self.assertIsNone(mismatched_fan_out_pages)
+
+    @responses.activate
+    def test_get_order_history_details_filter(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+        filtered_orders = []
+
+        def details_filter(order):
+            filtered_orders.append(order)
+            return order.order_placed_date.month >= 8
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, details_filter=details_filter)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(12, len(filtered_orders))
+        self.assertFalse(any(order.full_details for order in filtered_orders))
+        self.assertEqual([True] * 3 + [False] * 9, [order.full_details for order in orders])
+        self.assertEqual(3, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_lazy_details(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(year=2010, lazy_details=True)
+
+        # THEN
+        self.assertEqual(12, len(orders))
+        self.assertEqual(0, resp.call_count)
+        self.assertTrue(all(order.details_pending for order in orders))
+        self.assertFalse(orders[0].full_details)
+
+        # WHEN
+        subtotal = orders[0].subtotal
+
+        # THEN
+        self.assertIsNotNone(subtotal)
+        self.assertEqual(subtotal, orders[0].subtotal)
+        self.assertIsNotNone(orders[0].payment_method)
+        self.assertTrue(orders[0].full_details)
+        self.assertFalse(orders[0].details_pending)
+        self.assertEqual(1, resp.call_count)
+
+        # WHEN
+        errors = self.amazon_orders.prefetch(orders)
+
+        # THEN
+        self.assertEqual({}, errors)
+        self.assertTrue(all(order.full_details for order in orders))
+        self.assertEqual(12, resp.call_count)
+
+    @responses.activate
+    def test_lazy_order_pickled_before_details_loaded(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        self.given_order_history_2010_paginated()
+        resp = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+        orders = self.amazon_orders.get_order_history(year=2010, keep_paging=False, lazy_details=True)
+
+        # WHEN
+        order = pickle.loads(pickle.dumps(orders[0]))
+
+        # THEN
+        self.assertEqual(orders[0].order_number, order.order_number)
+        self.assertFalse(order.details_pending)
+        self.assertIsNone(order.subtotal)
+        self.assertEqual(0, resp.call_count)
+
+    @responses.activate
+    def test_get_order_history_fields(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        year = 2020
+        start_index = 40
+        resp1 = self.given_order_history_exists(year, start_index)
+        resp2 = self.given_any_order_details_exists("order-details-114-9460922-7737063.html")
+
+        # WHEN
+        orders = self.amazon_orders.get_order_history(
+            year=year,
+            start_index=start_index,
+            keep_paging=False,
+            full_details=True,
+            fields=["order_placed_date", "grand_total"],
+        )
+
+        # THEN
+        self.assertEqual(10, len(orders))
+        self.assertEqual("114-9460922-7737063", orders[3].order_number)
+        self.assertEqual(43, orders[3].index)
+        self.assertEqual(date(2020, 10, 27), orders[3].order_placed_date)
+        self.assertEqual(35.90, orders[3].grand_total)
+        self.assertFalse(orders[3].full_details)
+        self.assertEqual([], orders[3].items)
+        self.assertEqual([], orders[3].shipments)
+        self.assertIsNone(orders[3].recipient)
+        self.assertIsNone(orders[3].order_details_link)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(0, resp2.call_count)
+
+    @responses.activate
+    def test_get_order_fields(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        order_id = "112-9685975-5907428"
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{order_id}.html"), encoding="utf-8") as f:
+            resp = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        order = self.amazon_orders.get_order(order_id, fields=["subtotal", "items.price"])
+
+        # THEN
+        self.assertEqual(order_id, order.order_number)
+        self.assertIsNotNone(order.subtotal)
+        self.assertIsNone(order.grand_total)
+        self.assertIsNone(order.payment_method)
+        self.assertEqual([], order.shipments)
+        self.assertTrue(order.items)
+        self.assertTrue(all(item.title and item.price for item in order.items))
+        self.assertTrue(all(item.seller is None and item.link is None for item in order.items))
+        self.assertEqual(1, resp.call_count)
+
+    def test_get_order_history_unknown_fields(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_order_history(fields=["grand_total", "items.colour", "total"])
+
+        # THEN
+        self.assertEqual("Unknown fields: items.colour, total. See Order.FIELDS and Item.FIELDS.", str(cm.exception))
+
+    @responses.activate
+    def test_get_orders_partial_failure(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        order_id = "112-9685975-5907428"
+        missing_order_id = "111-0000000-0000000"
+        with open(os.path.join(self.RESOURCES_DIR, "orders", f"order-details-{order_id}.html"), encoding="utf-8") as f:
+            resp1 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={order_id}",
+                body=f.read(),
+                status=200,
+            )
+        resp2 = responses.add(
+            responses.GET,
+            f"{self.test_config.constants.ORDER_DETAILS_URL}?orderID={missing_order_id}",
+            status=302,
+            headers={"Location": self.test_config.constants.ORDER_HISTORY_URL},
+        )
+        resp3 = responses.add(responses.GET, self.test_config.constants.ORDER_HISTORY_URL, status=200)
+
+        # WHEN
+        results = self.amazon_orders.get_orders([missing_order_id, order_id, missing_order_id], max_concurrency=1)
+
+        # THEN
+        self.assertEqual([missing_order_id, order_id], list(results))
+        self.assert_order_112_9685975_5907428_multiple_items_shipments_sellers(results[order_id], True)
+        self.assertIsInstance(results[missing_order_id], AmazonOrdersNotFoundError)
+        self.assertEqual(missing_order_id, results[missing_order_id].meta["order_id"])
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+
+    @responses.activate
+    def test_aget_orders(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        order_ids = ["112-9685975-5907428", "112-2961628-4757846"]
+        resp = self.given_any_order_details_exists("order-details-112-9685975-5907428.html")
+
+        # WHEN
+        results = asyncio.run(self.amazon_orders.aget_orders(order_ids))
+
+        # THEN
+        self.assertEqual(order_ids, list(results))
+        for order in results.values():
+            self.assertTrue(order.full_details)
+        self.assertEqual(2, resp.call_count)
+
+    def test_get_orders_invalid_max_concurrency(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError) as cm:
+            self.amazon_orders.get_orders(["112-9685975-5907428"], max_concurrency=0)
+
+        # THEN
+        self.assertEqual("max_concurrency must be greater than 0.", str(cm.exception))
+
     @responses.activate
     def test_get_order_invalid_page(self):
         # GIVEN
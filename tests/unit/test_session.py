@@ -1,14 +1,18 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
 import os
 import sys
+import threading
 import unittest
 from unittest.mock import patch
 
+import requests
 import responses
-from amazonorders.exception import AmazonOrdersAuthError
-from amazonorders.session import AmazonSession
+from amazonorders.exception import AmazonOrdersAuthError, AmazonOrdersAuthRedirectError
+from amazonorders.session import AmazonSession, AsyncAmazonSession, RateLimiter
+from amazonorders.util import ElementStream, ResponseClassifier, get_page_type
 from responses.matchers import query_string_matcher, urlencoded_params_matcher
 from tests.unittestcase import UnitTestCase
 
@@ -46,6 +50,352 @@ class TestSession(UnitTestCase):
         self.assertNotEqual(old_session, self.amazon_session.session)
         self.assertEqual(1, signout_response.call_count)
 
+    def test_executor_shared_and_closed(self):
+        # GIVEN
+        executor = self.amazon_session.executor
+
+        # THEN
+        self.assertIs(executor, self.amazon_session.executor)
+        self.assertEqual(self.test_config.thread_pool_size, executor._max_workers)
+
+        # WHEN
+        with self.amazon_session:
+            pass
+
+        # THEN
+        self.assertIsNone(self.amazon_session._executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+        self.assertIsNot(executor, self.amazon_session.executor)
+
+    def test_aclose_does_not_block_event_loop(self):
+        # GIVEN
+        amazon_session = AsyncAmazonSession("some-username", "some-password", config=self.test_config)
+        release = threading.Event()
+        job = amazon_session.executor.submit(release.wait, 5)
+
+        async def tick():
+            release.set()
+
+        async def close_while_ticking():
+            await asyncio.gather(amazon_session.aclose(), tick())
+
+        # WHEN
+        asyncio.run(close_while_ticking())
+
+        # THEN
+        self.assertTrue(job.result())
+        self.assertIsNone(amazon_session._executor)
+
+    def test_rate_limiter_burst_then_paced(self):
+        # GIVEN
+        rate_limiter = RateLimiter(10, 2)
+
+        # WHEN
+        delays = [rate_limiter.reserve() for _ in range(4)]
+
+        # THEN
+        self.assertEqual([0, 0], delays[:2])
+        self.assertAlmostEqual(0.1, delays[2], places=2)
+        self.assertAlmostEqual(0.2, delays[3], places=2)
+
+    def test_rate_limiter_disabled(self):
+        # GIVEN
+        rate_limiter = RateLimiter(0, 1)
+
+        # THEN
+        self.assertFalse(rate_limiter.enabled)
+        self.assertEqual([0] * 5, [rate_limiter.reserve() for _ in range(5)])
+
+    @responses.activate
+    def test_rate_limiter_backs_off_and_recovers(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.GET, url, status=503)
+        self.test_config.update_config("max_request_attempts", 1, save=False)
+        rate_limiter = RateLimiter(10, 20, self.test_config.constants.JS_ROBOT_TEXT_REGEX)
+        self.amazon_session.rate_limiter = rate_limiter
+
+        # WHEN
+        self.amazon_session.get(url)
+        self.amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(2, resp1.call_count)
+        self.assertEqual(2.5, rate_limiter.rate)
+        self.assertGreater(rate_limiter.reserve(), 0)
+
+        # GIVEN
+        responses.replace(responses.GET, url, status=200)
+
+        # WHEN
+        self.amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(3, rate_limiter.rate)
+
+        # WHEN
+        for _ in range(100):
+            rate_limiter.succeeded()
+
+        # THEN
+        self.assertEqual(10, rate_limiter.rate)
+
+    @responses.activate
+    def test_request_retried(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.GET, url, status=503, headers={"Retry-After": "0"})
+        resp2 = responses.add(responses.GET, url, body=requests.exceptions.ConnectionError("Connection reset"))
+        resp3 = responses.add(responses.GET, url, status=200)
+
+        # WHEN
+        response = self.amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(200, response.response.status_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, resp3.call_count)
+        self.assertEqual(
+            {
+                "requests": 3,
+                "retries": 2,
+                "retries_exhausted": 0,
+                "bytes_decoded": 0,
+                "bytes_decoded_per_second": 0,
+            },
+            self.amazon_session.stats,
+        )
+
+    @responses.activate
+    def test_request_retries_exhausted(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.GET, url, body=requests.exceptions.ConnectionError("Connection reset"))
+
+        # WHEN
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(3, resp1.call_count)
+        self.assertEqual(
+            {
+                "requests": 3,
+                "retries": 2,
+                "retries_exhausted": 1,
+                "bytes_decoded": 0,
+                "bytes_decoded_per_second": 0,
+            },
+            self.amazon_session.stats,
+        )
+
+    @responses.activate
+    def test_post_not_retried(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-form"
+        resp1 = responses.add(responses.POST, url, status=503)
+
+        # WHEN
+        response = self.amazon_session.post(url, data={"otpCode": "123456"})
+
+        # THEN
+        self.assertEqual(503, response.response.status_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(0, self.amazon_session.stats["retries"])
+
+    @responses.activate
+    def test_post_retried_opt_in(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.POST, url, status=503, headers={"Retry-After": "0"})
+        resp2 = responses.add(responses.POST, url, status=200)
+
+        # WHEN
+        response = self.amazon_session.post(url, retry=True)
+
+        # THEN
+        self.assertEqual(200, response.response.status_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(1, resp2.call_count)
+        self.assertEqual(1, self.amazon_session.stats["retries"])
+
+    @responses.activate
+    def test_request_not_retried(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        resp1 = responses.add(responses.GET, url, status=404)
+
+        # WHEN
+        response = self.amazon_session.get(url)
+
+        # THEN
+        self.assertEqual(404, response.response.status_code)
+        self.assertEqual(1, resp1.call_count)
+        self.assertEqual(
+            {
+                "requests": 1,
+                "retries": 0,
+                "retries_exhausted": 0,
+                "bytes_decoded": 0,
+                "bytes_decoded_per_second": 0,
+            },
+            self.amazon_session.stats,
+        )
+
+    @responses.activate
+    def test_request_charset(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        body = "<html><head><meta charset='windows-1252'></head><body><p>Caf\u00e9</p></body></html>"
+        responses.add(responses.GET, url, body=body.encode("windows-1252"), content_type="text/html")
+
+        # WHEN
+        response = self.amazon_session.get(url)
+
+        # THEN
+        self.assertEqual("cp1252", response.encoding)
+        self.assertEqual("Caf\u00e9", response.parsed.select_one("p").text)
+        self.assertEqual(body, response.response.text)
+        self.assertEqual(len(body), self.amazon_session.stats["bytes_decoded"])
+        self.assertGreater(self.amazon_session.stats["bytes_decoded_per_second"], 0)
+
+    @responses.activate
+    def test_request_parse_only(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        responses.add(
+            responses.GET,
+            url,
+            body="<html><body><nav>Nav</nav><div id='orderDetails'>Details</div><footer>Footer</footer></body></html>",
+        )
+
+        # WHEN
+        response = self.amazon_session.get(url, parse_only=self.test_config.selectors.ORDER_DETAILS_PAGE_SELECTOR)
+
+        # THEN
+        self.assertEqual('<div id="orderDetails">Details</div>', str(response.parsed))
+
+        # GIVEN
+        self.test_config.update_config("partial_parse", False, save=False)
+
+        # WHEN
+        response = self.amazon_session.get(url, parse_only=self.test_config.selectors.ORDER_DETAILS_PAGE_SELECTOR)
+
+        # THEN
+        self.assertIsNotNone(response.parsed.select_one("nav"))
+
+    @responses.activate
+    def test_request_element_stream(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        body = "<html><body><div class='order-card'>A</div><div class='order-card'>B</div><nav>Nav</nav></body></html>"
+        responses.add(responses.GET, url, body=body)
+        elements = []
+
+        # WHEN
+        response = self.amazon_session.get(url, element_stream=ElementStream(["div.order-card"], elements.append))
+
+        # THEN
+        self.assertEqual(["A", "B"], [element.text for element in elements])
+        self.assertEqual(elements, response.elements)
+        self.assertIsNone(response.parsed.select_one("div.order-card"))
+        self.assertIsNotNone(response.parsed.select_one("nav"))
+        self.assertEqual("/some-page", get_page_type(elements[0]))
+        self.assertEqual(body, response.response.text)
+
+    @responses.activate
+    def test_request_element_stream_not_ok(self):
+        # GIVEN
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        responses.add(responses.GET, url, body="<div class='order-card'>A</div>", status=404)
+        elements = []
+
+        # WHEN
+        response = self.amazon_session.get(url, element_stream=ElementStream(["div.order-card"], elements.append))
+
+        # THEN
+        self.assertEqual([], elements)
+        self.assertIsNone(response.elements)
+        self.assertIsNotNone(response.parsed.select_one("div.order-card"))
+
+    @responses.activate
+    def test_request_parse_only_keeps_sign_in_form(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        responses.add(
+            responses.GET,
+            url,
+            body="<html><body><nav>Nav</nav><form name='signIn'><input name='email'></form></body></html>",
+        )
+        self.given_logout_response_success()
+
+        # WHEN
+        response = self.amazon_session.get(url, parse_only=self.test_config.selectors.ORDER_DETAILS_PAGE_SELECTOR)
+        with self.assertRaises(AmazonOrdersAuthRedirectError):
+            self.amazon_session.check_response(response)
+
+        # THEN
+        self.assertIsNone(response.parsed.select_one("nav"))
+        self.assertFalse(self.amazon_session.is_authenticated)
+
+    @responses.activate
+    def test_request_sign_in_redirect_not_parsed(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        url = f"{self.test_config.constants.BASE_URL}/some-page"
+        with open(os.path.join(self.RESOURCES_DIR, "auth", "signin.html"), encoding="utf-8") as f:
+            responses.add(responses.GET, url, body=f.read())
+        self.given_logout_response_success()
+
+        # WHEN
+        response = self.amazon_session.get(url)
+        with self.assertRaises(AmazonOrdersAuthRedirectError):
+            self.amazon_session.check_response(response)
+
+        # THEN
+        self.assertEqual(ResponseClassifier.SIGN_IN_REDIRECT, response.response_type)
+        self.assertFalse(response.is_parsed)
+        self.assertFalse(self.amazon_session.is_authenticated)
+
+        # WHEN
+        parsed = response.parsed
+
+        # THEN
+        self.assertIsNotNone(parsed.select_one(self.test_config.selectors.SIGN_IN_FORM_SELECTOR))
+        self.assertTrue(response.is_parsed)
+
+    @responses.activate
+    def test_check_response_captcha_at_sign_in_url(self):
+        # GIVEN
+        self.amazon_session.is_authenticated = True
+        with open(os.path.join(self.RESOURCES_DIR, "auth", "post-signin-captcha-1.html"), encoding="utf-8") as f:
+            responses.add(responses.GET, self.test_config.constants.SIGN_IN_URL, body=f.read())
+        self.given_logout_response_success()
+        response = self.amazon_session.get(self.test_config.constants.SIGN_IN_URL)
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersAuthRedirectError):
+            self.amazon_session.check_response(response)
+
+        # THEN
+        self.assertEqual(ResponseClassifier.CAPTCHA, response.response_type)
+        self.assertFalse(self.amazon_session.is_authenticated)
+
+    def test_get_retry_after(self):
+        # GIVEN
+        response = requests.Response()
+        response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+        # WHEN
+        retry_after = self.amazon_session._get_retry_after(response)
+
+        # THEN
+        # A date in the past means retry now
+        self.assertEqual(0, retry_after)
+
     @responses.activate
     def test_login_invalid_username(self):
         # GIVEN
@@ -204,6 +554,7 @@ class TestSession(UnitTestCase):
         # THEN
         self.assertFalse(self.amazon_session.is_authenticated)
         self.assertEqual(1, resp1.call_count)
+        # The sign-in form submit isn't safe to repeat, so a 503 isn't retried
         self.assertEqual(1, resp2.call_count)
         self.assertIn(
             "The page https://www.amazon.com/ap/signin returned 503. Amazon had an issue on "
@@ -540,6 +891,7 @@ class TestSession(UnitTestCase):
     @responses.activate
     def test_js_waf_login_blocker(self):
         # GIVEN
+        self.amazon_session.rate_limiter = RateLimiter(10, 20, self.test_config.constants.JS_ROBOT_TEXT_REGEX)
         with open(os.path.join(self.RESOURCES_DIR, "auth", "signin.html"), encoding="utf-8") as f:
             resp1 = responses.add(
                 responses.GET,
@@ -564,3 +916,5 @@ class TestSession(UnitTestCase):
         self.assertIn("A JavaScript-based authentication challenge page has been found.", str(cm.exception))
         self.assertEqual(1, resp1.call_count)
         self.assertEqual(1, resp2.call_count)
+        # The challenge page also backs off the rate limiter
+        self.assertEqual(5, self.amazon_session.rate_limiter.rate)
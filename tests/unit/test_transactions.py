@@ -1,15 +1,17 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
+import asyncio
 import datetime
 import os
 from unittest.mock import patch
 
 import responses
+import respx
+from amazonorders import util
 from amazonorders.exception import AmazonOrdersAuthRedirectError, AmazonOrdersError
-from amazonorders.session import AmazonSession
+from amazonorders.session import AmazonSession, AsyncAmazonSession
 from amazonorders.transactions import AmazonTransactions, _parse_transaction_form_tag
-from bs4 import BeautifulSoup
 from tests.unittestcase import UnitTestCase
 
 
@@ -78,6 +80,32 @@ class TestTransactions(UnitTestCase):
         self.assertEqual(transaction.seller, "AMZN Mktp CA")
         self.assertEqual(1, resp.call_count)
 
+    @respx.mock
+    @patch("amazonorders.transactions.datetime", wraps=datetime)
+    def test_aget_transactions_async_session(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2024, 10, 11)
+        amazon_session = AsyncAmazonSession("some-username", "some-password", config=self.test_config)
+        amazon_session.is_authenticated = True
+        amazon_transactions = AmazonTransactions(amazon_session)
+        with open(
+            os.path.join(self.RESOURCES_DIR, "transactions", "get-transactions-snippet.html"), encoding="utf-8"
+        ) as f:
+            resp = respx.post(self.test_config.constants.TRANSACTION_HISTORY_URL).respond(200, text=f.read())
+
+        async def get_transactions():
+            async with amazon_session:
+                return await amazon_transactions.aget_transactions(days=1, keep_paging=False)
+
+        # WHEN
+        transactions = asyncio.run(get_transactions())
+
+        # THEN
+        self.assertEqual(1, len(transactions))
+        self.assertEqual(transactions[0].order_number, "123-4567890-1234567")
+        self.assertEqual(transactions[0].grand_total, -45.19)
+        self.assertEqual(1, resp.call_count)
+
     @responses.activate
     def test_get_transactions_errors_with_meta(self):
         # GIVEN
@@ -94,7 +122,7 @@ class TestTransactions(UnitTestCase):
             self.amazon_transactions.get_transactions(next_page_data=next_page_data, keep_paging=False)
 
         # THEN
-        self.assertEqual(1, resp.call_count)
+        self.assertEqual(self.test_config.max_request_attempts, resp.call_count)
         self.assertEqual(cm.exception.meta, next_page_data)
 
     @responses.activate
@@ -185,6 +213,52 @@ class TestTransactions(UnitTestCase):
         self.assertEqual(1, resp1.call_count)
         self.assertEqual(1, resp2.call_count)
 
+    @responses.activate
+    @patch("amazonorders.transactions.datetime", wraps=datetime)
+    def test_get_transactions_checkpoint_resumes(self, mock_today):
+        # GIVEN
+        mock_today.date.today.return_value = datetime.date(2025, 5, 27)
+        self.amazon_session.is_authenticated = True
+        checkpoint_path = os.path.join(self.test_output_dir, "transactions.checkpoint")
+        with open(
+            os.path.join(self.RESOURCES_DIR, "transactions", "transactions-with-next-page.html"), encoding="utf-8"
+        ) as f:
+            resp1 = responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+        responses.add(responses.POST, f"{self.test_config.constants.TRANSACTION_HISTORY_URL}", status=503)
+
+        # WHEN
+        with self.assertRaises(AmazonOrdersError):
+            self.amazon_transactions.get_transactions(checkpoint=checkpoint_path)
+
+        # THEN
+        self.assertEqual(1, resp1.call_count)
+        self.assertTrue(os.path.exists(checkpoint_path))
+
+        # GIVEN
+        responses.reset()
+        with open(
+            os.path.join(self.RESOURCES_DIR, "transactions", "transactions-in-progress.html"), encoding="utf-8"
+        ) as f:
+            resp2 = responses.add(
+                responses.POST,
+                f"{self.test_config.constants.TRANSACTION_HISTORY_URL}",
+                body=f.read(),
+                status=200,
+            )
+
+        # WHEN
+        transactions = self.amazon_transactions.get_transactions(checkpoint=checkpoint_path)
+
+        # THEN
+        self.assertEqual(40, len(transactions))
+        self.assertEqual(1, resp2.call_count)
+        self.assertFalse(os.path.exists(checkpoint_path))
+
     @responses.activate
     @patch("amazonorders.transactions.datetime", wraps=datetime)
     def test_get_transactions_with_pending(self, mock_today):
@@ -278,7 +352,7 @@ class TestTransactions(UnitTestCase):
     def test_parse_transaction_form_tag(self):
         # GIVEN
         with open(os.path.join(self.RESOURCES_DIR, "transactions", "transaction-form-tag.html"), encoding="utf-8") as f:
-            parsed = BeautifulSoup(f.read(), self.test_config.bs4_parser)
+            parsed = util.parse_html(f.read(), self.test_config.bs4_parser)
             form_tag = parsed.select_one("form")
 
         # WHEN
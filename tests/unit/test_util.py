@@ -1,7 +1,26 @@
 __copyright__ = "Copyright (c) 2024-2025 Alex Laird"
 __license__ = "MIT"
 
-from amazonorders.util import cleanup_html_text, to_type
+import os
+
+from amazonorders.selectors import Selector
+from amazonorders.util import (
+    ElementStream,
+    ResponseClassifier,
+    SelectorList,
+    SelectorStats,
+    cleanup_html_text,
+    compile_selector,
+    extract,
+    get_charset,
+    get_page_type,
+    parse_html,
+    resolve_bs4_parser,
+    select,
+    select_one,
+    to_type,
+)
+from requests import Response
 from tests.unittestcase import UnitTestCase
 
 
@@ -64,3 +83,235 @@ class TestUtil(UnitTestCase):
             ),
             "This has leading newlines. They should be removed.",
         )
+
+    def test_resolve_bs4_parser(self):
+        self.assertEqual("lxml", resolve_bs4_parser("auto"))
+        self.assertEqual("html.parser", resolve_bs4_parser("html.parser"))
+
+    def test_parse_html(self):
+        # WHEN
+        parsed = parse_html("<div><span class='a'>Text</span></div>", "auto")
+
+        # THEN
+        self.assertEqual("Text", parsed.select_one("span.a").text)
+
+    def test_compile_selector_cached(self):
+        self.assertIs(compile_selector("div.order-card"), compile_selector("div.order-card"))
+
+    def test_select_text_selector(self):
+        # GIVEN
+        parsed = parse_html("<div><span class='a'>Match</span><span class='a'>Other</span></div>", "auto")
+
+        # WHEN
+        tags = select(parsed, Selector("span.a", "Match"))
+
+        # THEN
+        self.assertEqual(["Match"], [tag.text for tag in tags])
+
+    def test_get_page_type(self):
+        # GIVEN
+        parsed = parse_html("<div><span>Text</span></div>", "auto", page_type="/your-orders/orders")
+
+        # WHEN
+        page_type = get_page_type(parsed.select_one("span"))
+
+        # THEN
+        self.assertEqual("/your-orders/orders", page_type)
+        self.assertEqual("unknown", get_page_type(parse_html("<div></div>", "auto")))
+
+    def test_selector_list_records_stats(self):
+        # GIVEN
+        stats = SelectorStats()
+        selector = SelectorList("FIELD", ["span.a", "span.b"], stats, adaptive=False)
+        parsed = parse_html("<div><span class='b'>B</span></div>", "auto", page_type="/orders")
+
+        # WHEN
+        tag = select_one(parsed, selector)
+        select(parsed, selector)
+        select_one(parse_html("<div></div>", "auto", page_type="/orders"), selector)
+
+        # THEN
+        self.assertEqual("B", tag.text)
+        self.assertEqual({"FIELD": {"/orders": {"hits": {"span.a": 0, "span.b": 2}, "misses": 1}}},
+                         stats.get_stats())
+
+        # WHEN
+        stats.reset()
+
+        # THEN
+        self.assertEqual({}, stats.get_stats())
+
+    def test_selector_list_adaptive(self):
+        # GIVEN
+        stats = SelectorStats()
+        selector = SelectorList("FIELD", ["span.a", "span.b"], stats, adaptive=True)
+        parsed = parse_html("<div><span class='a'>A</span><span class='b'>B</span></div>", "auto",
+                            page_type="/orders")
+        stats.record("FIELD", "/orders", selector, 1)
+
+        # WHEN
+        tag = select_one(parsed, selector)
+        other_page_tag = select_one(parse_html(str(parsed), "auto", page_type="/order-details"), selector)
+
+        # THEN
+        self.assertEqual("B", tag.text)
+        self.assertEqual("A", other_page_tag.text)
+        self.assertEqual({"span.a": 0, "span.b": 2}, stats.get_stats()["FIELD"]["/orders"]["hits"])
+
+    def test_extract(self):
+        # GIVEN
+        parsed = parse_html("""<div id='main'>
+    <span class='a' data-x='1'>A1</span>
+    <div class='b'><span class='A'>A2</span><a href='/'>Link</a></div>
+    <p>P</p>
+</div>""", "auto")
+        css_selectors = ["span.a", "#main .b a", "[data-x]", "div > span", ":not(span)", "p, span.a"]
+
+        # WHEN
+        extracted = extract(parsed, css_selectors)
+
+        # THEN
+        for css_selector in css_selectors:
+            self.assertEqual([id(t) for t in parsed.select(css_selector)], [id(t) for t in extracted[css_selector]])
+
+    def test_select_extracted(self):
+        # GIVEN
+        parsed = parse_html("<div><span class='a'>Match</span><span class='b'>Other</span></div>", "auto")
+        extracted = {"span.a": [], "span.b": parsed.select("span.b")}
+
+        # WHEN
+        tag = select_one(parsed, ["span.a", "span.b"], extracted)
+        tags = select(parsed, Selector("span.b", "Other"), extracted)
+
+        # THEN
+        self.assertEqual("Other", tag.text)
+        self.assertEqual(["Other"], [t.text for t in tags])
+
+    def test_parse_html_parse_only(self):
+        # GIVEN
+        html = "<html><head><script>var x;</script></head><body><div class='a b'>A</div><p id='c'>C</p></body></html>"
+
+        # WHEN
+        parsed = parse_html(html, "auto", parse_only=["div.b", "p#c"])
+        unmatched_parsed = parse_html(html, "auto", parse_only=["div#missing"])
+
+        # THEN
+        self.assertEqual('<div class="a b">A</div><p id="c">C</p>', str(parsed))
+        self.assertIsNotNone(unmatched_parsed.select_one("script"))
+
+    def test_element_stream(self):
+        # GIVEN
+        html = (
+            "<html><body><div id='orders'><div class='order-card'><div>A</div><div>1</div></div>\n"
+            "<div class='order-card' data-x>\n<div>B</div></div></div><p>Footer</p></body></html>"
+        )
+        elements = []
+        element_stream = ElementStream(["div.order-card", "div.order"], elements.append)
+
+        # WHEN
+        element_stream.feed(html[:html.index("\n")])
+
+        # THEN
+        self.assertEqual(["A1"], [element.text for element in elements])
+
+        # WHEN
+        element_stream.feed(html[html.index("\n"):])
+        element_stream.close()
+
+        # THEN
+        self.assertEqual(["A1", "\nB"], [element.text for element in elements])
+        self.assertEqual(elements, element_stream.elements)
+        self.assertEqual(
+            "<html><body><div id='orders'>\n</div><p>Footer</p></body></html>", element_stream.remainder
+        )
+
+    def test_element_stream_order_history(self):
+        # GIVEN
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2020-40.html"), encoding="utf-8") as f:
+            html = f.read()
+        selector = self.test_config.selectors.ORDER_HISTORY_ENTITY_SELECTOR
+        element_stream = ElementStream(selector)
+
+        # WHEN
+        for i in range(0, len(html), 4096):
+            element_stream.feed(html[i:i + 4096])
+        element_stream.close()
+
+        # THEN
+        order_tags = select(parse_html(html, "html.parser"), selector)
+        self.assertEqual(10, len(element_stream.elements))
+        self.assertEqual([str(t) for t in order_tags], [str(t) for t in element_stream.elements])
+        self.assertEqual([], select(parse_html(element_stream.remainder, "html.parser"), selector))
+
+    def test_get_charset(self):
+        # GIVEN
+        response = Response()
+        response._content = "<html><head><meta charset=\"ISO-8859-1\"></head></html>".encode("latin-1")
+
+        # WHEN
+        response.headers["Content-Type"] = "text/html; charset=UTF-8"
+        declared_charset = get_charset(response)
+        response.headers["Content-Type"] = "text/html"
+        meta_charset = get_charset(response)
+        streamed_charset = get_charset(response, head=b"<html>")
+        response.headers["Content-Type"] = "text/html; charset=unknown"
+        unknown_charset = get_charset(response, head=b"")
+
+        # THEN
+        self.assertEqual("utf-8", declared_charset)
+        self.assertEqual("iso8859-1", meta_charset)
+        self.assertEqual("utf-8", streamed_charset)
+        self.assertEqual("utf-8", unknown_charset)
+
+    def test_response_classifier(self):
+        # GIVEN
+        classifier = ResponseClassifier(self.test_config.constants)
+        order_history_url = self.test_config.constants.ORDER_HISTORY_URL
+        sign_in_url = self.test_config.constants.SIGN_IN_URL
+
+        def given_response(resource, url, status_code=200):
+            response = Response()
+            response.status_code = status_code
+            response.url = url
+            response._content = b""
+            if resource:
+                with open(os.path.join(self.RESOURCES_DIR, resource), "rb") as f:
+                    response._content = f.read()
+            return response
+
+        # WHEN
+        response_types = [
+            classifier.classify(given_response("orders/order-history-2020-40.html", order_history_url)),
+            classifier.classify(given_response("auth/signin.html", sign_in_url)),
+            classifier.classify(given_response(None, sign_in_url)),
+            classifier.classify(given_response("auth/signin.html", order_history_url)),
+            classifier.classify(given_response("auth/post-signin-captcha-1.html", sign_in_url)),
+            classifier.classify(given_response("auth/post-signin-captcha-2.html", sign_in_url)),
+            classifier.classify(given_response("auth/post-signin-mfa.html", sign_in_url)),
+            classifier.classify(given_response("auth/post-signin-new-otp.html", sign_in_url)),
+            classifier.classify(given_response("auth/post-signin-captcha-otp.html", sign_in_url)),
+            classifier.classify(given_response("auth/post-signin-js-bot-challenge.html", sign_in_url)),
+            classifier.classify(given_response("auth/post-signin-js-bot-challenge.html", order_history_url, 503)),
+            classifier.classify(given_response(None, order_history_url, 503)),
+            classifier.classify(given_response(None, order_history_url, 404)),
+        ]
+
+        # THEN
+        self.assertEqual(
+            [
+                ResponseClassifier.OK,
+                ResponseClassifier.SIGN_IN_REDIRECT,
+                ResponseClassifier.SIGN_IN_REDIRECT,
+                ResponseClassifier.SIGN_IN_REDIRECT,
+                ResponseClassifier.CAPTCHA,
+                ResponseClassifier.CAPTCHA,
+                ResponseClassifier.MFA,
+                ResponseClassifier.MFA,
+                ResponseClassifier.MFA,
+                ResponseClassifier.BOT_CHALLENGE,
+                ResponseClassifier.BOT_CHALLENGE,
+                ResponseClassifier.SERVER_ERROR,
+                ResponseClassifier.ERROR,
+            ],
+            response_types,
+        )
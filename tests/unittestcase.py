@@ -32,6 +32,8 @@ class UnitTestCase(TestCase):
                 "cookie_jar_path": self.test_cookie_jar_path,
                 "auth_reattempt_wait": 0,
                 "max_auth_retries": 0,
+                "requests_per_second": 0,
+                "retry_backoff_base": 0,
             }
         )
 
@@ -120,6 +122,29 @@ class UnitTestCase(TestCase):
                 status=200,
             )
 
+    def given_order_history_zero_orders(self, year):
+        with open(
+            os.path.join(self.RESOURCES_DIR, "orders", "order-history-2023-zero-orders.html"), encoding="utf-8"
+        ) as f:
+            return responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-{year}",
+                body=f.read(),
+                status=200,
+            )
+
+    def given_order_history_2010_paginated(self):
+        resp1 = self.given_order_history_exists(2010, start_index=0)
+        with open(os.path.join(self.RESOURCES_DIR, "orders", "order-history-2010-10.html"), encoding="utf-8") as f:
+            resp2 = responses.add(
+                responses.GET,
+                f"{self.test_config.constants.ORDER_HISTORY_URL}?timeFilter=year-2010"
+                "&startIndex=10&ref_=ppx_yo2ov_dt_b_pagination_1_2",
+                body=f.read(),
+                status=200,
+            )
+        return resp1, resp2
+
     def given_any_order_history_exists(self, order_history_html_file):
         with open(os.path.join(self.RESOURCES_DIR, "orders", order_history_html_file), encoding="utf-8") as f:
             return responses.add(